@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+字段解析吞吐量基准测试
+对比逐条正则解析与列式向量化解析的速度
+"""
+
+import os
+import sys
+import time
+import argparse
+
+# 添加项目根目录到Python路径
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from src.data.data_processor import DataProcessor
+from src.data.column_parser import parse_divided_column, parse_percentage_column, parse_score_column
+
+# (字段名, 逐条解析函数名, 列式解析函数)
+FIELDS = [
+    ("赛果", "parse_score", parse_score_column),
+    ("射门", "parse_divided_values", parse_divided_column),
+    ("射正", "parse_divided_values", parse_divided_column),
+    ("控球率", "parse_percentage", parse_percentage_column),
+    ("传球成功率", "parse_percentage", parse_percentage_column),
+    ("犯规", "parse_divided_values", parse_divided_column),
+    ("黄牌", "parse_divided_values", parse_divided_column),
+    ("角球", "parse_divided_values", parse_divided_column),
+    ("红牌", "parse_divided_values", parse_divided_column),
+]
+
+
+def load_raw_records(data_dirs):
+    """读取所有原始比赛记录"""
+    processor = DataProcessor()
+    records = []
+    for data_dir in data_dirs:
+        for json_file in processor.list_json_files(data_dir):
+            records.extend(r for r in processor.load_json_file(str(json_file)) if r)
+    return records
+
+
+def time_call(func, repeat):
+    """多次运行取最快耗时"""
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='字段解析吞吐量基准测试')
+    parser.add_argument('--scale', type=int, default=20, help='原始数据复制倍数')
+    parser.add_argument('--repeat', type=int, default=3, help='重复次数')
+    args = parser.parse_args()
+    
+    data_dirs = [
+        os.path.join(project_root, 'data', 'raw', '2021'),
+        os.path.join(project_root, 'data', 'raw', '2023')
+    ]
+    records = load_raw_records(data_dirs) * args.scale
+    processor = DataProcessor()
+    
+    print(f"=== 字段解析基准测试（{len(records)} 条记录）===")
+    
+    # 仅字段解析阶段
+    columns = [(name, [r.get(name, "") or "" for r in records], getattr(processor, scalar_name), batch)
+               for name, scalar_name, batch in FIELDS]
+    
+    def scalar_fields():
+        return [[scalar(v) for v in values] for _, values, scalar, _ in columns]
+    
+    def batch_fields():
+        return [batch(values, scalar) for _, values, scalar, batch in columns]
+    
+    scalar_time, _ = time_call(scalar_fields, args.repeat)
+    batch_time, _ = time_call(batch_fields, args.repeat)
+    print("\n[字段解析]")
+    print(f"逐条正则: {scalar_time:.3f}s  ({len(records) / scalar_time:,.0f} 条/秒)")
+    print(f"列式解析: {batch_time:.3f}s  ({len(records) / batch_time:,.0f} 条/秒)")
+    print(f"加速比: {scalar_time / batch_time:.2f}x")
+    
+    # 端到端：原始字典 -> MatchData
+    def per_record():
+        return [processor.convert_raw_to_structured(processor.process_single_match(r)) for r in records]
+    
+    scalar_time, scalar_result = time_call(per_record, args.repeat)
+    batch_time, batch_result = time_call(lambda: processor.decode_records(records), args.repeat)
+    
+    print("\n[端到端解码]")
+    print(f"逐条解析: {scalar_time:.3f}s  ({len(records) / scalar_time:,.0f} 条/秒)")
+    print(f"列式解析: {batch_time:.3f}s  ({len(records) / batch_time:,.0f} 条/秒)")
+    print(f"加速比: {scalar_time / batch_time:.2f}x")
+    print(f"结果一致: {'✓' if scalar_result == batch_result else '✗'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -8,43 +8,57 @@ import os
 import sys
 import argparse
 
-# 添加src目录到Python路径
-project_root = os.path.dirname(os.path.abspath(__file__))
-sys.path.insert(0, os.path.join(project_root, 'src'))
+# 添加项目根目录到Python路径（脚本位于scripts/下）
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
 
-from src.main import FootballAnalysisSystem
+from src.main import FootballAnalysisSystem, configure_model_files
 
 def main():
     parser = argparse.ArgumentParser(description='足球比赛预测系统')
     parser.add_argument('--home-team', required=True, help='主队名称')
     parser.add_argument('--away-team', required=True, help='客队名称')
     parser.add_argument('--league', default='中超', help='联赛名称')
+    parser.add_argument('--data-dirs', nargs='+',
+                       default=[os.path.join(project_root, 'data', 'raw', year) for year in ('2021', '2023')],
+                       help='原始数据目录')
     parser.add_argument('--data-dir', default=os.path.join(project_root, 'data', 'processed'),
                        help='处理后的数据目录')
+    parser.add_argument('--baselines-file', default=None,
+                       help='联赛系数文件（如调参得到的tuned_baselines.json，默认使用配置）')
+    parser.add_argument('--data-config', default=None,
+                       help='调参得到的全局参数文件（*_data_config.json）')
     
     args = parser.parse_args()
+    configure_model_files(args.baselines_file, args.data_config)
     
-    # 初始化系统
-    system = FootballAnalysisSystem(data_dirs=[args.data-dir])
+    # 初始化系统（原始数据未变化时直接加载列式存储）
+    os.makedirs(args.data_dir, exist_ok=True)
+    system = FootballAnalysisSystem(data_dirs=args.data_dirs,
+                                    store_dir=os.path.join(args.data_dir, 'match_store'))
     
     try:
         print(f"=== 预测 {args.home_team} vs {args.away_team} ({args.league}) ===")
         
         # 加载数据和初始化预测器
-        system.load_and_process_data(output_file=os.path.join(args.data-dir, 'processed_training_data.csv'))
+        system.load_and_process_data(output_file=os.path.join(args.data_dir, 'processed_training_data.csv'))
         system.initialize_predictor(args.league)
         
         # 进行预测
         result = system.predict_single_match(args.home_team, args.away_team, args.league)
+        probabilities = system.predictor.predict_probabilities([result])[0]
         
         print("\n" + "="*60)
         print(f"比赛预测结果: {args.home_team} vs {args.away_team}")
         print("="*60)
-        print(f"预测比分: {result.prediction.home_team_goals:.1f} - {result.prediction.away_team_goals:.1f}")
-        print(f"总进球数: {result.prediction.total_goals:.1f}")
-        print(f"角球预测: {result.prediction.home_corners:.1f} - {result.prediction.away_corners:.1f}")
-        print(f"黄牌预测: {result.prediction.home_yellow_cards:.1f} - {result.prediction.away_yellow_cards:.1f}")
-        print(f"胜率: 主队 {result.prediction.home_win_probability:.1%}, 客队 {result.prediction.away_win_probability:.1%}")
+        print(f"预测比分: {result.home_team_goals:.1f} - {result.away_team_goals:.1f}")
+        print(f"总进球数: {result.total_goals:.1f}")
+        print(f"角球预测: {result.home_corners:.1f} - {result.away_corners:.1f}")
+        print(f"黄牌预测: {result.home_yellow_cards:.1f} - {result.away_yellow_cards:.1f}")
+        print(f"胜率: 主队 {probabilities.home_win_probability:.1%}, 平局 {probabilities.draw_probability:.1%}, "
+              f"客队 {probabilities.away_win_probability:.1%}")
+        print(f"大于{probabilities.total_goals_line}球: {probabilities.over_probability:.1%}, "
+              f"两队都进球: {probabilities.both_teams_score_probability:.1%}")
         print("="*60)
         
     except Exception as e:
@@ -8,42 +8,57 @@ import os
 import sys
 import argparse
 
-# 添加src目录到Python路径
-project_root = os.path.dirname(os.path.abspath(__file__))
-sys.path.insert(0, os.path.join(project_root, 'src'))
+# 添加项目根目录到Python路径（脚本位于scripts/下）
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
 
 from src.main import FootballAnalysisSystem
+from src.predictors.coefficient_table import default_baselines_file
 
 def main():
     parser = argparse.ArgumentParser(description='足球数据分析模型训练')
-    parser.add_argument('--data-dir', default=os.path.join(project_root, 'data', 'processed'),
-                       help='处理后的数据目录')
-    parser.add_argument('--output-dir', default=os.path.join(project_root, 'models'),
-                       help='模型输出目录')
+    parser.add_argument('--data-dirs', nargs='+',
+                       default=[os.path.join(project_root, 'data', 'raw', year) for year in ('2021', '2023')],
+                       help='原始数据目录')
+    parser.add_argument('--output-dir', default=None,
+                       help='模型输出目录（默认处理后的数据保存到models/，基线参数写入预测器默认加载的基线文件）')
     parser.add_argument('--mode', choices=['train', 'evaluate'], default='train',
                        help='运行模式')
+    parser.add_argument('--cv-workers', type=int, default=None,
+                       help='并行运行交叉验证各折的进程数（<=0表示使用全部CPU核心，默认使用配置）')
+    parser.add_argument('--seed', type=int, default=None, help='交叉验证或自助法的随机种子')
+    parser.add_argument('--bootstrap-resamples', type=int, default=None,
+                       help='计算联赛系数置信区间的自助法重抽样次数（0表示不计算，默认使用配置）')
     
     args = parser.parse_args()
     
-    # 创建输出目录
-    os.makedirs(args.output_dir, exist_ok=True)
+    # 创建输出目录（未指定时基线参数写入预测器默认加载的文件，训练结果可直接热加载）
+    output_dir = args.output_dir or os.path.join(project_root, 'models')
+    os.makedirs(output_dir, exist_ok=True)
+    baselines_file = os.path.join(args.output_dir, 'trained_baselines.json') if args.output_dir else None
     
     # 初始化系统
-    system = FootballAnalysisSystem(data_dirs=[args.data-dir])
+    system = FootballAnalysisSystem(data_dirs=args.data_dirs)
     
     if args.mode == 'train':
         print("=== 开始训练模型 ===")
-        system.load_and_process_data(output_file=os.path.join(args.output_dir, 'processed_training_data.csv'))
-        system.train_baselines(output_file=os.path.join(args.output_dir, 'trained_baselines.json'))
+        system.load_and_process_data(output_file=os.path.join(output_dir, 'processed_training_data.csv'))
+        system.train_baselines(output_file=baselines_file,
+                               bootstrap_resamples=args.bootstrap_resamples, seed=args.seed)
         print("✅ 训练完成！")
+        if baselines_file:
+            print(f"基线参数保存在 {baselines_file}，预测时需通过 --baselines-file 或环境变量 "
+                  f"FOOTBALL_BASELINES_FILE 指定该文件才会加载")
+        else:
+            print(f"基线参数已写入 {default_baselines_file()}，预测器会自动加载")
         
     elif args.mode == 'evaluate':
         print("=== 开始评估模型 ===")
-        system.load_and_process_data(output_file=os.path.join(args.output_dir, 'processed_training_data.csv'))
-        metrics = system.cross_validation_evaluation(k_folds=5)
+        system.load_and_process_data(output_file=os.path.join(output_dir, 'processed_training_data.csv'))
+        metrics = system.cross_validation_evaluation(k_folds=5, workers=args.cv_workers, seed=args.seed)
         print(f"✅ 评估完成，平均MAE: {metrics['avg_MAE_goals']:.3f}")
     
-    print(f"模型文件已保存到: {args.output_dir}")
+    print(f"模型文件已保存到: {output_dir}")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -58,5 +58,23 @@ DATA_CONFIG = {
     "min_matches_required": 3,     # 计算统计值所需的最少比赛场数
     "goal_limits": (0.0, 5.0),     # 进球数预测的合理范围
     "corner_limits": (0.0, 20.0),  # 角球数预测的合理范围
-    "yellow_card_limits": (0.0, 10.0)  # 黄牌数预测的合理范围
+    "yellow_card_limits": (0.0, 10.0),  # 黄牌数预测的合理范围
+    "ingest_workers": 1,           # 解析原始数据的并行进程数（<=0表示使用全部CPU核心）
+    "cv_workers": 1,               # 交叉验证的并行进程数（<=0表示使用全部CPU核心）
+    "tune_workers": 0,             # 超参数搜索的并行进程数（<=0表示使用全部CPU核心）
+    "stream_chunk_size": 1000,     # 流式处理时每块的比赛数
+    "dedupe_policy": "latest",     # 重复match_id的保留策略：latest/first/complete
+    "team_stats_cache_size": 1024, # 球队统计LRU缓存的最大条目数
+    "scoreline_max_goals": 10,     # 比分概率矩阵中单队进球数的上限（截断）
+    "scoreline_covariance": 0.1,   # 双变量泊松分布中两队进球的协方差项
+    "total_goals_line": 2.5,       # 大小球概率的默认盘口
+    "stats_mode": "window",        # 球队统计方式：window 最近N场均值，ewma 指数加权移动平均
+    "form_half_life": 5.0,         # 指数加权移动平均的半衰期（场数）
+    "match_minutes": 90,           # 常规比赛时长（分钟），滚球预测按剩余时间比例修正
+    "in_play_min_snapshots": 30,   # 拟合滚球时间曲线某个时间点所需的最少历史快照数
+    "in_play_holdout": 0.3,        # 验证滚球预测时按开球时间留出的最近比赛比例（模型只用更早的比赛拟合）
+    "bootstrap_resamples": 10000,  # 训练联赛系数时自助法置信区间的重抽样次数（0表示不计算）
+    "bootstrap_confidence": 0.95,  # 联赛系数置信区间的置信水平
+    "baselines_file": "trained_baselines.json",  # 训练得到的基线参数文件（存在时优先于上面的联赛系数）
+    "baselines_check_interval": 1.0  # 检查基线参数文件是否变化的最小间隔（秒）
 }
\ No newline at end of file
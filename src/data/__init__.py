@@ -4,6 +4,10 @@
 数据处理模块初始化文件
 """
 
-from .data_processor import DataProcessor, process_football_data
+from .data_processor import (DataProcessor, process_football_data, load_football_data, load_odds_data,
+                             iter_matches)
+from .match_store import save_match_store, load_match_store
+from .odds_store import OddsStore, save_odds_store, load_odds_store
 
-__all__ = ['DataProcessor', 'process_football_data']
\ No newline at end of file
+__all__ = ['DataProcessor', 'process_football_data', 'load_football_data', 'load_odds_data', 'iter_matches',
+           'save_match_store', 'load_match_store', 'OddsStore', 'save_odds_store', 'load_odds_store']
\ No newline at end of file
@@ -0,0 +1,355 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+列式批量解析模块
+对整个文件的字段列（如"射门"、"控球率"、"赛果"）一次性做向量化解析：
+字符串列被视为 (记录数 × 字符宽度) 的码点矩阵，按字符位置逐列扫描拆分数字，
+不符合常规格式的少量记录回退到DataProcessor的逐条解析函数，结果与逐条解析完全一致
+"""
+
+from typing import Any, Callable, Sequence, Tuple
+import numpy as np
+
+
+# 单个数字最多位数，超过的交给逐条解析，避免int64溢出和float精度差异
+_MAX_DIGITS = 15
+
+_DIGIT_0 = ord('0')
+_DIGIT_9 = ord('9')
+_DOT = ord('.')
+_SLASH = ord('/')
+_DASH = ord('-')
+_PERCENT = ord('%')
+_SPACE = ord(' ')
+_COLON = ord(':')
+_MERIDIEM = {'AM': np.array([ord('A'), ord('M')], dtype=np.uint32),
+             'PM': np.array([ord('P'), ord('M')], dtype=np.uint32)}
+_SCORE_PREFIX = np.array([ord(c) for c in "比分:"], dtype=np.uint32)
+
+_POWERS_OF_TEN = 10.0 ** np.arange(_MAX_DIGITS + 1)
+
+
+def _to_text_array(values: Sequence[Any]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    将字段列转换为NumPy字符串数组
+
+    Args:
+        values: 原始字段值列表
+
+    Returns:
+        Tuple: (字符串数组, 非字符串值掩码)，None视为空字符串
+    """
+    value_types = set(map(type, values))
+    if value_types <= {str}:
+        return np.array(values, dtype=str), np.zeros(len(values), dtype=bool)
+
+    irregular = np.array([v is not None and not isinstance(v, str) for v in values], dtype=bool)
+    texts = np.array([v if isinstance(v, str) else "" for v in values], dtype=str)
+    return texts, irregular
+
+
+def _to_codes(texts: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    将字符串数组视为码点矩阵
+
+    Args:
+        texts: NumPy字符串数组
+
+    Returns:
+        Tuple: (码点矩阵 (n, 宽度)，每行字符串长度)
+    """
+    width = max(texts.dtype.itemsize // 4, 1)
+    codes = np.ascontiguousarray(texts).view(np.uint32).reshape(len(texts), width)
+    return codes, np.char.str_len(texts)
+
+
+def _parse_span(codes: np.ndarray, start: np.ndarray, end: np.ndarray,
+                allow_decimal: bool) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    解析每行 [start, end) 区间内的数字（对应正则 \\d+ 或 \\d+(?:\\.\\d+)?）
+
+    按字符位置逐列扫描（列数即字符串最大长度，通常不超过十几），每一步对所有行同时处理。
+
+    Args:
+        codes: 码点矩阵
+        start: 每行起始位置
+        end: 每行结束位置（不含）
+        allow_decimal: 是否允许小数
+
+    Returns:
+        Tuple: (是否为合法数字, 去掉小数点后的整数尾数, 小数位数)
+    """
+    n, width = codes.shape
+    ok = end > start
+    mantissa = np.zeros(n, dtype=np.int64)
+    frac_digits = np.zeros(n, dtype=np.int64)
+    n_digits = np.zeros(n, dtype=np.int64)
+    seen_dot = np.zeros(n, dtype=bool)
+
+    for j in range(width):
+        c = codes[:, j]
+        inside = (j >= start) & (j < end)
+        digit = (c >= _DIGIT_0) & (c <= _DIGIT_9)
+        if allow_decimal:
+            # 小数点最多一个，且前后都必须有数字
+            dot = (c == _DOT) & ~seen_dot & (j > start) & (j < end - 1)
+            ok &= ~inside | digit | dot
+            seen_dot |= inside & dot
+        else:
+            ok &= ~inside | digit
+        take = inside & digit & (n_digits < _MAX_DIGITS)
+        mantissa = np.where(take, mantissa * 10 + (c.astype(np.int64) - _DIGIT_0), mantissa)
+        frac_digits += take & seen_dot
+        n_digits += inside & digit
+
+    ok &= n_digits <= _MAX_DIGITS
+    return ok, mantissa, frac_digits
+
+
+def _find_separator(codes: np.ndarray, start: np.ndarray, end: np.ndarray,
+                    separator: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    查找每行 [start, end) 区间内的分隔符
+
+    Returns:
+        Tuple: (分隔符出现次数, 第一次出现的位置)
+    """
+    columns = np.arange(codes.shape[1])
+    inside = (columns >= start[:, None]) & (columns < end[:, None])
+    hits = (codes == separator) & inside
+    return hits.sum(axis=1), hits.argmax(axis=1)
+
+
+def _without_digits(codes: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+    """判断字符串是否不含任何数字（限ASCII字符串，此时正则找不到数字，结果为0）"""
+    inside = np.arange(codes.shape[1]) < lengths[:, None]
+    digit = (codes >= _DIGIT_0) & (codes <= _DIGIT_9)
+    ascii_only = ~(inside & (codes >= 128)).any(axis=1)
+    return ascii_only & ~(inside & digit).any(axis=1)
+
+
+def _apply_fallback(values: Sequence[Any], mask: np.ndarray, parser: Callable[[Any], tuple],
+                    home: np.ndarray, away: np.ndarray):
+    """对无法走快速路径的行调用逐条解析函数，保证边界情况行为一致"""
+    for i in np.flatnonzero(mask):
+        home[i], away[i] = parser(values[i])
+
+
+def _days_from_civil(year: np.ndarray, month: np.ndarray, day: np.ndarray) -> np.ndarray:
+    """公历日期到1970-01-01的天数（向量化的proleptic Gregorian换算）"""
+    year = year - (month <= 2)
+    era = year // 400
+    year_of_era = year - era * 400
+    day_of_year = (153 * ((month + 9) % 12) + 2) // 5 + day - 1
+    day_of_era = year_of_era * 365 + year_of_era // 4 - year_of_era // 100 + day_of_year
+    return era * 146097 + day_of_era - 719468
+
+
+def _days_in_month(year: np.ndarray, month: np.ndarray) -> np.ndarray:
+    """每行年月对应的当月天数"""
+    leap = ((year % 4 == 0) & (year % 100 != 0)) | (year % 400 == 0)
+    days = np.array([31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31], dtype=np.int64)[np.clip(month, 1, 12) - 1]
+    return days + (leap & (month == 2))
+
+
+def parse_divided_column(values: Sequence[Any], fallback: Callable[[Any], tuple],
+                         missing: int = 0) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    批量解析分割值列 ["7/5", ...] -> (array([7, ...]), array([5, ...]))
+
+    Args:
+        values: 分割值字符串列表
+        fallback: 逐条解析函数（DataProcessor.parse_divided_values / parse_snapshot_divided）
+        missing: 不含数字时的取值（与逐条解析函数一致）
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: (主队值, 客队值)，int64数组
+    """
+    n = len(values)
+    home = np.zeros(n, dtype=np.int64)
+    away = np.zeros(n, dtype=np.int64)
+    if n == 0:
+        return home, away
+
+    texts, irregular = _to_text_array(values)
+    codes, lengths = _to_codes(texts)
+    zeros = np.zeros(n, dtype=np.int64)
+    count, sep = _find_separator(codes, zeros, lengths, _SLASH)
+
+    # "7/5"
+    head_ok, head_value, _ = _parse_span(codes, zeros, sep, allow_decimal=False)
+    tail_ok, tail_value, _ = _parse_span(codes, sep + 1, lengths, allow_decimal=False)
+    pair = (count == 1) & head_ok & tail_ok
+    # "12"：只有一个值时客队记为0
+    single_ok, single_value, _ = _parse_span(codes, zeros, lengths, allow_decimal=False)
+    single = (count == 0) & single_ok
+    # ""、"-/-"：没有任何数字
+    empty = _without_digits(codes, lengths)
+
+    home[pair] = head_value[pair]
+    away[pair] = tail_value[pair]
+    home[single] = single_value[single]
+    home[empty] = missing
+    away[empty] = missing
+
+    _apply_fallback(values, ~(pair | single | empty) | irregular, fallback, home, away)
+    return home, away
+
+
+def parse_percentage_column(values: Sequence[Any],
+                            fallback: Callable[[Any], tuple]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    批量解析百分比列 ["33%/67%", ...] -> (array([33.0, ...]), array([67.0, ...]))
+
+    Args:
+        values: 百分比字符串列表
+        fallback: 逐条解析函数（DataProcessor.parse_percentage）
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: (主队百分比, 客队百分比)，float64数组
+    """
+    n = len(values)
+    home = np.zeros(n, dtype=np.float64)
+    away = np.zeros(n, dtype=np.float64)
+    if n == 0:
+        return home, away
+
+    texts, irregular = _to_text_array(values)
+    codes, lengths = _to_codes(texts)
+    rows = np.arange(n)
+    zeros = np.zeros(n, dtype=np.int64)
+    count, sep = _find_separator(codes, zeros, lengths, _SLASH)
+    ends_with_percent = (lengths > 0) & (codes[rows, np.maximum(lengths - 1, 0)] == _PERCENT)
+
+    # "44%/56%"、"44.5%/55.5%"：数值 = 尾数 / 10^小数位数（与float()解析同为正确舍入）
+    head_percent = (sep > 0) & (codes[rows, np.maximum(sep - 1, 0)] == _PERCENT)
+    head_ok, head_mantissa, head_frac = _parse_span(codes, zeros, sep - 1, allow_decimal=True)
+    tail_ok, tail_mantissa, tail_frac = _parse_span(codes, sep + 1, lengths - 1, allow_decimal=True)
+    pair = (count == 1) & head_percent & ends_with_percent & head_ok & tail_ok
+    # "33%"：只有一个值时另一个取补数
+    single_ok, single_mantissa, single_frac = _parse_span(codes, zeros, lengths - 1, allow_decimal=True)
+    single = (count == 0) & ends_with_percent & single_ok
+    empty = _without_digits(codes, lengths)
+
+    home[pair] = head_mantissa[pair] / _POWERS_OF_TEN[head_frac[pair]]
+    away[pair] = tail_mantissa[pair] / _POWERS_OF_TEN[tail_frac[pair]]
+    home[single] = single_mantissa[single] / _POWERS_OF_TEN[single_frac[single]]
+    away[single] = 100.0 - home[single]
+
+    _apply_fallback(values, ~(pair | single | empty) | irregular, fallback, home, away)
+    return home, away
+
+
+def parse_score_column(values: Sequence[Any], fallback: Callable[[Any], tuple],
+                       missing: int = 0) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    批量解析比分列 ["比分:2-0", ...] -> (array([2, ...]), array([0, ...]))
+
+    Args:
+        values: 比分字符串列表
+        fallback: 逐条解析函数（DataProcessor.parse_score / parse_snapshot_score）
+        missing: 空值或不含数字时的取值（与逐条解析函数一致）
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: (主队进球, 客队进球)，int64数组
+    """
+    n = len(values)
+    home = np.zeros(n, dtype=np.int64)
+    away = np.zeros(n, dtype=np.int64)
+    if n == 0:
+        return home, away
+
+    texts, irregular = _to_text_array(values)
+    codes, lengths = _to_codes(texts)
+
+    # 跳过"比分:"前缀（出现在其他位置的前缀由逐条解析处理）
+    prefix_len = len(_SCORE_PREFIX)
+    if codes.shape[1] >= prefix_len:
+        has_prefix = (codes[:, :prefix_len] == _SCORE_PREFIX).all(axis=1)
+    else:
+        has_prefix = np.zeros(n, dtype=bool)
+    start = np.where(has_prefix, prefix_len, 0)
+    count, sep = _find_separator(codes, start, lengths, _DASH)
+
+    # "2-0"
+    head_ok, head_value, _ = _parse_span(codes, start, sep, allow_decimal=False)
+    tail_ok, tail_value, _ = _parse_span(codes, sep + 1, lengths, allow_decimal=False)
+    pair = (count == 1) & head_ok & tail_ok
+    # "3"：只有一个值时客队记为0
+    single_ok, single_value, _ = _parse_span(codes, start, lengths, allow_decimal=False)
+    single = (count == 0) & single_ok
+    # 去掉前缀后为空，或不含任何数字
+    empty = (lengths == start) | _without_digits(codes, lengths)
+
+    home[pair] = head_value[pair]
+    away[pair] = tail_value[pair]
+    home[single] = single_value[single]
+    home[empty] = missing
+    away[empty] = missing
+
+    _apply_fallback(values, ~(pair | single | empty) | irregular, fallback, home, away)
+    return home, away
+
+
+def parse_kickoff_column(dates: Sequence[Any], dates1: Sequence[Any],
+                         fallback: Callable[[Any, Any], int]) -> np.ndarray:
+    """
+    批量解析开球时间 ["2023-5-1 7:35:00 PM", ...] -> array([1682969700, ...])
+    
+    快速路径只处理严格的"年-月-日 时:分:秒 AM/PM"格式（4位年份、2位分秒、大写AM/PM），
+    其余记录（包括只能使用"日期1"的记录）交给逐条解析。
+
+    Args:
+        dates: "日期"字段列表
+        dates1: "日期1"字段列表（"2023-05-01"）
+        fallback: 逐条解析函数（DataProcessor.parse_kickoff）
+
+    Returns:
+        np.ndarray: Unix时间戳（秒），int64数组
+    """
+    n = len(dates)
+    kickoff = np.zeros(n, dtype=np.int64)
+    if n == 0:
+        return kickoff
+
+    texts, irregular = _to_text_array(dates)
+    codes, lengths = _to_codes(texts)
+    zeros = np.zeros(n, dtype=np.int64)
+
+    # 依次定位 "-"、"-"、" "、":"、":"、" " 六个分隔符
+    dash_count, dash1 = _find_separator(codes, zeros, lengths, _DASH)
+    _, dash2 = _find_separator(codes, dash1 + 1, lengths, _DASH)
+    space_count, space1 = _find_separator(codes, zeros, lengths, _SPACE)
+    colon_count, colon1 = _find_separator(codes, zeros, lengths, _COLON)
+    _, colon2 = _find_separator(codes, colon1 + 1, lengths, _COLON)
+    _, space2 = _find_separator(codes, space1 + 1, lengths, _SPACE)
+    layout = ((dash_count == 2) & (space_count == 2) & (colon_count == 2)
+              & (dash2 < space1) & (space1 < colon1) & (colon2 < space2)
+              & (dash1 == 4) & (colon2 - colon1 == 3) & (space2 - colon2 == 3) & (lengths - space2 == 3))
+
+    year_ok, year, _ = _parse_span(codes, zeros, dash1, allow_decimal=False)
+    month_ok, month, _ = _parse_span(codes, dash1 + 1, dash2, allow_decimal=False)
+    day_ok, day, _ = _parse_span(codes, dash2 + 1, space1, allow_decimal=False)
+    hour_ok, hour, _ = _parse_span(codes, space1 + 1, colon1, allow_decimal=False)
+    minute_ok, minute, _ = _parse_span(codes, colon1 + 1, colon2, allow_decimal=False)
+    second_ok, second, _ = _parse_span(codes, colon2 + 1, space2, allow_decimal=False)
+
+    rows = np.arange(n)
+    suffix = np.stack([codes[rows, np.clip(space2 + k, 0, codes.shape[1] - 1)] for k in (1, 2)], axis=1)
+    is_am = (suffix == _MERIDIEM['AM']).all(axis=1)
+    is_pm = (suffix == _MERIDIEM['PM']).all(axis=1)
+
+    regular = (layout & year_ok & month_ok & day_ok & hour_ok & minute_ok & second_ok & (is_am | is_pm)
+               & (dash2 - dash1 <= 3) & (space1 - dash2 <= 3) & (colon1 - space1 <= 3)
+               & (month >= 1) & (month <= 12) & (hour >= 1) & (hour <= 12)
+               & (minute <= 59) & (second <= 59) & (day >= 1))
+    regular &= day <= _days_in_month(year, month)
+
+    # 12小时制换算：12 AM为0点，PM加12小时（12 PM除外）
+    hour24 = hour % 12 + np.where(is_pm, 12, 0)
+    seconds = _days_from_civil(year, month, day) * 86400 + hour24 * 3600 + minute * 60 + second
+    kickoff[regular] = seconds[regular]
+
+    for i in np.flatnonzero(~regular | irregular):
+        kickoff[i] = fallback(dates[i], dates1[i])
+    return kickoff
@@ -5,22 +5,165 @@
 负责解析原始JSON数据，转换为结构化的比赛数据
 """
 
+import calendar
 import json
+import math
 import os
 import re
-from typing import List, Dict, Any
+from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from operator import attrgetter
+from typing import List, Dict, Any, Optional, Iterable, Iterator, Union
 from pathlib import Path
 import pandas as pd
 
 from ..models.data_models import RawMatchData, MatchData
+from ..models.match_table import MatchTable
+from ..config.league_coefficients import DATA_CONFIG
+from .column_parser import (parse_divided_column, parse_percentage_column, parse_score_column,
+                            parse_kickoff_column)
+from .ingest_cache import IngestCache, source_fingerprint
+from .match_index import MatchIndex
+from .match_store import save_match_store, load_matches, load_table
+from .odds_store import OddsStore, SNAPSHOT_FIELDS, SERIES_FIELDS, save_odds_store, load_odds_store
+
+
+# 盘口字段前缀："大小球2.5"、"让球-0.5/1"、"赔率:0.88"
+ODDS_LINE_PREFIXES = ("大小球", "让球")
+ODDS_PRICE_PREFIX = "赔率:"
+
+# 原始数据的时间格式："日期" 如 "2023-5-1 7:35:00 PM"，"日期1" 如 "2023-05-01"
+KICKOFF_FORMAT = "%Y-%m-%d %I:%M:%S %p"
+DATE_FORMAT = "%Y-%m-%d"
+
+
+def resolve_workers(workers: Optional[int] = None) -> int:
+    """
+    解析并行进程数配置
+    
+    Args:
+        workers: 进程数，None使用配置默认值，<=0表示使用全部CPU核心
+        
+    Returns:
+        int: 实际使用的进程数
+    """
+    if workers is None:
+        workers = DATA_CONFIG["ingest_workers"]
+    if workers <= 0:
+        workers = os.cpu_count() or 1
+    return workers
+
+
+def iter_chunks(items: Iterable[Any], chunk_size: Optional[int] = None) -> Iterator[List[Any]]:
+    """
+    将任意可迭代对象按固定大小切分为列表块
+    
+    Args:
+        items: 可迭代对象（列表或生成器）
+        chunk_size: 每块大小，None使用配置默认值
+        
+    Yields:
+        List: 数据块
+    """
+    chunk_size = chunk_size or DATA_CONFIG["stream_chunk_size"]
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def iter_json_array(file_path: str, encoding: str = 'utf-8',
+                    buffer_size: int = 65536) -> Iterator[Any]:
+    """
+    增量读取JSON数组文件，逐个产出数组元素，内存占用与文件大小无关
+    
+    顶层不是数组时（单个对象），整体解析后作为唯一元素产出。
+    
+    Args:
+        file_path: JSON文件路径
+        encoding: 文件编码
+        buffer_size: 每次读取的字符数
+        
+    Yields:
+        数组中的每个元素
+    """
+    decoder = json.JSONDecoder()
+    
+    with open(file_path, 'r', encoding=encoding) as file:
+        buffer = ''
+        while not buffer:
+            more = file.read(buffer_size)
+            if not more:
+                raise ValueError("空文件")
+            buffer = more.lstrip()
+        eof = False
+        
+        if not buffer.startswith('['):
+            # 非数组格式，退化为整体解析
+            yield json.loads(buffer + file.read())
+            return
+        
+        pos = 1
+        while True:
+            # 跳过空白和元素间的逗号
+            while pos < len(buffer) and (buffer[pos].isspace() or buffer[pos] == ','):
+                pos += 1
+            
+            if pos >= len(buffer):
+                if eof:
+                    raise ValueError("JSON数组未正确结束")
+                buffer = file.read(buffer_size)
+                eof = not buffer
+                pos = 0
+                continue
+            
+            if buffer[pos] == ']':
+                return
+            
+            try:
+                item, end = decoder.raw_decode(buffer, pos)
+                # 元素恰好结束在缓冲区末尾时可能被截断（如数字），需读取更多内容确认
+                if end >= len(buffer) and not eof:
+                    raise json.JSONDecodeError("缓冲区不足", buffer, pos)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                more = file.read(buffer_size)
+                eof = not more
+                buffer = buffer[pos:] + more
+                pos = 0
+                continue
+            
+            yield item
+            pos = end
+            
+            # 丢弃已消费的内容，保持缓冲区大小有界
+            if pos > buffer_size:
+                buffer = buffer[pos:]
+                pos = 0
+
+
+def _process_file_task(file_path: str) -> List[MatchData]:
+    """进程池任务：解析单个JSON文件（模块级函数，便于子进程序列化调用）"""
+    return DataProcessor().process_file(file_path)
 
 
 class DataProcessor:
     """数据处理器"""
     
-    def __init__(self):
-        """初始化数据处理器"""
-        pass
+    def __init__(self, workers: Optional[int] = None, dedupe_policy: Optional[str] = None):
+        """
+        初始化数据处理器
+        
+        Args:
+            workers: 并行解析的进程数，None使用配置默认值，<=0表示使用全部CPU核心
+            dedupe_policy: 重复match_id的保留策略（latest/first/complete），None使用配置默认值
+        """
+        self.workers = workers
+        self.dedupe_policy = dedupe_policy
     
     def parse_percentage(self, percentage_str: str) -> tuple:
         """
@@ -92,6 +235,133 @@ class DataProcessor:
         else:
             return (0, 0)
     
+    def parse_snapshot_score(self, score_str: str) -> tuple:
+        """
+        解析比赛进行中的比分快照（开场15分钟、半场），没有数据时返回 (-1, -1)
+        
+        Args:
+            score_str: 比分字符串
+            
+        Returns:
+            tuple: (主队进球, 客队进球)
+        """
+        if not score_str or not re.search(r'\d', score_str):
+            return (-1, -1)
+        return self.parse_score(score_str)
+    
+    def parse_snapshot_divided(self, divided_str: str) -> tuple:
+        """
+        解析比赛进行中的分割值快照（半场角球），没有数据时返回 (-1, -1)
+        
+        Args:
+            divided_str: 分割值字符串
+            
+        Returns:
+            tuple: (主队值, 客队值)
+        """
+        if not divided_str or not re.search(r'\d', divided_str):
+            return (-1, -1)
+        return self.parse_divided_values(divided_str)
+    
+    def parse_kickoff(self, date_str: str, date1_str: str = "") -> int:
+        """
+        解析开球时间 "2023-5-1 7:35:00 PM" -> Unix时间戳（秒）
+        
+        墙上时间按UTC换算，只用于排序和区间查询；"日期"无法解析时使用"日期1"（当天0点）。
+        
+        Args:
+            date_str: "日期"字段
+            date1_str: "日期1"字段
+            
+        Returns:
+            int: 时间戳，两个字段都无法解析时返回0
+        """
+        for value, time_format in ((date_str, KICKOFF_FORMAT), (date1_str, DATE_FORMAT)):
+            if isinstance(value, str) and value.strip():
+                try:
+                    return calendar.timegm(datetime.strptime(value.strip(), time_format).timetuple())
+                except ValueError:
+                    continue
+        return 0
+    
+    def parse_odds_line(self, line_str: str) -> float:
+        """
+        解析盘口 "让球-0.5/1" -> -0.75，"大小球2/2.5" -> 2.25
+        
+        分数盘（两个盘口以"/"分隔）取两者的平均值，符号作用于整个盘口。
+        
+        Args:
+            line_str: 盘口字符串（可带"大小球"、"让球"前缀）
+            
+        Returns:
+            float: 盘口值，无法解析时返回NaN
+        """
+        if not isinstance(line_str, str) or not line_str.strip():
+            return float('nan')
+        
+        text = line_str.strip()
+        for prefix in ODDS_LINE_PREFIXES:
+            if text.startswith(prefix):
+                text = text[len(prefix):]
+                break
+        
+        sign = -1.0 if text.startswith('-') else 1.0
+        parts = text.lstrip('+-').split('/')
+        try:
+            values = [float(part) for part in parts]
+        except ValueError:
+            return float('nan')
+        if not 1 <= len(values) <= 2:
+            return float('nan')
+        return sign * sum(values) / len(values)
+    
+    def parse_odds_price(self, price_str: str) -> float:
+        """
+        解析水位 "赔率:0.88" -> 0.88
+        
+        Args:
+            price_str: 水位字符串
+            
+        Returns:
+            float: 水位，无法解析时返回NaN
+        """
+        if not isinstance(price_str, str) or not price_str.strip():
+            return float('nan')
+        try:
+            return float(price_str.strip().replace(ODDS_PRICE_PREFIX, ""))
+        except ValueError:
+            return float('nan')
+    
+    def parse_odds_ticks(self, detail_str: str) -> tuple:
+        """
+        解析水位变化详情 "-0/0.5/0.96\n-0.5/0.89\n" -> ([-0.25, -0.5], [0.96, 0.89])
+        
+        每行为"盘口/水位"，分数盘为"盘口1/盘口2/水位"；无法解析的行被跳过。
+        
+        Args:
+            detail_str: 水位变化详情字符串
+            
+        Returns:
+            tuple: (盘口列表, 水位列表)
+        """
+        lines, prices = [], []
+        if not isinstance(detail_str, str):
+            return (lines, prices)
+        
+        for tick in detail_str.split('\n'):
+            line_part, _, price_part = tick.strip().rpartition('/')
+            if not line_part:
+                continue
+            line = self.parse_odds_line(line_part)
+            try:
+                price = float(price_part)
+            except ValueError:
+                continue
+            if not math.isnan(line):
+                lines.append(line)
+                prices.append(price)
+        return (lines, prices)
+    
     def convert_raw_to_structured(self, raw_data: RawMatchData) -> MatchData:
         """
         将原始数据转换为结构化比赛数据
@@ -112,6 +382,9 @@ class DataProcessor:
         home_yellow_cards, away_yellow_cards = self.parse_divided_values(raw_data.yellow_cards)
         home_corners, away_corners = self.parse_divided_values(raw_data.corners)
         home_red_cards, away_red_cards = self.parse_divided_values(raw_data.red_cards)
+        home_goals_15min, away_goals_15min = self.parse_snapshot_score(raw_data.first_15min_score)
+        home_half_goals, away_half_goals = self.parse_snapshot_score(raw_data.half_time_score)
+        home_half_corners, away_half_corners = self.parse_snapshot_divided(raw_data.half_corners)
         
         # 创建结构化数据对象
         structured_data = MatchData(
@@ -137,11 +410,160 @@ class DataProcessor:
             home_corners=home_corners,
             away_corners=away_corners,
             home_red_cards=home_red_cards,
-            away_red_cards=away_red_cards
+            away_red_cards=away_red_cards,
+            kickoff_ts=self.parse_kickoff(raw_data.date, raw_data.date1),
+            home_goals_15min=home_goals_15min,
+            away_goals_15min=away_goals_15min,
+            home_half_goals=home_half_goals,
+            away_half_goals=away_half_goals,
+            home_half_corners=home_half_corners,
+            away_half_corners=away_half_corners
         )
         
         return structured_data
     
+    def decode_records(self, raw_dicts: List[Dict[str, Any]]) -> List[MatchData]:
+        """
+        列式批量解码一批原始比赛记录
+        
+        先按字段抽取整列，再对每列做一次向量化解析，结果与逐条调用
+        convert_raw_to_structured 完全一致。
+        
+        Args:
+            raw_dicts: 原始比赛字典列表（空记录会被跳过）
+            
+        Returns:
+            List[MatchData]: 结构化比赛数据列表
+        """
+        records = [raw_dict for raw_dict in raw_dicts if raw_dict]
+        if not records:
+            return []
+        
+        def column(key: str, default: str = "0/0") -> List[Any]:
+            # 字段键与缺省值与process_single_match保持一致
+            return [record.get(key, default) for record in records]
+        
+        # 逐列解析
+        home_goals, away_goals = parse_score_column(
+            [record.get("赛果", record.get("比分", "")) for record in records], self.parse_score)
+        home_shots, away_shots = parse_divided_column(column("射门"), self.parse_divided_values)
+        home_shots_on_target, away_shots_on_target = parse_divided_column(
+            column("射正"), self.parse_divided_values)
+        home_possession, away_possession = parse_percentage_column(
+            column("控球率", "0%/0%"), self.parse_percentage)
+        home_pass_success, away_pass_success = parse_percentage_column(
+            column("传球成功率", "0%/0%"), self.parse_percentage)
+        home_fouls, away_fouls = parse_divided_column(column("犯规"), self.parse_divided_values)
+        home_yellow_cards, away_yellow_cards = parse_divided_column(column("黄牌"), self.parse_divided_values)
+        home_corners, away_corners = parse_divided_column(column("角球"), self.parse_divided_values)
+        home_red_cards, away_red_cards = parse_divided_column(column("红牌"), self.parse_divided_values)
+        kickoff = parse_kickoff_column(column("日期", ""), column("日期1", ""), self.parse_kickoff)
+        home_goals_15min, away_goals_15min = parse_score_column(
+            column("开场15分钟", ""), self.parse_snapshot_score, missing=-1)
+        home_half_goals, away_half_goals = parse_score_column(column("半场", ""), self.parse_snapshot_score,
+                                                              missing=-1)
+        home_half_corners, away_half_corners = parse_divided_column(
+            column("半场角球", ""), self.parse_snapshot_divided, missing=-1)
+        
+        # 转换为Python原生数值后按行组装（类型与逐条解析一致）
+        rows = zip(
+            [str(match_id) for match_id in column("比赛id", "")],
+            column("联赛名", ""), column("日期", ""), column("主队", ""), column("客队", ""),
+            home_goals.tolist(), away_goals.tolist(),
+            home_shots.tolist(), away_shots.tolist(),
+            home_shots_on_target.tolist(), away_shots_on_target.tolist(),
+            home_possession.tolist(), away_possession.tolist(),
+            home_pass_success.tolist(), away_pass_success.tolist(),
+            home_fouls.tolist(), away_fouls.tolist(),
+            home_yellow_cards.tolist(), away_yellow_cards.tolist(),
+            home_corners.tolist(), away_corners.tolist(),
+            home_red_cards.tolist(), away_red_cards.tolist(),
+            kickoff.tolist(),
+            home_goals_15min.tolist(), away_goals_15min.tolist(),
+            home_half_goals.tolist(), away_half_goals.tolist(),
+            home_half_corners.tolist(), away_half_corners.tolist()
+        )
+        
+        return [MatchData(*row) for row in rows]
+    
+    def decode_odds(self, raw_dicts: List[Dict[str, Any]]) -> OddsStore:
+        """
+        解析一批原始比赛记录中的盘口数据
+        
+        Args:
+            raw_dicts: 原始比赛字典列表（空记录会被跳过）
+            
+        Returns:
+            OddsStore: 盘口数据（match_id与decode_records的结果一致）
+        """
+        records = [raw_dict for raw_dict in raw_dicts if raw_dict]
+        parsers = {'line': self.parse_odds_line, 'price': self.parse_odds_price}
+        
+        snapshots = {name: [parsers[kind](record.get(key, "")) for record in records]
+                     for name, (key, kind) in SNAPSHOT_FIELDS.items()}
+        ticks = {market: [self.parse_odds_ticks(record.get(key, "")) for record in records]
+                 for market, key in SERIES_FIELDS.items()}
+        
+        return OddsStore.from_parsed([str(record.get("比赛id", "")) for record in records], snapshots, ticks)
+    
+    def process_odds(self, json_files: List[Path]) -> OddsStore:
+        """
+        解析一组JSON文件中的盘口数据
+        
+        Args:
+            json_files: JSON文件路径列表
+            
+        Returns:
+            OddsStore: 按文件顺序合并的盘口数据；重复的match_id与process_files使用同一去重策略，
+                       保留的是同一条记录的盘口
+        """
+        parts = []
+        records: List[Dict[str, Any]] = []
+        for json_file in json_files:
+            file_records = self.load_json_file(str(json_file))
+            parts.append(self.decode_odds(file_records))
+            # 与decode_odds一样跳过空记录，records与盘口行逐行对齐
+            records.extend(record for record in file_records if record)
+        odds = OddsStore.concat(parts)
+        
+        kept_rows = self.dedupe_odds_rows(odds.match_ids.tolist(), records)
+        if len(kept_rows) == len(odds):
+            return odds
+        return odds.take(kept_rows)
+    
+    def dedupe_odds_rows(self, match_ids: List[str], records: List[Dict[str, Any]]) -> List[int]:
+        """
+        按比赛数据的去重策略选取盘口行
+        
+        只有match_id重复的记录需要比较：这些记录解码为比赛数据后交给MatchIndex按策略取舍，
+        其余行直接保留，不需要再次解码全部比赛记录。
+        
+        Args:
+            match_ids: 每行盘口的比赛ID（与records逐行对齐）
+            records: 原始比赛记录（不含空记录）
+            
+        Returns:
+            List[int]: 保留的行号，按match_id首次出现的顺序（与MatchIndex.matches一致）
+        """
+        candidates: Dict[int, List[int]] = {}
+        first_row: Dict[str, int] = {}
+        for row, match_id in enumerate(match_ids):
+            # 没有match_id的记录无法判断重复，总是保留
+            first = first_row.setdefault(match_id, row) if match_id else row
+            candidates.setdefault(first, []).append(row)
+        
+        duplicate_rows = [row for rows in candidates.values() if len(rows) > 1 for row in rows]
+        if not duplicate_rows:
+            return list(candidates)
+        
+        # 有match_id的记录不为空，解码结果与duplicate_rows逐行对齐
+        decoded = self.decode_records([records[row] for row in duplicate_rows])
+        index = MatchIndex(self.dedupe_policy)
+        index.extend(decoded)
+        row_of = {id(match): row for row, match in zip(duplicate_rows, decoded)}
+        kept = {first_row[match.match_id]: row_of[id(match)] for match in index.matches()}
+        return [kept.get(first, rows[0]) for first, rows in candidates.items()]
+    
     def load_json_file(self, file_path: str) -> List[Dict[str, Any]]:
         """
         加载JSON文件
@@ -169,6 +591,33 @@ class DataProcessor:
             print(f"加载文件失败 {file_path}: {e}")
             return []
     
+    def iter_json_records(self, file_path: str) -> Iterator[Dict[str, Any]]:
+        """
+        流式读取JSON文件中的比赛记录（编码与容错处理同load_json_file）
+        
+        Args:
+            file_path: JSON文件路径
+            
+        Yields:
+            Dict: 单场比赛的原始字典数据
+        """
+        yielded = False
+        try:
+            for record in iter_json_array(file_path, encoding='utf-8'):
+                yielded = True
+                yield record
+        except UnicodeDecodeError:
+            if yielded:
+                print(f"无法解析文件 {file_path}: 文件中途出现非UTF-8编码")
+                return
+            # 尝试GBK编码
+            try:
+                yield from iter_json_array(file_path, encoding='gbk')
+            except Exception as e:
+                print(f"无法解析文件 {file_path}: {e}")
+        except Exception as e:
+            print(f"加载文件失败 {file_path}: {e}")
+    
     def process_single_match(self, match_dict: Dict[str, Any]) -> RawMatchData:
         """
         处理单场比赛的原始字典数据
@@ -183,8 +632,10 @@ class DataProcessor:
             match_id=str(match_dict.get("比赛id", "")),
             league_name=match_dict.get("联赛名", ""),
             date=match_dict.get("日期", ""),
+            date1=match_dict.get("日期1", ""),
             home_team=match_dict.get("主队", ""),
             away_team=match_dict.get("客队", ""),
+            first_15min_score=match_dict.get("开场15分钟", ""),
             half_time_score=match_dict.get("半场", ""),
             full_time_score=match_dict.get("赛果", match_dict.get("比分", "")),
             shots=match_dict.get("射门", "0/0"),
@@ -194,82 +645,304 @@ class DataProcessor:
             fouls=match_dict.get("犯规", "0/0"),
             yellow_cards=match_dict.get("黄牌", "0/0"),
             corners=match_dict.get("角球", "0/0"),
-            half_corners=match_dict.get("半场角球", "0/0"),
+            half_corners=match_dict.get("半场角球", ""),
             red_cards=match_dict.get("红牌", "0/0"),
             shots_on_woodwork=match_dict.get("射中门框", "0/0")
         )
     
-    def process_directory(self, directory_path: str) -> List[MatchData]:
+    def process_file(self, file_path: str) -> List[MatchData]:
         """
-        处理整个目录的JSON文件
+        处理单个JSON文件
         
         Args:
-            directory_path: 目录路径
+            file_path: JSON文件路径
             
         Returns:
-            List[MatchData]: 处理后的结构化比赛数据列表
+            List[MatchData]: 该文件中的结构化比赛数据列表
+        """
+        raw_data_list = self.load_json_file(str(file_path))
+        return self.decode_records(raw_data_list)
+    
+    def iter_file_matches(self, file_path: str) -> Iterator[MatchData]:
         """
-        structured_matches = []
+        流式处理单个JSON文件
         
-        # 获取目录下所有JSON文件
-        json_files = list(Path(directory_path).glob("*.json"))
+        Args:
+            file_path: JSON文件路径
+            
+        Yields:
+            MatchData: 结构化比赛数据
+        """
+        # 按块做列式解码，内存占用只与块大小有关
+        for chunk in iter_chunks(self.iter_json_records(str(file_path))):
+            yield from self.decode_records(chunk)
+    
+    def iter_matches(self, input_dirs: Iterable[str]) -> Iterator[MatchData]:
+        """
+        流式处理多个目录的JSON文件，逐条产出比赛数据，内存占用不随历史数据量增长
         
-        for json_file in json_files:
+        流式读取按文件顺序产出，不做全局的开球时间排序，也不按match_id去重。
+        
+        Args:
+            input_dirs: 输入目录列表
+            
+        Yields:
+            MatchData: 结构化比赛数据
+        """
+        for json_file in self.collect_json_files(input_dirs):
             print(f"处理文件: {json_file}")
-            raw_data_list = self.load_json_file(str(json_file))
+            yield from self.iter_file_matches(str(json_file))
+    
+    def list_json_files(self, directory_path: str) -> List[Path]:
+        """
+        列出目录下的所有JSON文件（按文件名排序，保证处理顺序确定）
+        
+        Args:
+            directory_path: 目录路径
             
-            for raw_dict in raw_data_list:
-                if raw_dict:  # 确保数据不为空
-                    raw_match = self.process_single_match(raw_dict)
-                    structured_match = self.convert_raw_to_structured(raw_match)
-                    structured_matches.append(structured_match)
+        Returns:
+            List[Path]: JSON文件路径列表
+        """
+        return sorted(Path(directory_path).glob("*.json"))
+    
+    def collect_json_files(self, input_dirs: Iterable[str]) -> List[Path]:
+        """
+        汇总多个目录下的JSON文件（不存在的目录会提示并跳过）
+        
+        Args:
+            input_dirs: 输入目录列表
+            
+        Returns:
+            List[Path]: JSON文件路径列表
+        """
+        json_files = []
+        for directory in input_dirs:
+            if os.path.exists(directory):
+                json_files.extend(self.list_json_files(directory))
+            else:
+                print(f"目录不存在: {directory}")
+        return json_files
+    
+    def process_files(self, json_files: List[Path], workers: Optional[int] = None,
+                      cache: Optional[IngestCache] = None) -> List[MatchData]:
+        """
+        处理一组JSON文件，可使用进程池并行解析（每个文件一个任务）
+        
+        Args:
+            json_files: JSON文件路径列表
+            workers: 进程数，None时使用初始化时的配置
+            cache: 增量解析缓存，提供时只重新解析新增或变化的文件
+            
+        Returns:
+            List[MatchData]: 按match_id去重、按开球时间稳定排序的结构化比赛数据列表（同一时间按文件顺序）
+        """
+        file_paths = [str(json_file) for json_file in json_files]
+        results: Dict[str, List[MatchData]] = {}
+        fingerprints = {}
+        
+        # 先从缓存中取出未变化的文件
+        if cache is not None:
+            for file_path in file_paths:
+                cached = cache.lookup(file_path)
+                if cached is not None:
+                    results[file_path] = cached
+                else:
+                    fingerprints[file_path] = cache.fingerprint(file_path)
+        
+        pending = [file_path for file_path in file_paths if file_path not in results]
+        workers = resolve_workers(self.workers if workers is None else workers)
+        workers = min(workers, len(pending))
+        
+        if workers <= 1:
+            for file_path in pending:
+                print(f"处理文件: {file_path}")
+                results[file_path] = self.process_file(file_path)
+        else:
+            # executor.map按提交顺序返回结果，输出顺序与串行处理一致
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                for file_path, matches in zip(pending, executor.map(_process_file_task, pending)):
+                    print(f"处理文件: {file_path}")
+                    results[file_path] = matches
+        
+        if cache is not None:
+            for file_path in pending:
+                cache.store(file_path, results[file_path], fingerprints[file_path])
+            cache.prune()
+            cache.save()
+            print(cache.summary())
+        
+        # 按文件顺序合并（重复的match_id按去重策略保留一条），再按开球时间做一次全局稳定排序
+        index = MatchIndex(self.dedupe_policy)
+        for file_path in file_paths:
+            index.extend(results[file_path])
+        structured_matches = index.matches()
+        structured_matches.sort(key=attrgetter('kickoff_ts'))
+        if index.duplicates:
+            print(index.summary())
         
         print(f"总共处理了 {len(structured_matches)} 场比赛数据")
         return structured_matches
     
-    def save_to_csv(self, matches: List[MatchData], output_path: str):
+    def process_directory(self, directory_path: str, workers: Optional[int] = None) -> List[MatchData]:
+        """
+        处理整个目录的JSON文件
+        
+        Args:
+            directory_path: 目录路径
+            workers: 并行解析的进程数，None时使用初始化时的配置
+            
+        Returns:
+            List[MatchData]: 处理后的结构化比赛数据列表
+        """
+        # 获取目录下所有JSON文件
+        json_files = self.list_json_files(directory_path)
+        return self.process_files(json_files, workers)
+    
+    def save_to_csv(self, matches: Iterable[MatchData], output_path: str,
+                    chunk_size: Optional[int] = None) -> int:
         """
         将结构化数据保存为CSV文件
         
+        支持列表或生成器输入，按块写入，内存占用只与块大小有关。
+        
         Args:
-            matches: 比赛数据列表
+            matches: 比赛数据列表或生成器
             output_path: 输出文件路径
+            chunk_size: 每次写入的记录数，None使用配置默认值
+            
+        Returns:
+            int: 写入的比赛数
         """
-        if not matches:
-            print("没有数据可保存")
-            return
+        total = 0
+        
+        for chunk in iter_chunks(matches, chunk_size):
+            # 转换为字典列表
+            data_dicts = [match.to_dict() for match in chunk]
+            df = pd.DataFrame(data_dicts)
             
-        # 转换为字典列表
-        data_dicts = [match.to_dict() for match in matches]
+            if total == 0:
+                # 首块写入表头和BOM
+                df.to_csv(output_path, index=False, encoding='utf-8-sig')
+            else:
+                df.to_csv(output_path, mode='a', header=False, index=False, encoding='utf-8')
+            total += len(chunk)
+        
+        if total == 0:
+            print("没有数据可保存")
+            return 0
         
-        # 创建DataFrame并保存
-        df = pd.DataFrame(data_dicts)
-        df.to_csv(output_path, index=False, encoding='utf-8-sig')
         print(f"数据已保存到: {output_path}")
+        return total
 
 
 # 便捷函数
-def process_football_data(input_dirs: List[str], output_file: str = "processed_football_data.csv"):
+def process_football_data(input_dirs: List[str], output_file: Optional[str] = "processed_football_data.csv",
+                          workers: Optional[int] = None, cache_dir: Optional[str] = None,
+                          dedupe_policy: Optional[str] = None):
     """
     便捷函数：处理多个目录的足球数据
     
     Args:
         input_dirs: 输入目录列表
-        output_file: 输出文件名
+        output_file: 输出文件名，None表示不生成CSV
+        workers: 并行解析的进程数，None使用配置默认值，<=0表示使用全部CPU核心
+        cache_dir: 增量解析缓存目录，提供时只重新解析新增或变化的文件
+        dedupe_policy: 重复match_id的保留策略（latest/first/complete），None使用配置默认值
     """
-    processor = DataProcessor()
-    all_matches = []
+    processor = DataProcessor(workers=workers, dedupe_policy=dedupe_policy)
     
-    for directory in input_dirs:
-        if os.path.exists(directory):
-            matches = processor.process_directory(directory)
-            all_matches.extend(matches)
-        else:
-            print(f"目录不存在: {directory}")
+    # 先汇总所有目录的文件，再统一分发到进程池
+    json_files = processor.collect_json_files(input_dirs)
+    
+    cache = IngestCache(cache_dir) if cache_dir else None
+    all_matches = processor.process_files(json_files, cache=cache) if json_files or cache else []
     
     if all_matches:
-        processor.save_to_csv(all_matches, output_file)
+        if output_file:
+            processor.save_to_csv(all_matches, output_file)
         return all_matches
     else:
         print("没有找到任何比赛数据")
-        return []
\ No newline at end of file
+        return []
+
+
+def load_football_data(input_dirs: List[str], store_dir: str, output_file: Optional[str] = None,
+                       workers: Optional[int] = None, cache_dir: Optional[str] = None,
+                       refresh: bool = False, as_table: bool = False,
+                       dedupe_policy: Optional[str] = None) -> Union[List[MatchData], MatchTable]:
+    """
+    便捷函数：优先从列式二进制存储加载比赛数据，原始数据变化时重新处理并重建存储
+    
+    Args:
+        input_dirs: 输入目录列表
+        store_dir: 列式存储目录
+        output_file: 重新处理时输出的CSV文件，None表示不生成CSV
+        workers: 并行解析的进程数
+        cache_dir: 增量解析缓存目录
+        refresh: 是否忽略已有存储强制重新处理
+        as_table: 是否返回数组化的MatchTable（不创建逐场的MatchData对象）
+        dedupe_policy: 重复match_id的保留策略，None使用配置默认值
+        
+    Returns:
+        Union[List[MatchData], MatchTable]: 比赛数据列表或数据表
+    """
+    # 去重策略不同时存储内容不同，策略也计入指纹
+    dedupe_policy = dedupe_policy or DATA_CONFIG["dedupe_policy"]
+    fingerprint = source_fingerprint([str(f) for f in DataProcessor().collect_json_files(input_dirs)],
+                                     salt=dedupe_policy)
+    
+    if not refresh:
+        loaded = (load_table if as_table else load_matches)(store_dir, expected_fingerprint=fingerprint)
+        if loaded is not None:
+            return loaded
+    
+    matches = process_football_data(input_dirs, output_file, workers=workers, cache_dir=cache_dir,
+                                    dedupe_policy=dedupe_policy)
+    table = MatchTable.from_matches(matches)
+    if matches:
+        save_match_store(table, store_dir, source_fingerprint=fingerprint)
+    return table if as_table else matches
+
+
+def load_odds_data(input_dirs: List[str], store_dir: str, refresh: bool = False,
+                   dedupe_policy: Optional[str] = None) -> OddsStore:
+    """
+    便捷函数：优先从存储目录加载盘口数据，原始数据变化时重新解析并保存
+    
+    Args:
+        input_dirs: 输入目录列表
+        store_dir: 列式存储目录（盘口数据保存在其odds子目录）
+        refresh: 是否忽略已有存储强制重新解析
+        dedupe_policy: 重复match_id的保留策略（与比赛数据一致），None使用配置默认值
+        
+    Returns:
+        OddsStore: 盘口数据
+    """
+    # 与load_football_data相同，去重策略计入指纹
+    dedupe_policy = dedupe_policy or DATA_CONFIG["dedupe_policy"]
+    processor = DataProcessor(dedupe_policy=dedupe_policy)
+    json_files = processor.collect_json_files(input_dirs)
+    fingerprint = source_fingerprint([str(f) for f in json_files], salt=dedupe_policy)
+    
+    if not refresh:
+        odds = load_odds_store(store_dir, expected_fingerprint=fingerprint)
+        if odds is not None:
+            return odds
+    
+    odds = processor.process_odds(json_files)
+    if len(odds):
+        save_odds_store(odds, store_dir, source_fingerprint=fingerprint)
+    return odds
+
+
+def iter_matches(input_dirs: List[str]) -> Iterator[MatchData]:
+    """
+    便捷函数：流式读取多个目录的足球数据
+    
+    Args:
+        input_dirs: 输入目录列表
+        
+    Yields:
+        MatchData: 结构化比赛数据
+    """
+    return DataProcessor().iter_matches(input_dirs)
\ No newline at end of file
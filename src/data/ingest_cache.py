@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+增量解析缓存模块
+记录每个原始JSON文件的路径、大小、修改时间和内容哈希，并缓存其解析结果，
+再次运行时只重新解析新增或变化的文件
+"""
+
+import hashlib
+import json
+import os
+import pickle
+from dataclasses import fields
+from pathlib import Path
+from typing import Dict, List, Optional, Any
+
+from ..models.data_models import MatchData
+
+
+# 缓存格式版本，解析逻辑变化时递增以使旧缓存失效
+CACHE_FORMAT_VERSION = 1
+
+MANIFEST_FILE = "manifest.json"
+
+
+def file_sha256(file_path: str, block_size: int = 1 << 20) -> str:
+    """
+    计算文件内容的SHA-256哈希
+
+    Args:
+        file_path: 文件路径
+        block_size: 每次读取的字节数
+
+    Returns:
+        str: 十六进制哈希值
+    """
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as file:
+        for block in iter(lambda: file.read(block_size), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def source_fingerprint(file_paths: List[str], salt: str = "") -> str:
+    """
+    根据文件路径、大小和修改时间计算一组原始文件的指纹（只读取文件元信息，开销很小）
+
+    Args:
+        file_paths: 原始JSON文件路径列表
+        salt: 附加到指纹中的处理参数（如去重策略），参数变化时指纹随之变化
+
+    Returns:
+        str: 指纹字符串，任一文件新增、删除或修改都会改变指纹
+    """
+    digest = hashlib.sha1(salt.encode('utf-8'))
+    for file_path in sorted(os.path.abspath(path) for path in file_paths):
+        stat = os.stat(file_path)
+        digest.update(f"{file_path}|{stat.st_size}|{stat.st_mtime_ns}\n".encode('utf-8'))
+    return digest.hexdigest()
+
+
+def _schema_signature() -> List[str]:
+    """MatchData字段签名，字段变化时缓存自动失效"""
+    return [field.name for field in fields(MatchData)]
+
+
+class IngestCache:
+    """原始数据增量解析缓存"""
+
+    def __init__(self, cache_dir: str):
+        """
+        初始化缓存
+
+        Args:
+            cache_dir: 缓存目录（存放清单文件和每个文件的解析结果）
+        """
+        self.cache_dir = Path(cache_dir)
+        self.manifest_path = self.cache_dir / MANIFEST_FILE
+        self.entries: Dict[str, Dict[str, Any]] = self._load_manifest()
+        self.hits = 0
+        self.misses = 0
+        self.removed = 0
+
+    def _load_manifest(self) -> Dict[str, Dict[str, Any]]:
+        """加载清单文件，版本或数据结构不匹配时视为空缓存"""
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as file:
+                manifest = json.load(file)
+        except (OSError, ValueError):
+            return {}
+
+        if (manifest.get('version') != CACHE_FORMAT_VERSION
+                or manifest.get('schema') != _schema_signature()):
+            print("解析缓存版本已变化，将重新解析全部文件")
+            return {}
+        return manifest.get('files', {})
+
+    @staticmethod
+    def _key(file_path: str) -> str:
+        """清单中使用的文件键（绝对路径）"""
+        return os.path.abspath(file_path)
+
+    def _cache_file(self, key: str) -> Path:
+        """文件解析结果的缓存路径"""
+        name = hashlib.sha1(key.encode('utf-8')).hexdigest()
+        return self.cache_dir / f"{name}.pkl"
+
+    def lookup(self, file_path: str) -> Optional[List[MatchData]]:
+        """
+        查询文件的缓存解析结果
+
+        大小和修改时间未变时直接命中；否则比较内容哈希，内容未变时同样命中。
+
+        Args:
+            file_path: 原始JSON文件路径
+
+        Returns:
+            Optional[List[MatchData]]: 命中时返回解析结果，否则返回None
+        """
+        key = self._key(file_path)
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+
+        stat = os.stat(file_path)
+        if entry['size'] != stat.st_size:
+            return None
+        if entry['mtime_ns'] != stat.st_mtime_ns:
+            # 修改时间变化但内容可能未变（如重新拷贝），以内容哈希为准
+            if entry['sha256'] != file_sha256(file_path):
+                return None
+            entry['mtime_ns'] = stat.st_mtime_ns
+
+        try:
+            with open(self._cache_file(key), 'rb') as file:
+                matches = pickle.load(file)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+            return None
+
+        self.hits += 1
+        return matches
+
+    @staticmethod
+    def fingerprint(file_path: str) -> Dict[str, Any]:
+        """
+        计算文件指纹（大小、修改时间、内容哈希）
+
+        应在解析文件之前调用，保证记录的指纹不晚于解析时读到的内容。
+
+        Args:
+            file_path: 原始JSON文件路径
+
+        Returns:
+            Dict: 文件指纹
+        """
+        stat = os.stat(file_path)
+        return {
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+            'sha256': file_sha256(file_path)
+        }
+
+    def store(self, file_path: str, matches: List[MatchData], fingerprint: Optional[Dict[str, Any]] = None):
+        """
+        记录文件的解析结果
+
+        Args:
+            file_path: 原始JSON文件路径
+            matches: 该文件的解析结果
+            fingerprint: 解析前计算的文件指纹，None时现场计算
+        """
+        key = self._key(file_path)
+        entry = dict(fingerprint or self.fingerprint(file_path))
+        entry['match_count'] = len(matches)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        with open(self._cache_file(key), 'wb') as file:
+            pickle.dump(matches, file, protocol=pickle.HIGHEST_PROTOCOL)
+
+        self.entries[key] = entry
+        self.misses += 1
+
+    def prune(self):
+        """移除已删除的原始文件对应的清单条目和缓存文件"""
+        for key in [key for key in self.entries if not os.path.exists(key)]:
+            del self.entries[key]
+            try:
+                self._cache_file(key).unlink()
+            except OSError:
+                pass
+            self.removed += 1
+
+    def save(self):
+        """保存清单文件（先写临时文件再替换，避免中断时损坏）"""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        manifest = {
+            'version': CACHE_FORMAT_VERSION,
+            'schema': _schema_signature(),
+            'files': self.entries
+        }
+        tmp_path = self.manifest_path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as file:
+            json.dump(manifest, file, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, self.manifest_path)
+
+    def summary(self) -> str:
+        """本次运行的缓存统计"""
+        return f"缓存命中 {self.hits} 个文件，重新解析 {self.misses} 个文件，移除 {self.removed} 个已删除文件"
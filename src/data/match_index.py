@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+比赛去重索引模块
+以match_id为键的哈希索引，在解析合并时以O(1)代价插入或更新比赛，
+重复的比赛按配置的策略保留一条
+"""
+
+from dataclasses import fields
+from typing import Dict, Iterable, List, Optional
+
+from ..models.data_models import MatchData, IN_PLAY_FIELDS
+from ..config.league_coefficients import DATA_CONFIG
+
+
+# 去重策略：latest 保留最后读取的记录，first 保留最先读取的记录，complete 保留数据最完整的记录
+DEDUPE_POLICIES = ('latest', 'first', 'complete')
+
+# 参与完整度计算的统计字段（比分与技术统计，缺失时解析为0）
+_STAT_FIELDS = [field.name for field in fields(MatchData)
+                if field.type in (int, float) and field.name != 'kickoff_ts'
+                and field.name not in IN_PLAY_FIELDS]
+
+
+def completeness(match: MatchData) -> int:
+    """
+    比赛记录的完整度：非零统计字段的个数、已有的比赛进行中快照个数，加上开球时间是否可解析
+
+    Args:
+        match: 比赛数据
+
+    Returns:
+        int: 完整度得分
+    """
+    score = sum(1 for name in _STAT_FIELDS if getattr(match, name))
+    # 比赛进行中的快照缺失时为-1
+    score += sum(1 for name in IN_PLAY_FIELDS if getattr(match, name) >= 0)
+    return score + (1 if match.kickoff_ts else 0)
+
+
+class MatchIndex:
+    """按match_id去重的比赛索引"""
+
+    def __init__(self, policy: Optional[str] = None):
+        """
+        初始化索引
+
+        Args:
+            policy: 去重策略（latest/first/complete），None使用配置默认值
+        """
+        policy = policy or DATA_CONFIG["dedupe_policy"]
+        if policy not in DEDUPE_POLICIES:
+            raise ValueError(f"不支持的去重策略: {policy}，可选: {', '.join(DEDUPE_POLICIES)}")
+        self.policy = policy
+        self._positions: Dict[str, int] = {}
+        self._matches: List[MatchData] = []
+        self.duplicates = 0
+
+    def upsert(self, match: MatchData) -> bool:
+        """
+        插入或按策略更新一场比赛
+
+        没有match_id的记录无法判断重复，总是直接插入。
+
+        Args:
+            match: 比赛数据
+
+        Returns:
+            bool: 该记录是否被保留（新插入或替换了已有记录）
+        """
+        match_id = match.match_id
+        position = self._positions.get(match_id) if match_id else None
+
+        if position is None:
+            if match_id:
+                self._positions[match_id] = len(self._matches)
+            self._matches.append(match)
+            return True
+
+        self.duplicates += 1
+        if self.policy == 'first':
+            return False
+        if self.policy == 'complete' and completeness(match) < completeness(self._matches[position]):
+            return False
+
+        # 原位替换，保持首次出现的位置
+        self._matches[position] = match
+        return True
+
+    def extend(self, matches: Iterable[MatchData]):
+        """批量插入或更新比赛"""
+        for match in matches:
+            self.upsert(match)
+
+    def get(self, match_id: str) -> Optional[MatchData]:
+        """按match_id查找比赛，不存在时返回None"""
+        position = self._positions.get(str(match_id))
+        return self._matches[position] if position is not None else None
+
+    def __contains__(self, match_id: str) -> bool:
+        return str(match_id) in self._positions
+
+    def __len__(self) -> int:
+        return len(self._matches)
+
+    def matches(self) -> List[MatchData]:
+        """去重后的比赛列表（按首次出现的顺序）"""
+        return list(self._matches)
+
+    def summary(self) -> str:
+        """去重统计"""
+        return f"去重: 发现 {self.duplicates} 条重复比赛记录（策略: {self.policy}）"
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+列式二进制比赛数据存储模块
+将结构化比赛数据按列保存为NumPy .npy文件（安装pyarrow时也可保存为Feather），
+加载时数值列以内存映射方式读取，球队和联赛以整数分类编码表示
+"""
+
+import json
+import os
+import time
+from dataclasses import fields
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+import numpy as np
+
+from ..models.data_models import MatchData
+from ..models.match_table import MatchTable
+
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+    _HAS_PYARROW = True
+except ImportError:
+    _HAS_PYARROW = False
+
+
+# 存储格式版本
+STORE_FORMAT_VERSION = 1
+
+META_FILE = "meta.json"
+FEATHER_FILE = "matches.feather"
+
+
+def _schema_signature() -> List[str]:
+    """MatchData字段签名，字段变化时存储自动视为过期"""
+    return [field.name for field in fields(MatchData)]
+
+
+def save_match_store(matches: Union[Iterable[MatchData], MatchTable], store_dir: str, store_format: str = "auto",
+                     source_fingerprint: Optional[str] = None) -> str:
+    """
+    保存列式二进制比赛数据
+
+    Args:
+        matches: 比赛数据列表或MatchTable
+        store_dir: 存储目录
+        store_format: "npy"、"feather" 或 "auto"（安装pyarrow时使用feather）
+        source_fingerprint: 原始数据指纹，用于判断存储是否过期
+
+    Returns:
+        str: 实际使用的存储格式
+    """
+    if store_format == "auto":
+        store_format = "feather" if _HAS_PYARROW else "npy"
+    if store_format == "feather" and not _HAS_PYARROW:
+        raise ImportError("保存Feather格式需要安装pyarrow")
+    if store_format not in ("npy", "feather"):
+        raise ValueError(f"不支持的存储格式: {store_format}")
+
+    match_table = MatchTable.from_matches(matches)
+    columns = match_table.columns
+    store_path = Path(store_dir)
+    store_path.mkdir(parents=True, exist_ok=True)
+
+    # 先删除旧元数据：重写中断时存储视为不存在，而不是由旧元数据指向已删除的列文件
+    meta_path = store_path / META_FILE
+    if meta_path.exists():
+        meta_path.unlink()
+
+    # 清理旧格式文件，避免格式切换后残留
+    for old_file in list(store_path.glob("*.npy")) + [store_path / FEATHER_FILE]:
+        if old_file.exists():
+            old_file.unlink()
+
+    if store_format == "npy":
+        for name, array in columns.items():
+            np.save(store_path / f"{name}.npy", array, allow_pickle=False)
+    else:
+        table = pa.table({name: pa.array(array) for name, array in columns.items()})
+        feather.write_feather(table, str(store_path / FEATHER_FILE), compression='uncompressed')
+
+    n_rows = len(match_table)
+    meta = {
+        'version': STORE_FORMAT_VERSION,
+        'format': store_format,
+        'schema': _schema_signature(),
+        'n_rows': n_rows,
+        'columns': {name: str(array.dtype) for name, array in columns.items()},
+        'categories': match_table.vocabularies,
+        'source_fingerprint': source_fingerprint
+    }
+    # 元数据最后写入，作为存储完整的标志
+    tmp_path = store_path / (META_FILE + ".tmp")
+    with open(tmp_path, 'w', encoding='utf-8') as file:
+        json.dump(meta, file, ensure_ascii=False)
+    os.replace(tmp_path, meta_path)
+
+    print(f"列式数据已保存到: {store_dir} ({store_format}, {n_rows} 场比赛)")
+    return store_format
+
+
+def read_store_meta(store_dir: str) -> Optional[Dict[str, Any]]:
+    """
+    读取存储元数据
+
+    Returns:
+        Optional[Dict]: 元数据，存储不存在或版本不兼容时返回None
+    """
+    try:
+        with open(Path(store_dir) / META_FILE, 'r', encoding='utf-8') as file:
+            meta = json.load(file)
+    except (OSError, ValueError):
+        return None
+
+    if meta.get('version') != STORE_FORMAT_VERSION or meta.get('schema') != _schema_signature():
+        return None
+    return meta
+
+
+def load_match_store(store_dir: str, mmap: bool = True) -> Dict[str, Any]:
+    """
+    加载列式二进制比赛数据
+
+    Args:
+        store_dir: 存储目录
+        mmap: 是否以内存映射方式读取数值列
+
+    Returns:
+        Dict: {'columns': 列名 -> 数组, 'categories': 词表名 -> 取值列表, 'meta': 元数据}
+              球队、联赛以 *_code 整数列表示
+    """
+    meta = read_store_meta(store_dir)
+    if meta is None:
+        raise FileNotFoundError(f"列式数据不存在或版本不兼容: {store_dir}")
+
+    store_path = Path(store_dir)
+    columns: Dict[str, np.ndarray] = {}
+
+    if meta['format'] == "npy":
+        for name in meta['columns']:
+            columns[name] = np.load(store_path / f"{name}.npy", mmap_mode='r' if mmap else None,
+                                    allow_pickle=False)
+    else:
+        if not _HAS_PYARROW:
+            raise ImportError("读取Feather格式需要安装pyarrow")
+        table = feather.read_table(str(store_path / FEATHER_FILE), memory_map=mmap)
+        for name, dtype in meta['columns'].items():
+            column = table.column(name)
+            if np.dtype(dtype).kind == 'U':
+                columns[name] = np.array(column.to_pylist(), dtype=dtype)
+            else:
+                # 无空值的单块数值列可零拷贝映射
+                columns[name] = column.to_numpy()
+
+    return {'columns': columns, 'categories': meta['categories'], 'meta': meta}
+
+
+def store_to_matches(store: Dict[str, Any]) -> List[MatchData]:
+    """
+    将列式数据还原为比赛数据列表
+
+    Args:
+        store: load_match_store的返回值
+
+    Returns:
+        List[MatchData]: 比赛数据列表
+    """
+    return MatchTable.from_store(store).to_matches()
+
+
+def load_table(store_dir: str, expected_fingerprint: Optional[str] = None) -> Optional[MatchTable]:
+    """
+    从列式存储加载比赛数据表（不创建MatchData对象）
+
+    Args:
+        store_dir: 存储目录
+        expected_fingerprint: 期望的原始数据指纹，不一致时视为过期
+
+    Returns:
+        Optional[MatchTable]: 比赛数据表，存储不存在或已过期时返回None
+    """
+    meta = read_store_meta(store_dir)
+    if meta is None:
+        return None
+    if expected_fingerprint is not None and meta.get('source_fingerprint') != expected_fingerprint:
+        print("原始数据已变化，列式数据需要重建")
+        return None
+
+    start = time.perf_counter()
+    table = MatchTable.from_store(load_match_store(store_dir))
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    print(f"从列式存储加载 {len(table)} 场比赛数据 ({elapsed_ms:.1f} ms)")
+    return table
+
+
+def load_matches(store_dir: str, expected_fingerprint: Optional[str] = None) -> Optional[List[MatchData]]:
+    """
+    从列式存储加载比赛数据列表
+
+    Args:
+        store_dir: 存储目录
+        expected_fingerprint: 期望的原始数据指纹，不一致时视为过期
+
+    Returns:
+        Optional[List[MatchData]]: 比赛数据列表，存储不存在或已过期时返回None
+    """
+    table = load_table(store_dir, expected_fingerprint)
+    return table.to_matches() if table is not None else None
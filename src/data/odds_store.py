@@ -0,0 +1,309 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+盘口数据存储模块
+保存每场比赛的初始/开场盘口与水位，以及大小球、让分盘的水位变化序列。
+变化序列以展平的盘口、水位数组加每场比赛的偏移量（ragged array）表示，
+可以在数千场比赛上直接做向量化计算，无需重新读取JSON
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+# 存储格式版本
+ODDS_FORMAT_VERSION = 1
+
+ODDS_DIR = "odds"
+META_FILE = "meta.json"
+
+# 盘口市场：total 为大小球，handicap 为让分盘
+MARKETS = ('total', 'handicap')
+
+# 逐场盘口字段：列名 -> (原始字段名, 类型)，类型 line 为盘口、price 为水位
+SNAPSHOT_FIELDS = {
+    'total_initial_line': ("初始大小球盘口", 'line'),
+    'total_initial_price': ("初始大小球水位", 'price'),
+    'total_opening_line': ("开场大小球盘口", 'line'),
+    'total_opening_price': ("开场大小球水位", 'price'),
+    'handicap_initial_line': ("初始让分盘口", 'line'),
+    'handicap_initial_price': ("初始让分水位", 'price'),
+    'handicap_opening_line': ("开场让分盘口", 'line'),
+    'handicap_opening_price': ("开场让分水位", 'price'),
+}
+
+# 水位变化详情字段
+SERIES_FIELDS = {
+    'total': "大小球水位变化详情",
+    'handicap': "让分盘水位变化详情",
+}
+
+
+class OddsStore:
+    """比赛盘口数据（按match_id索引）"""
+
+    def __init__(self, match_ids: np.ndarray, snapshots: Dict[str, np.ndarray],
+                 series: Dict[str, Dict[str, np.ndarray]]):
+        """
+        初始化盘口数据
+
+        Args:
+            match_ids: 比赛ID数组
+            snapshots: 列名 -> float64数组（缺失为NaN），见SNAPSHOT_FIELDS
+            series: 市场 -> {'line': 展平盘口, 'price': 展平水位, 'offsets': 每场比赛的起始偏移（长度为场数+1）}
+        """
+        self.match_ids = match_ids
+        self.snapshots = snapshots
+        self.series = series
+        self._index = {match_id: i for i, match_id in enumerate(match_ids.tolist())}
+
+    @classmethod
+    def from_parsed(cls, match_ids: Sequence[str], snapshots: Dict[str, Sequence[float]],
+                    ticks: Dict[str, Sequence[Tuple[List[float], List[float]]]]) -> 'OddsStore':
+        """
+        由逐场解析结果构建盘口数据
+
+        Args:
+            match_ids: 比赛ID列表
+            snapshots: 列名 -> 每场比赛的值
+            ticks: 市场 -> 每场比赛的 (盘口列表, 水位列表)
+
+        Returns:
+            OddsStore: 盘口数据
+        """
+        series = {}
+        for market in MARKETS:
+            market_ticks = ticks.get(market, [])
+            counts = np.array([len(lines) for lines, _ in market_ticks], dtype=np.int64)
+            offsets = np.zeros(len(counts) + 1, dtype=np.int64)
+            np.cumsum(counts, out=offsets[1:])
+            series[market] = {
+                'line': np.fromiter((v for lines, _ in market_ticks for v in lines),
+                                    dtype=np.float64, count=int(offsets[-1])),
+                'price': np.fromiter((v for _, prices in market_ticks for v in prices),
+                                     dtype=np.float64, count=int(offsets[-1])),
+                'offsets': offsets
+            }
+
+        return cls(np.array(list(match_ids), dtype=str),
+                   {name: np.array(values, dtype=np.float64) for name, values in snapshots.items()},
+                   series)
+
+    @classmethod
+    def concat(cls, stores: Iterable['OddsStore']) -> 'OddsStore':
+        """
+        按顺序合并多个盘口数据（如逐文件解析的结果）
+
+        Args:
+            stores: 盘口数据列表
+
+        Returns:
+            OddsStore: 合并后的盘口数据
+        """
+        stores = list(stores)
+        if not stores:
+            return empty_odds_store()
+
+        series = {}
+        for market in MARKETS:
+            offsets = [np.zeros(1, dtype=np.int64)]
+            base = 0
+            for store in stores:
+                market_offsets = store.series[market]['offsets']
+                offsets.append(market_offsets[1:] + base)
+                base += int(market_offsets[-1])
+            series[market] = {
+                'line': np.concatenate([store.series[market]['line'] for store in stores]),
+                'price': np.concatenate([store.series[market]['price'] for store in stores]),
+                'offsets': np.concatenate(offsets)
+            }
+
+        return cls(np.concatenate([store.match_ids for store in stores]),
+                   {name: np.concatenate([store.snapshots[name] for store in stores])
+                    for name in SNAPSHOT_FIELDS},
+                   series)
+
+    def take(self, rows: Sequence[int]) -> 'OddsStore':
+        """
+        按行号选取比赛（如去重后保留的行），水位变化序列随之重排
+
+        Args:
+            rows: 行号序列
+
+        Returns:
+            OddsStore: 选取后的盘口数据
+        """
+        rows = np.asarray(rows, dtype=np.int64)
+        series = {}
+        for market in MARKETS:
+            market_series = self.series[market]
+            starts = market_series['offsets'][rows]
+            counts = market_series['offsets'][rows + 1] - starts
+            offsets = np.zeros(len(rows) + 1, dtype=np.int64)
+            np.cumsum(counts, out=offsets[1:])
+            # 每条变化记录在原展平数组中的位置
+            positions = np.repeat(starts - offsets[:-1], counts) + np.arange(offsets[-1])
+            series[market] = {
+                'line': market_series['line'][positions],
+                'price': market_series['price'][positions],
+                'offsets': offsets
+            }
+
+        return OddsStore(self.match_ids[rows], {name: values[rows] for name, values in self.snapshots.items()},
+                         series)
+
+    def __len__(self) -> int:
+        return len(self.match_ids)
+
+    def row(self, match_id: str) -> int:
+        """比赛ID对应的行号，不存在时返回-1"""
+        return self._index.get(str(match_id), -1)
+
+    def align(self, match_ids: Sequence[str]) -> np.ndarray:
+        """
+        将一组比赛ID（如MatchTable的match_id列）映射到盘口数据的行号
+
+        Args:
+            match_ids: 比赛ID序列
+
+        Returns:
+            np.ndarray: 行号数组，没有盘口数据的比赛为-1
+        """
+        index = self._index
+        return np.fromiter((index.get(match_id, -1) for match_id in np.asarray(match_ids).tolist()),
+                           dtype=np.int64, count=len(match_ids))
+
+    def ticks(self, market: str, match_id: str) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        单场比赛的水位变化序列
+
+        Args:
+            market: 'total' 或 'handicap'
+            match_id: 比赛ID
+
+        Returns:
+            Tuple: (盘口数组, 水位数组)，比赛不存在时为空数组
+        """
+        series = self.series[market]
+        i = self.row(match_id)
+        if i < 0:
+            return series['line'][:0], series['price'][:0]
+        start, end = series['offsets'][i], series['offsets'][i + 1]
+        return series['line'][start:end], series['price'][start:end]
+
+    def tick_counts(self, market: str) -> np.ndarray:
+        """每场比赛的水位变化次数"""
+        return np.diff(self.series[market]['offsets'])
+
+    def first_tick(self, market: str, field: str = 'price') -> np.ndarray:
+        """每场比赛的第一条变化记录（没有记录时为NaN）"""
+        return self._pick(market, field, self.series[market]['offsets'][:-1])
+
+    def last_tick(self, market: str, field: str = 'price') -> np.ndarray:
+        """每场比赛的最后一条变化记录（没有记录时为NaN）"""
+        return self._pick(market, field, self.series[market]['offsets'][1:] - 1)
+
+    def tick_mean(self, market: str, field: str = 'price') -> np.ndarray:
+        """每场比赛变化记录的均值（没有记录时为NaN）"""
+        counts = self.tick_counts(market)
+        segments = np.repeat(np.arange(len(counts)), counts)
+        sums = np.bincount(segments, weights=self.series[market][field], minlength=len(counts))
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return np.where(counts > 0, sums / counts, np.nan)
+
+    def movement(self, market: str, field: str = 'price') -> np.ndarray:
+        """每场比赛从第一条到最后一条变化记录的变动量"""
+        return self.last_tick(market, field) - self.first_tick(market, field)
+
+    def _pick(self, market: str, field: str, positions: np.ndarray) -> np.ndarray:
+        """按位置取值，没有变化记录的比赛为NaN"""
+        values = self.series[market][field]
+        has_ticks = self.tick_counts(market) > 0
+        result = np.full(len(positions), np.nan)
+        result[has_ticks] = values[positions[has_ticks]]
+        return result
+
+
+def empty_odds_store() -> OddsStore:
+    """空盘口数据"""
+    return OddsStore.from_parsed([], {name: [] for name in SNAPSHOT_FIELDS}, {})
+
+
+def _column_files(odds: OddsStore) -> Dict[str, np.ndarray]:
+    """盘口数据的全部数组：文件名 -> 数组"""
+    arrays = {'match_id': odds.match_ids}
+    arrays.update(odds.snapshots)
+    for market, series in odds.series.items():
+        for name, array in series.items():
+            arrays[f"{market}_{name}"] = array
+    return arrays
+
+
+def save_odds_store(odds: OddsStore, store_dir: str, source_fingerprint: Optional[str] = None):
+    """
+    保存盘口数据（与列式比赛数据放在同一存储目录下的odds子目录）
+
+    Args:
+        odds: 盘口数据
+        store_dir: 列式存储目录
+        source_fingerprint: 原始数据指纹，用于判断存储是否过期
+    """
+    odds_path = Path(store_dir) / ODDS_DIR
+    odds_path.mkdir(parents=True, exist_ok=True)
+
+    arrays = _column_files(odds)
+    for name, array in arrays.items():
+        np.save(odds_path / f"{name}.npy", array, allow_pickle=False)
+
+    meta = {
+        'version': ODDS_FORMAT_VERSION,
+        'n_rows': len(odds),
+        'arrays': sorted(arrays),
+        'source_fingerprint': source_fingerprint
+    }
+    # 元数据最后写入，作为存储完整的标志
+    tmp_path = odds_path / (META_FILE + ".tmp")
+    with open(tmp_path, 'w', encoding='utf-8') as file:
+        json.dump(meta, file, ensure_ascii=False)
+    os.replace(tmp_path, odds_path / META_FILE)
+
+    print(f"盘口数据已保存到: {odds_path} ({len(odds)} 场比赛)")
+
+
+def load_odds_store(store_dir: str, expected_fingerprint: Optional[str] = None,
+                    mmap: bool = True) -> Optional[OddsStore]:
+    """
+    加载盘口数据
+
+    Args:
+        store_dir: 列式存储目录
+        expected_fingerprint: 期望的原始数据指纹，不一致时视为过期
+        mmap: 是否以内存映射方式读取数组
+
+    Returns:
+        Optional[OddsStore]: 盘口数据，存储不存在、版本不兼容或已过期时返回None
+    """
+    odds_path = Path(store_dir) / ODDS_DIR
+    try:
+        with open(odds_path / META_FILE, 'r', encoding='utf-8') as file:
+            meta = json.load(file)
+    except (OSError, ValueError):
+        return None
+
+    if meta.get('version') != ODDS_FORMAT_VERSION:
+        return None
+    if expected_fingerprint is not None and meta.get('source_fingerprint') != expected_fingerprint:
+        print("原始数据已变化，盘口数据需要重建")
+        return None
+
+    def load(name: str) -> np.ndarray:
+        return np.load(odds_path / f"{name}.npy", mmap_mode='r' if mmap else None, allow_pickle=False)
+
+    series = {market: {name: load(f"{market}_{name}") for name in ('line', 'price', 'offsets')}
+              for market in MARKETS}
+    return OddsStore(np.load(odds_path / "match_id.npy", allow_pickle=False),
+                     {name: load(name) for name in SNAPSHOT_FIELDS}, series)
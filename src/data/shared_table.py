@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+共享内存数据表模块
+将一组数组（如MatchTable的全部列）复制到一块共享内存，子进程只需接收很小的描述信息（块名称、各数组偏移与类型），
+即可直接映射出同一份数组，不需要序列化比赛列表
+"""
+
+from multiprocessing import shared_memory
+from typing import Any, Dict, Tuple
+
+import numpy as np
+
+from ..models.match_table import MatchTable
+
+
+# 各数组在共享内存中的起始偏移按此字节数对齐
+_ALIGNMENT = 64
+
+
+class SharedArrays:
+    """放入共享内存的一组数组（创建方负责释放）"""
+
+    def __init__(self, arrays: Dict[str, np.ndarray]):
+        """
+        将数组复制到一块新的共享内存
+
+        Args:
+            arrays: 名称 -> 数组（任意形状，数值或定长字符串类型）
+        """
+        layout = []
+        size = 0
+        for name, array in arrays.items():
+            array = np.ascontiguousarray(array)
+            layout.append((name, array.dtype.str, array.shape, size))
+            size += -(-array.nbytes // _ALIGNMENT) * _ALIGNMENT
+
+        self._shm = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        for name, dtype, shape, offset in layout:
+            np.ndarray(shape, dtype=dtype, buffer=self._shm.buf, offset=offset)[...] = arrays[name]
+
+        self.spec: Dict[str, Any] = {'name': self._shm.name, 'layout': layout}
+
+    @staticmethod
+    def attach(spec: Dict[str, Any]) -> Tuple[shared_memory.SharedMemory, Dict[str, np.ndarray]]:
+        """
+        按描述信息映射共享内存中的数组（在子进程中调用）
+
+        Args:
+            spec: SharedArrays.spec
+
+        Returns:
+            Tuple: (共享内存对象, 名称 -> 数组)；数组直接引用共享内存，使用期间需保留共享内存对象
+        """
+        shm = shared_memory.SharedMemory(name=spec['name'])
+        arrays = {name: np.ndarray(shape, dtype=dtype, buffer=shm.buf, offset=offset)
+                  for name, dtype, shape, offset in spec['layout']}
+        return shm, arrays
+
+    def close(self):
+        """释放共享内存"""
+        if self._shm is not None:
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
+
+    def __enter__(self) -> 'SharedArrays':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class SharedMatchTable(SharedArrays):
+    """放入共享内存的数据表（创建方负责释放）"""
+
+    def __init__(self, table: MatchTable):
+        """
+        将数据表的各列复制到一块新的共享内存
+
+        Args:
+            table: 比赛数据表
+        """
+        super().__init__(table.columns)
+        self.spec['vocabularies'] = table.vocabularies
+
+    @staticmethod
+    def attach(spec: Dict[str, Any]) -> Tuple[shared_memory.SharedMemory, MatchTable]:
+        """
+        按描述信息映射共享内存中的数据表（在子进程中调用）
+
+        Args:
+            spec: SharedMatchTable.spec
+
+        Returns:
+            Tuple: (共享内存对象, 数据表)；数据表的数组直接引用共享内存，使用期间需保留共享内存对象
+        """
+        shm, columns = SharedArrays.attach(spec)
+        return shm, MatchTable(columns, spec['vocabularies'])
@@ -13,36 +13,91 @@ import argparse
 # 添加src目录到Python路径
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
-from src.data.data_processor import process_football_data
+from src.data.data_processor import process_football_data, load_football_data
+from src.data.match_index import DEDUPE_POLICIES
 from src.trainers.baseline_trainer import BaselineTrainer, train_baselines_from_directories
-from src.predictors.football_predictor import FootballPredictor
-from src.models.data_models import MatchData, PredictionResult
+from src.trainers.backtester import WalkForwardBacktester, BACKTEST_PERIODS
+from src.trainers.tuner import HyperparameterTuner, apply_data_config
+from src.predictors.football_predictor import FootballPredictor, STATS_MODES
+from src.predictors.batch_engine import BatchPredictionEngine, to_prediction_results
+from src.predictors.coefficient_table import default_baselines_file
+from src.models.data_models import MatchData, PredictionResult, MatchProbabilities
+from src.models.match_table import MatchTable
+from src.config.league_coefficients import DATA_CONFIG
+
+
+def configure_model_files(baselines_file: Optional[str] = None, data_config: Optional[str] = None):
+    """
+    选择预测使用的联赛系数文件与全局参数文件（需在创建预测器之前调用）
+    
+    Args:
+        baselines_file: 联赛系数文件（如调参得到的tuned_baselines.json），None使用配置默认值
+        data_config: 全局参数文件（调参得到的 *_data_config.json），None保持当前配置
+    """
+    if baselines_file:
+        DATA_CONFIG["baselines_file"] = os.path.abspath(baselines_file)
+    if data_config:
+        apply_data_config(data_config)
 
 
 class FootballAnalysisSystem:
     """足球数据分析系统主类"""
     
-    def __init__(self, data_dirs: List[str] = None):
+    def __init__(self, data_dirs: List[str] = None, workers: Optional[int] = None,
+                 cache_dir: Optional[str] = None, store_dir: Optional[str] = None,
+                 dedupe_policy: Optional[str] = None, stats_mode: Optional[str] = None):
         """
         初始化系统
         
         Args:
             data_dirs: 数据目录列表
+            workers: 解析原始数据的并行进程数，None使用配置默认值
+            cache_dir: 增量解析缓存目录，None表示每次全量解析
+            store_dir: 列式二进制存储目录，提供时优先从存储加载
+            dedupe_policy: 重复比赛ID的保留策略（latest/first/complete），None使用配置默认值
+            stats_mode: 球队统计方式（window/ewma），None使用配置默认值
         """
         self.data_dirs = data_dirs or ['2021', '2023']
-        self.matches = []
-        self.trained_baselines = {}
+        self.workers = workers
+        self.cache_dir = cache_dir
+        self.store_dir = store_dir
+        self.dedupe_policy = dedupe_policy
+        self.stats_mode = stats_mode
         self.predictor = None
+        self.matches = MatchTable.from_matches([])  # 数组化的比赛数据表
+        self.trained_baselines = {}
+    
+    @property
+    def matches(self) -> MatchTable:
+        """比赛数据表"""
+        return self._matches
+    
+    @matches.setter
+    def matches(self, matches: MatchTable):
+        """替换比赛数据时清空预测器的球队统计缓存"""
+        self._matches = matches
+        if self.predictor:
+            self.predictor.team_stats_cache.clear()
         
-    def load_and_process_data(self, output_file: str = "processed_training_data.csv"):
+    def load_and_process_data(self, output_file: str = "processed_training_data.csv",
+                              workers: Optional[int] = None):
         """
         加载并处理训练数据
         
         Args:
             output_file: 处理后数据的输出文件
+            workers: 并行解析的进程数，None时使用初始化时的配置
         """
         print("=== 开始加载和处理数据 ===")
-        self.matches = process_football_data(self.data_dirs, output_file)
+        workers = self.workers if workers is None else workers
+        if self.store_dir:
+            self.matches = load_football_data(self.data_dirs, self.store_dir, output_file,
+                                              workers=workers, cache_dir=self.cache_dir, as_table=True,
+                                              dedupe_policy=self.dedupe_policy)
+        else:
+            self.matches = MatchTable.from_matches(
+                process_football_data(self.data_dirs, output_file, workers=workers, cache_dir=self.cache_dir,
+                                      dedupe_policy=self.dedupe_policy))
         
         if not self.matches:
             raise ValueError("未能加载任何有效数据")
@@ -50,20 +105,23 @@ class FootballAnalysisSystem:
         print(f"成功加载 {len(self.matches)} 场比赛数据")
         return self.matches
     
-    def train_baselines(self, output_file: str = "trained_baselines.json"):
+    def train_baselines(self, output_file: Optional[str] = None, bootstrap_resamples: Optional[int] = None,
+                        seed: Optional[int] = None):
         """
         训练联赛基线参数
         
         Args:
-            output_file: 基线参数输出文件
+            output_file: 基线参数输出文件，None使用预测器默认加载的基线文件（相对项目根目录）
+            bootstrap_resamples: 自助法置信区间的重抽样次数，None使用配置默认值，0表示不计算
+            seed: 自助法随机种子
         """
         print("\n=== 开始训练基线参数 ===")
         if not self.matches:
             self.load_and_process_data()
         
         trainer = BaselineTrainer()
-        self.trained_baselines = trainer.train_from_matches(self.matches)
-        trainer.save_baselines(self.trained_baselines, output_file)
+        self.trained_baselines = trainer.train_from_matches(self.matches, bootstrap_resamples, seed=seed)
+        trainer.save_baselines(self.trained_baselines, output_file or default_baselines_file())
         
         return self.trained_baselines
     
@@ -75,7 +133,7 @@ class FootballAnalysisSystem:
             league: 联赛名称
         """
         print(f"\n=== 初始化 {league} 联赛预测器 ===")
-        self.predictor = FootballPredictor(league=league)
+        self.predictor = FootballPredictor(league=league, stats_mode=self.stats_mode)
         return self.predictor
     
     def predict_single_match(self, home_team: str, away_team: str, 
@@ -143,29 +201,91 @@ class FootballAnalysisSystem:
         if not self.predictor:
             self.initialize_predictor(league)
         
-        results = []
-        for home_team, away_team in match_pairs:
-            result = self.predict_single_match(home_team, away_team, league)
-            results.append(result)
+        if not self.matches:
+            self.load_and_process_data()
         
-        return results
+        # 整批比赛按球队编码向量化预测（比赛字段使用与单场预测相同的默认值）
+        home_codes = [self.matches.team_code(home_team) for home_team, _ in match_pairs]
+        away_codes = [self.matches.team_code(away_team) for _, away_team in match_pairs]
+        predictions = BatchPredictionEngine(self.predictor).predict(self.matches, home_codes, away_codes)
+        return to_prediction_results(predictions)
     
-    def cross_validation_evaluation(self, k_folds: int = 5):
+    def predict_match_probabilities(self, home_team: str, away_team: str,
+                                    league: str = "中超") -> MatchProbabilities:
+        """
+        预测单场比赛的胜平负、大小球、两队都进球概率
+        
+        Args:
+            home_team: 主队名称
+            away_team: 客队名称
+            league: 联赛名称
+            
+        Returns:
+            MatchProbabilities: 概率预测
+        """
+        result = self.predict_single_match(home_team, away_team, league)
+        return self.predictor.predict_probabilities([result])[0]
+    
+    def cross_validation_evaluation(self, k_folds: int = 5, workers: Optional[int] = None,
+                                    seed: Optional[int] = None):
         """
         进行交叉验证评估
         
         Args:
             k_folds: 折数
+            workers: 并行运行各折的进程数，None使用配置默认值，<=0表示使用全部CPU核心
+            seed: 随机种子，None使用NumPy全局随机状态
         """
         print("\n=== 开始交叉验证评估 ===")
         if not self.matches:
             self.load_and_process_data()
         
         trainer = BaselineTrainer()
-        metrics = trainer.cross_validate(self.matches, k_folds)
+        metrics = trainer.cross_validate(self.matches, k_folds, workers=workers, seed=seed)
         
         return metrics
     
+    def walk_forward_backtest(self, period: str = 'day'):
+        """
+        按时间顺序逐期回测（每场比赛只使用之前的数据预测）
+        
+        Args:
+            period: 回测周期（day/week）
+            
+        Returns:
+            Dict: 回测结果，见WalkForwardBacktester.run
+        """
+        print("\n=== 开始逐期回测 ===")
+        if not self.matches:
+            self.load_and_process_data()
+        
+        backtester = WalkForwardBacktester(period, stats_mode=self.stats_mode)
+        return backtester.run(self.matches)
+    
+    def tune_hyperparameters(self, output_file: str = "tuned_baselines.json", n_samples: int = 0,
+                             seed: Optional[int] = None, period: str = 'day', workers: Optional[int] = None):
+        """
+        搜索统计窗口、预测范围与各联赛系数
+        
+        Args:
+            output_file: 调优后的联赛系数输出文件（全局参数保存在同名的 _data_config.json 中）
+            n_samples: 随机抽取的全局参数组合数，<=0表示完整网格搜索
+            seed: 随机抽样的种子
+            period: 评估使用的回测周期（day/week）
+            workers: 并行进程数，None使用配置默认值
+            
+        Returns:
+            Dict: 搜索结果，见HyperparameterTuner.tune
+        """
+        print("\n=== 开始超参数搜索 ===")
+        if not self.matches:
+            self.load_and_process_data()
+        
+        tuner = HyperparameterTuner(period=period, workers=workers)
+        result = tuner.tune(self.matches, n_samples=n_samples, seed=seed)
+        tuner.save_results(result, output_file)
+        return result
+    
     def interactive_prediction(self):
         """交互式预测模式"""
         print("\n=== 交互式预测模式 ===")
@@ -202,7 +322,7 @@ class FootballAnalysisSystem:
 def main():
     """主函数"""
     parser = argparse.ArgumentParser(description='足球数据分析预测系统')
-    parser.add_argument('--mode', choices=['train', 'predict', 'evaluate', 'interactive'], 
+    parser.add_argument('--mode', choices=['train', 'predict', 'evaluate', 'backtest', 'tune', 'interactive'], 
                        default='interactive', help='运行模式')
     parser.add_argument('--data-dirs', nargs='+', default=['2021', '2023'], 
                        help='数据目录')
@@ -210,17 +330,45 @@ def main():
     parser.add_argument('--home-team', help='主队名称（预测模式）')
     parser.add_argument('--away-team', help='客队名称（预测模式）')
     parser.add_argument('--k-folds', type=int, default=5, help='交叉验证折数')
+    parser.add_argument('--cv-workers', type=int, default=None,
+                       help='并行运行交叉验证各折的进程数（<=0表示使用全部CPU核心，默认使用配置）')
+    parser.add_argument('--seed', type=int, default=None, help='交叉验证、自助法或随机超参数搜索的随机种子')
+    parser.add_argument('--bootstrap-resamples', type=int, default=None,
+                       help='训练时计算联赛系数置信区间的自助法重抽样次数（训练模式，0表示不计算，默认使用配置）')
+    parser.add_argument('--tune-samples', type=int, default=0,
+                       help='随机搜索的全局参数组合数（调参模式，<=0表示完整网格搜索）')
+    parser.add_argument('--tune-workers', type=int, default=None,
+                       help='并行超参数搜索的进程数（<=0表示使用全部CPU核心，默认使用配置）')
+    parser.add_argument('--period', choices=list(BACKTEST_PERIODS), default='day',
+                       help='逐期回测的周期（回测模式）')
+    parser.add_argument('--workers', type=int, default=None,
+                       help='并行解析数据的进程数（<=0表示使用全部CPU核心）')
+    parser.add_argument('--cache-dir', default=None,
+                       help='增量解析缓存目录（只重新解析新增或变化的数据文件）')
+    parser.add_argument('--store-dir', default=None,
+                       help='列式二进制数据目录（原始数据未变化时直接加载）')
+    parser.add_argument('--dedupe-policy', choices=list(DEDUPE_POLICIES), default=None,
+                       help='重复比赛ID的保留策略（默认使用配置）')
+    parser.add_argument('--stats-mode', choices=list(STATS_MODES), default=None,
+                       help='球队统计方式：window 最近N场均值，ewma 指数加权移动平均（默认使用配置）')
+    parser.add_argument('--baselines-file', default=None,
+                       help='联赛系数文件（如调参得到的tuned_baselines.json，训练模式写入该文件，默认使用配置）')
+    parser.add_argument('--data-config', default=None,
+                       help='调参得到的全局参数文件（*_data_config.json），应用于统计窗口与预测范围')
     
     args = parser.parse_args()
+    configure_model_files(args.baselines_file, args.data_config)
     
     # 创建系统实例
-    system = FootballAnalysisSystem(data_dirs=args.data_dirs)
+    system = FootballAnalysisSystem(data_dirs=args.data_dirs, workers=args.workers,
+                                    cache_dir=args.cache_dir, store_dir=args.store_dir,
+                                    dedupe_policy=args.dedupe_policy, stats_mode=args.stats_mode)
     
     try:
         if args.mode == 'train':
             # 训练模式
             system.load_and_process_data()
-            system.train_baselines()
+            system.train_baselines(bootstrap_resamples=args.bootstrap_resamples, seed=args.seed)
             print("\n训练完成！")
             
         elif args.mode == 'predict':
@@ -229,14 +377,29 @@ def main():
                 result = system.predict_single_match(args.home_team, args.away_team, args.league)
                 print(f"\n{args.home_team} vs {args.away_team} 预测结果:")
                 print(result)
+                print(system.predictor.predict_probabilities([result])[0])
             else:
                 print("预测模式需要指定 --home-team 和 --away-team 参数")
                 
         elif args.mode == 'evaluate':
             # 评估模式
-            metrics = system.cross_validation_evaluation(args.k_folds)
+            metrics = system.cross_validation_evaluation(args.k_folds, workers=args.cv_workers, seed=args.seed)
             print(f"\n评估完成，平均MAE: {metrics['avg_MAE_goals']:.3f}")
             
+        elif args.mode == 'backtest':
+            # 逐期回测模式
+            result = system.walk_forward_backtest(args.period)
+            for period in result['periods']:
+                print(f"{period['period']}  比赛: {period['matches']:4d}  进球MAE: {period['MAE_goals']:.3f}  "
+                      f"角球MAE: {period['total_corners_MAE']:.3f}  准确率: {period['accuracy_direction']:.3f}  "
+                      f"Brier: {period['brier_1x2']:.3f}")
+            
+        elif args.mode == 'tune':
+            # 超参数搜索模式
+            result = system.tune_hyperparameters(n_samples=args.tune_samples, seed=args.seed,
+                                                 period=args.period, workers=args.tune_workers)
+            print(f"\n搜索完成，目标值: {result['current']['objective']:.3f} -> {result['best']['objective']:.3f}")
+            
         elif args.mode == 'interactive':
             # 交互模式
             system.load_and_process_data()
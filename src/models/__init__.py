@@ -4,6 +4,8 @@
 数据模型模块初始化文件
 """
 
-from .data_models import TeamStats, MatchData, PredictionResult, RawMatchData
+from .data_models import TeamStats, MatchData, PredictionResult, MatchProbabilities, RawMatchData
+from .match_table import MatchTable, MatchRow
 
-__all__ = ['TeamStats', 'MatchData', 'PredictionResult', 'RawMatchData']
\ No newline at end of file
+__all__ = ['TeamStats', 'MatchData', 'PredictionResult', 'MatchProbabilities', 'RawMatchData',
+           'MatchTable', 'MatchRow']
\ No newline at end of file
@@ -26,6 +26,24 @@ class TeamStats:
     avg_red_cards: float             # 场均红牌数
     total_matches: int               # 统计的比赛场数
     
+    @classmethod
+    def default(cls, team_name: str, total_matches: int = 0) -> 'TeamStats':
+        """历史数据不足时使用的默认统计数据"""
+        return cls(
+            team_name=team_name,
+            avg_goals_scored=1.0,
+            avg_goals_conceded=1.0,
+            avg_shots=10.0,
+            avg_shots_on_target=3.0,
+            avg_possession=50.0,
+            avg_pass_success_rate=80.0,
+            avg_fouls=12.0,
+            avg_corners=5.0,
+            avg_yellow_cards=2.0,
+            avg_red_cards=0.1,
+            total_matches=total_matches
+        )
+    
     def to_dict(self) -> Dict[str, Any]:
         """转换为字典格式"""
         return {
@@ -44,6 +62,11 @@ class TeamStats:
         }
 
 
+# 比赛进行中的比分/角球快照字段（缺失时为-1）
+IN_PLAY_FIELDS = ('home_goals_15min', 'away_goals_15min', 'home_half_goals', 'away_half_goals',
+                  'home_half_corners', 'away_half_corners')
+
+
 @dataclass
 class MatchData:
     """单场比赛基础数据"""
@@ -70,6 +93,13 @@ class MatchData:
     away_corners: int                # 客队角球数
     home_red_cards: int              # 主队红牌数
     away_red_cards: int              # 客队红牌数
+    kickoff_ts: int = 0              # 开球时间（Unix时间戳，秒；0表示未知）
+    home_goals_15min: int = -1       # 开场15分钟时主队进球数（-1表示无数据，下同）
+    away_goals_15min: int = -1       # 开场15分钟时客队进球数
+    home_half_goals: int = -1        # 半场主队进球数
+    away_half_goals: int = -1        # 半场客队进球数
+    home_half_corners: int = -1      # 半场主队角球数
+    away_half_corners: int = -1      # 半场客队角球数
     
     def to_dict(self) -> Dict[str, Any]:
         """转换为字典格式"""
@@ -96,7 +126,14 @@ class MatchData:
             'home_corners': self.home_corners,
             'away_corners': self.away_corners,
             'home_red_cards': self.home_red_cards,
-            'away_red_cards': self.away_red_cards
+            'away_red_cards': self.away_red_cards,
+            'kickoff_ts': self.kickoff_ts,
+            'home_goals_15min': self.home_goals_15min,
+            'away_goals_15min': self.away_goals_15min,
+            'home_half_goals': self.home_half_goals,
+            'away_half_goals': self.away_half_goals,
+            'home_half_corners': self.home_half_corners,
+            'away_half_corners': self.away_half_corners
         }
 
 
@@ -141,6 +178,37 @@ class PredictionResult:
 总黄牌数: {self.total_yellow_cards:.1f}"""
 
 
+@dataclass
+class MatchProbabilities:
+    """比分概率预测结果（由比分概率矩阵推导）"""
+    home_win_probability: float      # 主胜概率
+    draw_probability: float          # 平局概率
+    away_win_probability: float      # 客胜概率
+    over_probability: float          # 总进球大于盘口的概率
+    under_probability: float         # 总进球小于盘口的概率
+    both_teams_score_probability: float  # 两队都进球的概率
+    total_goals_line: float          # 大小球盘口
+    
+    def to_dict(self) -> Dict[str, float]:
+        """转换为字典格式"""
+        return {
+            'home_win_probability': self.home_win_probability,
+            'draw_probability': self.draw_probability,
+            'away_win_probability': self.away_win_probability,
+            'over_probability': self.over_probability,
+            'under_probability': self.under_probability,
+            'both_teams_score_probability': self.both_teams_score_probability,
+            'total_goals_line': self.total_goals_line
+        }
+    
+    def __str__(self) -> str:
+        """格式化输出概率预测"""
+        return f"""概率预测:
+主胜/平/客胜: {self.home_win_probability:.1%} / {self.draw_probability:.1%} / {self.away_win_probability:.1%}
+大于/小于{self.total_goals_line}球: {self.over_probability:.1%} / {self.under_probability:.1%}
+两队都进球: {self.both_teams_score_probability:.1%}"""
+
+
 @dataclass
 class RawMatchData:
     """原始比赛数据结构（用于解析JSON数据）"""
@@ -149,6 +217,8 @@ class RawMatchData:
     date: str
     home_team: str
     away_team: str
+    date1: str = ""
+    first_15min_score: str = ""
     half_time_score: str = ""
     full_time_score: str = ""
     shots: str = "0/0"
@@ -0,0 +1,334 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+数组化比赛数据表
+每个MatchData字段对应一个NumPy数组，球队和联赛以整数编码存储，
+并提供兼容MatchData属性访问的轻量行视图。
+数据表按开球时间升序（稳定）排列，时间区间查询使用二分查找，最近N场查询直接切片
+"""
+
+import itertools
+from dataclasses import fields
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Union
+
+import numpy as np
+
+from .data_models import MatchData
+from .team_index import TeamIndex
+
+
+# 以分类编码存储的字符串字段：字段名 -> 词表名（主客队共用同一张球队词表）
+CATEGORICAL_FIELDS = {
+    'league': 'league',
+    'home_team': 'team',
+    'away_team': 'team',
+}
+
+_NUMERIC_DTYPES = {int: np.int32, float: np.float64}
+
+# 需要更宽类型的数值字段
+_FIELD_DTYPES = {'kickoff_ts': np.int64}
+
+# 每个数据表实例的唯一版本号，用于缓存失效判断
+_table_versions = itertools.count(1)
+
+
+def code_column(name: str) -> str:
+    """分类字段对应的编码列名，如 home_team -> home_team_code"""
+    return f"{name}_code"
+
+
+class MatchRow:
+    """比赛数据表的行视图，提供与MatchData相同的属性访问接口"""
+
+    __slots__ = ('_table', '_index')
+
+    def __init__(self, table: 'MatchTable', index: int):
+        self._table = table
+        self._index = index
+
+    def __getattr__(self, name: str) -> Any:
+        table = self._table
+        vocab_name = CATEGORICAL_FIELDS.get(name)
+        if vocab_name is not None:
+            code = int(table.columns[code_column(name)][self._index])
+            return table.vocabularies[vocab_name][code]
+        column = table.columns.get(name)
+        if column is None:
+            raise AttributeError(name)
+        return column[self._index].item()
+
+    def to_match_data(self) -> MatchData:
+        """转换为独立的MatchData对象"""
+        return MatchData(*(getattr(self, field.name) for field in fields(MatchData)))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """转换为字典格式"""
+        return self.to_match_data().to_dict()
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, (MatchRow, MatchData)):
+            return self.to_dict() == other.to_dict()
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"MatchRow({self.home_team} vs {self.away_team}, {self.date})"
+
+
+class MatchTable:
+    """数组化比赛数据表"""
+
+    def __init__(self, columns: Dict[str, np.ndarray], vocabularies: Dict[str, List[str]]):
+        """
+        初始化数据表
+
+        Args:
+            columns: 列名 -> 数组（分类字段以 *_code 整数列表示）
+            vocabularies: 词表名（team/league） -> 取值列表
+        """
+        self.columns = columns
+        self.vocabularies = {name: list(values) for name, values in vocabularies.items()}
+        self.vocabularies.setdefault('team', [])
+        self.vocabularies.setdefault('league', [])
+        self._code_lookup = {name: {value: code for code, value in enumerate(values)}
+                             for name, values in self.vocabularies.items()}
+        self._size = len(columns[code_column('home_team')]) if columns else 0
+        self._id_index: Optional[Dict[str, int]] = None
+        self._derived: Dict[str, Any] = {}
+        self.version = next(_table_versions)
+
+    # ------------------------------------------------------------------
+    # 构造与转换
+    # ------------------------------------------------------------------
+    @classmethod
+    def from_matches(cls, matches: Iterable[Any]) -> 'MatchTable':
+        """
+        从MatchData（或具有相同属性的对象）列表构建数据表，并按开球时间稳定排序
+
+        Args:
+            matches: 比赛数据列表
+
+        Returns:
+            MatchTable: 数据表
+        """
+        if isinstance(matches, MatchTable):
+            return matches
+
+        matches = list(matches)
+        columns: Dict[str, np.ndarray] = {}
+        vocabularies: Dict[str, List[str]] = {'team': [], 'league': []}
+        lookups: Dict[str, Dict[str, int]] = {'team': {}, 'league': {}}
+
+        for field in fields(MatchData):
+            values = [getattr(match, field.name) for match in matches]
+
+            if field.name in CATEGORICAL_FIELDS:
+                vocab_name = CATEGORICAL_FIELDS[field.name]
+                lookup = lookups[vocab_name]
+                vocab = vocabularies[vocab_name]
+                codes = np.empty(len(values), dtype=np.int32)
+                for i, value in enumerate(values):
+                    code = lookup.get(value)
+                    if code is None:
+                        code = lookup[value] = len(vocab)
+                        vocab.append(value)
+                    codes[i] = code
+                columns[code_column(field.name)] = codes
+            elif field.type in _NUMERIC_DTYPES:
+                dtype = _FIELD_DTYPES.get(field.name, _NUMERIC_DTYPES[field.type])
+                columns[field.name] = np.array(values, dtype=dtype)
+            else:
+                columns[field.name] = np.array(values, dtype=str)
+
+        kickoff = columns['kickoff_ts']
+        if len(kickoff) > 1 and (np.diff(kickoff) < 0).any():
+            order = np.argsort(kickoff, kind='stable')
+            columns = {name: column[order] for name, column in columns.items()}
+
+        return cls(columns, vocabularies)
+
+    @classmethod
+    def from_store(cls, store: Dict[str, Any]) -> 'MatchTable':
+        """
+        从列式存储（load_match_store的返回值）构建数据表，不复制数值列
+
+        Args:
+            store: {'columns': ..., 'categories': ...}
+
+        Returns:
+            MatchTable: 数据表
+        """
+        return cls(dict(store['columns']), store['categories'])
+
+    def to_matches(self) -> List[MatchData]:
+        """转换为MatchData列表"""
+        field_values = []
+        for field in fields(MatchData):
+            vocab_name = CATEGORICAL_FIELDS.get(field.name)
+            if vocab_name is not None:
+                vocab = self.vocabularies[vocab_name]
+                field_values.append([vocab[code] for code in self.columns[code_column(field.name)].tolist()])
+            else:
+                field_values.append(self.columns[field.name].tolist())
+        return [MatchData(*row) for row in zip(*field_values)]
+
+    def take(self, indices: Union[np.ndarray, List[int], slice]) -> 'MatchTable':
+        """
+        按下标选取子表（共享球队、联赛词表）
+
+        子表保持给定的下标顺序；只有下标升序时子表才仍按开球时间排序，
+        between/latest 等时间查询才有意义。
+
+        Args:
+            indices: 下标数组、布尔掩码或切片
+
+        Returns:
+            MatchTable: 子表
+        """
+        return MatchTable({name: column[indices] for name, column in self.columns.items()},
+                          self.vocabularies)
+
+    # ------------------------------------------------------------------
+    # 序列接口（兼容List[MatchData]的用法）
+    # ------------------------------------------------------------------
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[MatchRow]:
+        for i in range(self._size):
+            yield MatchRow(self, i)
+
+    def __getitem__(self, item: Union[int, slice, np.ndarray, List[int]]) -> Union[MatchRow, 'MatchTable']:
+        if isinstance(item, (int, np.integer)):
+            index = int(item)
+            if index < 0:
+                index += self._size
+            if not 0 <= index < self._size:
+                raise IndexError("比赛数据表下标越界")
+            return MatchRow(self, index)
+        return self.take(item)
+
+    def row(self, index: int) -> MatchRow:
+        """获取行视图"""
+        return self[index]
+
+    # ------------------------------------------------------------------
+    # 按比赛ID查找
+    # ------------------------------------------------------------------
+    def row_of(self, match_id: str) -> int:
+        """
+        比赛ID对应的行号（首次查找时建立哈希索引，之后为O(1)）
+
+        Args:
+            match_id: 比赛ID
+
+        Returns:
+            int: 行号，不存在时返回-1（ID重复时为最后一行）
+        """
+        if self._id_index is None:
+            self._id_index = {value: i for i, value in enumerate(self.columns['match_id'].tolist())}
+        return self._id_index.get(str(match_id), -1)
+
+    def find(self, match_id: str) -> Optional[MatchRow]:
+        """按比赛ID查找比赛，不存在时返回None"""
+        index = self.row_of(match_id)
+        return MatchRow(self, index) if index >= 0 else None
+
+    # ------------------------------------------------------------------
+    # 时间查询（依赖按开球时间升序排列）
+    # ------------------------------------------------------------------
+    def time_range(self, start_ts: Optional[int] = None, end_ts: Optional[int] = None) -> slice:
+        """
+        开球时间在 [start_ts, end_ts) 内的比赛所在的行区间（二分查找）
+
+        Args:
+            start_ts: 起始时间戳（含），None表示不限
+            end_ts: 结束时间戳（不含），None表示不限
+
+        Returns:
+            slice: 行区间
+        """
+        kickoff = self.columns['kickoff_ts']
+        lo = 0 if start_ts is None else int(np.searchsorted(kickoff, start_ts, side='left'))
+        hi = self._size if end_ts is None else int(np.searchsorted(kickoff, end_ts, side='left'))
+        return slice(lo, max(lo, hi))
+
+    def between(self, start_ts: Optional[int] = None, end_ts: Optional[int] = None) -> 'MatchTable':
+        """开球时间在 [start_ts, end_ts) 内的比赛子表（数组视图，不复制数据）"""
+        return self.take(self.time_range(start_ts, end_ts))
+
+    def before(self, ts: int) -> 'MatchTable':
+        """开球时间早于 ts 的比赛子表"""
+        return self.between(None, ts)
+
+    def latest(self, n: int) -> 'MatchTable':
+        """
+        最近N场比赛（按开球时间从近到远排列）
+
+        Args:
+            n: 场数
+
+        Returns:
+            MatchTable: 子表（逆序视图）
+        """
+        stop = self._size - 1 - max(n, 0)
+        return self.take(slice(self._size - 1, stop if stop >= 0 else None, -1))
+
+    # ------------------------------------------------------------------
+    # 编码
+    # ------------------------------------------------------------------
+    @property
+    def teams(self) -> List[str]:
+        """球队词表（编码 -> 球队名）"""
+        return self.vocabularies['team']
+
+    @property
+    def leagues(self) -> List[str]:
+        """联赛词表（编码 -> 联赛名）"""
+        return self.vocabularies['league']
+
+    def team_code(self, team_name: str) -> int:
+        """球队名对应的编码，不存在时返回-1"""
+        return self._code_lookup['team'].get(team_name, -1)
+
+    def league_code(self, league: str) -> int:
+        """联赛名对应的编码，不存在时返回-1"""
+        return self._code_lookup['league'].get(league, -1)
+
+    def derived(self, name: str, factory: Callable[[], Any]) -> Any:
+        """
+        获取基于本数据表构建的派生结构（如索引、前缀和），每个数据表只构建一次
+
+        数据表内容不可变，替换数据即创建新的数据表（新版本），派生结构随之重建。
+
+        Args:
+            name: 派生结构名称
+            factory: 构建函数
+
+        Returns:
+            Any: 派生结构
+        """
+        if name not in self._derived:
+            self._derived[name] = factory()
+        return self._derived[name]
+
+    def team_index(self) -> TeamIndex:
+        """球队出场索引（每个数据表只构建一次）"""
+        return self.derived('team_index', lambda: TeamIndex(
+            self.columns['home_team_code'], self.columns['away_team_code'], len(self.teams)))
+
+    def present_teams(self) -> List[str]:
+        """表中实际出现的球队（子表可能只包含词表的一部分）"""
+        codes = np.unique(np.concatenate([self.columns['home_team_code'], self.columns['away_team_code']]))
+        return [self.teams[code] for code in codes.tolist()]
+
+    def present_leagues(self) -> List[str]:
+        """表中实际出现的联赛"""
+        return [self.leagues[code] for code in np.unique(self.columns['league_code']).tolist()]
+
+
+def as_match_table(matches: Optional[Iterable[Any]]) -> MatchTable:
+    """将比赛数据列表或数据表统一转换为MatchTable"""
+    if isinstance(matches, MatchTable):
+        return matches
+    return MatchTable.from_matches(matches or [])
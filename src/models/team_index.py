@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+球队出场索引
+为数据表中的每支球队记录其参与比赛的行号（按开球时间排序）及主客场标记，
+查询某队最近N场比赛只需切片，无需扫描整个数据集
+"""
+
+from typing import Optional, Tuple
+
+import numpy as np
+
+
+class TeamIndex:
+    """球队出场索引（CSR结构：所有球队的出场记录按球队编码分段存放）"""
+
+    def __init__(self, home_codes: np.ndarray, away_codes: np.ndarray, n_teams: int):
+        """
+        构建索引
+
+        Args:
+            home_codes: 每行主队编码
+            away_codes: 每行客队编码
+            n_teams: 球队词表大小
+        """
+        n_rows = len(home_codes)
+        rows = np.arange(n_rows, dtype=np.int64)
+        # 主客队相同的异常记录只记一次（视为主场），与逐场筛选的结果一致
+        away_rows = rows[away_codes != home_codes]
+
+        team_codes = np.concatenate([home_codes, away_codes[away_rows]]).astype(np.int64)
+        positions = np.concatenate([rows, away_rows])
+        is_home = np.concatenate([np.ones(n_rows, dtype=bool), np.zeros(len(away_rows), dtype=bool)])
+
+        # 先按球队、再按行号（即开球时间）排序
+        order = np.lexsort((positions, team_codes))
+        self.positions = positions[order]
+        self.is_home = is_home[order]
+        self.offsets = np.zeros(n_teams + 1, dtype=np.int64)
+        np.cumsum(np.bincount(team_codes, minlength=n_teams), out=self.offsets[1:])
+
+    def appearances(self, team_code: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        球队的全部出场记录
+
+        Args:
+            team_code: 球队编码（-1表示不存在的球队）
+
+        Returns:
+            Tuple: (行号数组, 是否主场数组)，按开球时间升序
+        """
+        if team_code < 0 or team_code + 1 >= len(self.offsets):
+            return self.positions[:0], self.is_home[:0]
+        start, end = self.offsets[team_code], self.offsets[team_code + 1]
+        return self.positions[start:end], self.is_home[start:end]
+
+    def recent(self, team_code: int, n: int, end: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        球队最近N场比赛（从近到远）
+
+        Args:
+            team_code: 球队编码
+            n: 场数
+            end: 只考虑前end个出场记录（用于时间点查询），None表示全部
+
+        Returns:
+            Tuple: (行号数组, 是否主场数组)
+        """
+        positions, is_home = self.appearances(team_code)
+        if end is not None:
+            positions, is_home = positions[:end], is_home[:end]
+        start = max(len(positions) - max(n, 0), 0)
+        return positions[start:][::-1], is_home[start:][::-1]
+
+    def count(self, team_code: int) -> int:
+        """球队出场次数"""
+        if team_code < 0 or team_code + 1 >= len(self.offsets):
+            return 0
+        return int(self.offsets[team_code + 1] - self.offsets[team_code])
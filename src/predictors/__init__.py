@@ -5,5 +5,13 @@
 """
 
 from .football_predictor import FootballPredictor
+from .rolling_stats import TeamRollingStats, TeamWindowTracker
+from .stats_cache import TeamStatsCache
+from .form_tracker import TeamFormTracker
+from .coefficient_table import CoefficientTable
+from .batch_engine import BatchPredictionEngine, PREDICTION_DTYPE
+from .in_play import InPlayModel, evaluate_in_play
+from .prediction_service import PredictionService
 
-__all__ = ['FootballPredictor']
\ No newline at end of file
+__all__ = ['FootballPredictor', 'TeamRollingStats', 'TeamStatsCache', 'BatchPredictionEngine', 'PREDICTION_DTYPE',
+           'TeamWindowTracker', 'TeamFormTracker', 'CoefficientTable', 'InPlayModel', 'evaluate_in_play', 'PredictionService']
\ No newline at end of file
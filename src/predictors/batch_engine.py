@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+批量预测引擎
+以主客队编码数组为输入，在整批比赛上用NumPy数组运算完成进球、角球、黄牌的预测公式与范围限制，
+结果与FootballPredictor逐场预测完全一致
+"""
+
+from dataclasses import fields
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from ..models.data_models import MatchData, PredictionResult, TeamStats
+from ..models.match_table import MatchTable
+from ..config.league_coefficients import DATA_CONFIG
+
+
+# 预测结果结构化数组的字段（与PredictionResult一致）
+PREDICTION_FIELDS = [field.name for field in fields(PredictionResult)]
+PREDICTION_DTYPE = np.dtype([(name, np.float64) for name in PREDICTION_FIELDS])
+
+# 预测公式用到的比赛字段及其默认值（与预测未开赛比赛时构造的虚拟比赛一致）
+FIXTURE_DEFAULTS = {
+    'home_possession': 50.0,
+    'away_possession': 50.0,
+    'home_shots': 10,
+    'away_shots': 10,
+    'home_fouls': 12,
+    'away_fouls': 12,
+}
+
+# 预测公式用到的球队统计字段
+_STAT_FIELDS = ('avg_goals_scored', 'avg_goals_conceded', 'avg_corners', 'avg_yellow_cards', 'avg_red_cards')
+
+# 预测结果的范围限制配置项
+LIMIT_KEYS = ('goal_limits', 'corner_limits', 'yellow_card_limits')
+
+
+class BatchPredictionEngine:
+    """向量化的批量预测引擎（使用预测器的联赛系数与球队统计缓存）"""
+
+    def __init__(self, predictor):
+        """
+        初始化引擎
+
+        Args:
+            predictor: FootballPredictor实例
+        """
+        self.predictor = predictor
+
+    def team_stat_arrays(self, table: MatchTable, team_codes: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        按球队编码收集统计数据（每支球队只计算一次）
+
+        Args:
+            table: 历史比赛数据表
+            team_codes: 球队编码数组，-1表示历史数据中不存在的球队（使用默认统计）
+
+        Returns:
+            Dict: 统计字段 -> 与team_codes等长的数组
+        """
+        unique_codes, inverse = np.unique(np.asarray(team_codes, dtype=np.int64), return_inverse=True)
+        unique_stats = [self.predictor.calculate_team_stats(table, table.teams[code]) if code >= 0
+                        else TeamStats.default("") for code in unique_codes.tolist()]
+        return {name: values[inverse] for name, values in stat_arrays(unique_stats).items()}
+
+    def predict(self, table: MatchTable, home_codes: Sequence[int], away_codes: Sequence[int],
+                fixtures: Optional[Dict[str, Sequence[float]]] = None,
+                leagues: Union[str, Sequence[str], None] = None) -> np.ndarray:
+        """
+        批量预测
+
+        Args:
+            table: 历史比赛数据表
+            home_codes: 主队编码数组（table的球队词表编码，-1表示未知球队）
+            away_codes: 客队编码数组
+            fixtures: 比赛字段 -> 数组（见FIXTURE_DEFAULTS），缺失的字段使用默认值
+            leagues: 联赛名称（整批相同）或每场比赛的联赛名称（混合联赛，按编码从系数表取系数），
+                     None使用预测器的联赛
+
+        Returns:
+            np.ndarray: 结构化数组，字段与PredictionResult一致
+        """
+        home = self.team_stat_arrays(table, home_codes)
+        away = self.team_stat_arrays(table, away_codes)
+        if leagues is None:
+            coefficients = self.predictor.coefficients
+        elif isinstance(leagues, str):
+            coefficients = self.predictor.coefficient_table.coefficients(leagues)
+        else:
+            coefficients = self.predictor.coefficient_table.gather_leagues(leagues)
+        return self.predict_stats(home, away, coefficients, fixtures)
+
+    def predict_stats(self, home: Dict[str, np.ndarray], away: Dict[str, np.ndarray],
+                      coefficients: Dict[str, Union[float, np.ndarray]],
+                      fixtures: Optional[Dict[str, Sequence[float]]] = None,
+                      limits: Optional[Dict[str, Tuple[float, float]]] = None) -> np.ndarray:
+        """
+        由已收集的球队统计与联赛系数批量预测（预测公式部分）
+
+        Args:
+            home: 主队统计字段 -> 数组（见team_stat_arrays）
+            away: 客队统计字段 -> 数组
+            coefficients: 系数字段 -> 标量（整批相同）或与比赛等长的数组
+            fixtures: 比赛字段 -> 数组（见FIXTURE_DEFAULTS），缺失的字段使用默认值
+            limits: 预测范围（goal_limits/corner_limits/yellow_card_limits），缺失的项使用配置默认值
+
+        Returns:
+            np.ndarray: 结构化数组，字段与PredictionResult一致
+        """
+        limits = {name: (limits or {}).get(name, DATA_CONFIG[name]) for name in LIMIT_KEYS}
+        n = len(home['avg_goals_scored'])
+        fixtures = fixtures or {}
+        fixture = {name: np.broadcast_to(np.asarray(fixtures.get(name, default), dtype=np.float64), (n,))
+                   for name, default in FIXTURE_DEFAULTS.items()}
+
+        result = np.empty(n, dtype=PREDICTION_DTYPE)
+
+        # 进球：(场均进球 + 场均失球)/2，主队乘主场优势，限制范围后保留1位小数
+        min_goal, max_goal = limits["goal_limits"]
+        home_goals = np.round(np.clip((home['avg_goals_scored'] + home['avg_goals_conceded']) / 2
+                                      * coefficients["home_advantage"], min_goal, max_goal), 1)
+        away_goals = np.round(np.clip((away['avg_goals_scored'] + away['avg_goals_conceded']) / 2,
+                                      min_goal, max_goal), 1)
+        goal_ratio = coefficients["goal_baseline"] / 2.5
+        result['home_team_goals'] = home_goals
+        result['away_team_goals'] = away_goals
+        result['total_goals'] = np.round(np.clip((home_goals + away_goals) * goal_ratio,
+                                                 min_goal * 2, max_goal * 2), 1)
+
+        # 角球：球队角球基线 ± 控球率差×0.1 + 射门数/4×0.3
+        possession_diff = fixture['home_possession'] - fixture['away_possession']
+        shot_factor = (fixture['home_shots'] + fixture['away_shots']) / 4
+        home_corners = np.maximum(home['avg_corners'] + (possession_diff * 0.1) + (shot_factor * 0.3), 0)
+        away_corners = np.maximum(away['avg_corners'] - (possession_diff * 0.1) + (shot_factor * 0.3), 0)
+        min_corner, max_corner = limits["corner_limits"]
+        self._distribute(result, 'corners', home_corners, away_corners,
+                         coefficients["corner_baseline"] / 9.0, min_corner, max_corner)
+
+        # 黄牌：球队黄牌基线 + 犯规数×转换系数 + 红牌折算
+        home_yellow = (home['avg_yellow_cards'] + fixture['home_fouls'] * coefficients["foul_to_yellow"]
+                       + home['avg_red_cards'] * coefficients["red_card_penalty"])
+        away_yellow = (away['avg_yellow_cards'] + fixture['away_fouls'] * coefficients["foul_to_yellow"]
+                       + away['avg_red_cards'] * coefficients["red_card_penalty"])
+        min_yellow, max_yellow = limits["yellow_card_limits"]
+        self._distribute(result, 'yellow_cards', home_yellow, away_yellow,
+                         coefficients["yellow_card_baseline"] / 4.5, min_yellow, max_yellow)
+
+        return result
+
+    @staticmethod
+    def _distribute(result: np.ndarray, suffix: str, home_values: np.ndarray, away_values: np.ndarray,
+                    baseline_ratio: float, lower: float, upper: float):
+        """按联赛基线修正总数并限制范围，再按两队原始比例分配回各队（总数为0时平分）"""
+        total = home_values + away_values
+        adjusted_total = np.clip(total * baseline_ratio, lower, upper)
+        positive = total > 0
+        safe_total = np.where(positive, total, 1.0)
+        result[f'home_{suffix}'] = np.round(np.where(positive, adjusted_total * (home_values / safe_total),
+                                                     adjusted_total / 2), 1)
+        result[f'away_{suffix}'] = np.round(np.where(positive, adjusted_total * (away_values / safe_total),
+                                                     adjusted_total / 2), 1)
+        result[f'total_{suffix}'] = np.round(adjusted_total, 1)
+
+    def league_matrix(self, table: MatchTable, league: str) -> Tuple[List[str], np.ndarray]:
+        """
+        联赛内所有主客队组合的预测矩阵
+
+        每支球队的统计只计算一次，N×N个组合展开为一批比赛一次性向量化预测。
+
+        Args:
+            table: 历史比赛数据表
+            league: 联赛名称
+
+        Returns:
+            Tuple: (球队列表, 形状为N×N的结构化预测数组，[i, j]为球队i主场对球队j)
+        """
+        columns = table.columns
+        in_league = columns['league_code'] == table.league_code(league)
+        team_codes = np.union1d(columns['home_team_code'][in_league], columns['away_team_code'][in_league])
+        n = len(team_codes)
+
+        predictions = self.predict(table, np.repeat(team_codes, n), np.tile(team_codes, n), leagues=league)
+        return [table.teams[code] for code in team_codes.tolist()], predictions.reshape(n, n)
+
+    def predict_matches(self, matches: Sequence[MatchData], table: MatchTable,
+                        by_league: bool = False) -> np.ndarray:
+        """
+        批量预测一组比赛（比赛中的控球率、射门、犯规数据参与角球与黄牌预测）
+
+        Args:
+            matches: 待预测的比赛列表
+            table: 历史比赛数据表
+            by_league: 是否按每场比赛自身的联赛取系数，False使用预测器的联赛
+
+        Returns:
+            np.ndarray: 结构化预测结果数组
+        """
+        home_codes = [table.team_code(match.home_team) for match in matches]
+        away_codes = [table.team_code(match.away_team) for match in matches]
+        fixtures = {name: [getattr(match, name) for match in matches] for name in FIXTURE_DEFAULTS}
+        leagues = [match.league for match in matches] if by_league else None
+        return self.predict(table, home_codes, away_codes, fixtures, leagues)
+
+
+def stat_arrays(team_stats: Sequence[TeamStats]) -> Dict[str, np.ndarray]:
+    """
+    将球队统计列表转换为预测公式使用的字段数组
+
+    Args:
+        team_stats: 球队统计列表
+
+    Returns:
+        Dict: 统计字段 -> 与team_stats等长的数组
+    """
+    return {name: np.array([getattr(stats, name) for stats in team_stats], dtype=np.float64)
+            for name in _STAT_FIELDS}
+
+
+def to_prediction_results(predictions: np.ndarray) -> List[PredictionResult]:
+    """
+    将结构化预测结果数组转换为PredictionResult列表
+
+    Args:
+        predictions: 结构化预测结果数组
+
+    Returns:
+        List[PredictionResult]: 预测结果列表
+    """
+    return [PredictionResult(*row) for row in predictions.tolist()]
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+联赛系数表模块
+合并配置中的联赛系数与训练得到的基线参数（trained_baselines.json），编译为按联赛编码索引的稠密数组；
+基线文件变化时自动重新加载，批量预测按编码直接取系数，无需逐场查字典
+"""
+
+import json
+import os
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..config.league_coefficients import LEAGUE_COEFFICIENTS, DEFAULT_LEAGUE, DATA_CONFIG
+
+
+# 预测公式使用的系数字段
+COEFFICIENT_FIELDS = ['goal_baseline', 'corner_baseline', 'yellow_card_baseline',
+                      'home_advantage', 'foul_to_yellow', 'red_card_penalty']
+
+# 项目根目录（配置中的相对基线文件路径相对于此目录，与运行时的工作目录无关）
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# 按文件路径共享的系数表
+_shared_tables: Dict[str, 'CoefficientTable'] = {}
+
+
+def default_baselines_file() -> str:
+    """配置的基线参数文件路径（相对路径按项目根目录解析）"""
+    return os.path.join(PROJECT_ROOT, DATA_CONFIG["baselines_file"])
+
+
+class CoefficientTable:
+    """联赛系数表（训练结果优先，缺失的联赛或字段回退到配置）"""
+
+    def __init__(self, baselines_file: Optional[str] = None, check_interval: Optional[float] = None):
+        """
+        初始化系数表
+
+        Args:
+            baselines_file: 训练得到的基线参数文件，None使用配置默认值（相对项目根目录）；文件不存在时只使用配置中的系数
+            check_interval: 检查文件是否变化的最小间隔（秒），None使用配置默认值，0表示每次访问都检查
+        """
+        self.baselines_file = default_baselines_file() if baselines_file is None else baselines_file
+        self.check_interval = (DATA_CONFIG["baselines_check_interval"] if check_interval is None
+                               else check_interval)
+        self.version = 0
+        self._checked_at = float('-inf')
+        self.leagues: List[str] = []
+        self.values = np.empty((0, len(COEFFICIENT_FIELDS)))
+        self._codes: Dict[str, int] = {}
+        self._default_code = 0
+        self._file_state: Optional[Tuple[int, int]] = None
+        self._compile({})
+        self.refresh(force=True)
+
+    @classmethod
+    def shared(cls, baselines_file: Optional[str] = None) -> 'CoefficientTable':
+        """获取指定基线文件的共享系数表（多个预测器共用同一份编译结果）"""
+        baselines_file = default_baselines_file() if baselines_file is None else baselines_file
+        key = os.path.abspath(baselines_file)
+        if key not in _shared_tables:
+            _shared_tables[key] = cls(baselines_file)
+        return _shared_tables[key]
+
+    @classmethod
+    def from_baselines(cls, trained: Dict[str, Dict[str, float]]) -> 'CoefficientTable':
+        """
+        由内存中的基线参数编译系数表（不读取文件，如交叉验证各折只使用该折训练集的基线）
+
+        Args:
+            trained: 联赛名 -> 基线参数（calculate_league_baselines的结果）
+
+        Returns:
+            CoefficientTable: 不关联基线文件的系数表
+        """
+        table = cls(baselines_file="", check_interval=float('inf'))
+        table._compile(trained)
+        return table
+
+    def _read_file_state(self) -> Optional[Tuple[int, int]]:
+        """基线文件的修改时间与大小，文件不存在时返回None"""
+        try:
+            stat = os.stat(self.baselines_file)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def refresh(self, force: bool = False) -> bool:
+        """
+        基线文件变化（新建、修改、删除）时重新加载
+
+        Args:
+            force: 是否忽略检查间隔立即检查
+
+        Returns:
+            bool: 是否重新加载
+        """
+        now = time.monotonic()
+        if not force and now - self._checked_at < self.check_interval:
+            return False
+        self._checked_at = now
+
+        file_state = self._read_file_state()
+        if file_state == self._file_state:
+            return False
+
+        trained = {}
+        if file_state is not None:
+            try:
+                with open(self.baselines_file, 'r', encoding='utf-8') as f:
+                    trained = json.load(f)
+            except (OSError, ValueError) as e:
+                # 文件正在写入或格式错误时保留当前系数，下次访问再尝试
+                print(f"读取基线参数文件失败: {e}")
+                return False
+        self._file_state = file_state
+        self._compile(trained)
+        return True
+
+    def _compile(self, trained: Dict[str, Dict[str, float]]):
+        """合并配置与训练结果，编译为稠密数组"""
+        leagues = list(LEAGUE_COEFFICIENTS) + [league for league in trained if league not in LEAGUE_COEFFICIENTS]
+        values = np.empty((len(leagues), len(COEFFICIENT_FIELDS)))
+        for row, league in enumerate(leagues):
+            fallback = LEAGUE_COEFFICIENTS.get(league, LEAGUE_COEFFICIENTS[DEFAULT_LEAGUE])
+            params = trained.get(league, {})
+            values[row] = [float(params.get(field, fallback[field])) for field in COEFFICIENT_FIELDS]
+
+        self.leagues = leagues
+        self.values = values
+        self._codes = {league: code for code, league in enumerate(leagues)}
+        self._default_code = self._codes[DEFAULT_LEAGUE]
+        self.version += 1
+
+    def league_code(self, league: str) -> int:
+        """联赛在系数表中的编码，未知联赛使用默认联赛的编码"""
+        self.refresh()
+        return self._codes.get(league, self._default_code)
+
+    def coefficients(self, league: str) -> Dict[str, float]:
+        """
+        单个联赛的系数
+
+        Args:
+            league: 联赛名称
+
+        Returns:
+            Dict: 系数字段 -> 值
+        """
+        code = self.league_code(league)
+        return dict(zip(COEFFICIENT_FIELDS, self.values[code].tolist()))
+
+    def codes_for(self, leagues: Sequence[str]) -> np.ndarray:
+        """
+        将联赛名称映射为系数表编码（如MatchTable的联赛词表）
+
+        Args:
+            leagues: 联赛名称序列
+
+        Returns:
+            np.ndarray: 编码数组，未知联赛映射到默认联赛
+        """
+        self.refresh()
+        return np.array([self._codes.get(league, self._default_code) for league in leagues], dtype=np.int64)
+
+    def gather(self, codes: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        按系数表编码批量取系数
+
+        Args:
+            codes: 系数表编码数组
+
+        Returns:
+            Dict: 系数字段 -> 与codes等长的数组
+        """
+        rows = self.values[np.asarray(codes, dtype=np.int64)]
+        return {field: rows[:, column] for column, field in enumerate(COEFFICIENT_FIELDS)}
+
+    def gather_leagues(self, leagues: Sequence[str]) -> Dict[str, np.ndarray]:
+        """按联赛名称批量取系数（每个不同的联赛只查一次字典）"""
+        unique_leagues, inverse = np.unique(np.asarray(leagues, dtype=str), return_inverse=True)
+        return self.gather(self.codes_for(unique_leagues.tolist())[inverse])
@@ -6,66 +6,111 @@
 """
 
 import numpy as np
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple, Union
 from collections import defaultdict
 
-from ..models.data_models import MatchData, TeamStats, PredictionResult
-from ..config.league_coefficients import LEAGUE_COEFFICIENTS, DEFAULT_LEAGUE, DATA_CONFIG
+from ..models.data_models import MatchData, TeamStats, PredictionResult, MatchProbabilities
+from ..models.match_table import MatchTable, as_match_table
+from ..config.league_coefficients import DEFAULT_LEAGUE, DATA_CONFIG
+from .rolling_stats import TeamRollingStats
+from .form_tracker import TeamFormTracker
+from .coefficient_table import CoefficientTable
+from .stats_cache import TeamStatsCache
+from .batch_engine import BatchPredictionEngine, to_prediction_results
+from .probability_engine import predict_probabilities, to_match_probabilities
+
+
+# 球队统计方式：window 最近N场均值，ewma 指数加权移动平均
+STATS_MODES = ('window', 'ewma')
 
 
 class FootballPredictor:
     """足球数据预测器"""
     
-    def __init__(self, league: str = DEFAULT_LEAGUE):
+    def __init__(self, league: str = DEFAULT_LEAGUE, stats_mode: Optional[str] = None,
+                 coefficient_table: Optional[CoefficientTable] = None):
         """
         初始化预测器
         
         Args:
             league: 联赛名称
+            stats_mode: 球队统计方式（window 最近N场均值 / ewma 指数加权移动平均），None使用配置默认值
+            coefficient_table: 联赛系数表，None使用按配置基线文件共享的系数表（训练结果优先，文件变化时自动重新加载）
         """
+        stats_mode = stats_mode or DATA_CONFIG["stats_mode"]
+        if stats_mode not in STATS_MODES:
+            raise ValueError(f"不支持的球队统计方式: {stats_mode}，可选: {', '.join(STATS_MODES)}")
         self.league = league
-        self.coefficients = LEAGUE_COEFFICIENTS.get(league, LEAGUE_COEFFICIENTS[DEFAULT_LEAGUE])
-        self.team_stats_cache = {}  # 缓存球队统计数据
-        
-    def calculate_team_stats(self, matches: List[MatchData], team_name: str, 
-                           recent_n: int = DATA_CONFIG["recent_matches_window"]) -> TeamStats:
+        self.stats_mode = stats_mode
+        self.coefficient_table = coefficient_table or CoefficientTable.shared()
+        self._coefficients: Dict[str, float] = {}
+        self._coefficients_version = None
+        self.team_stats_cache = TeamStatsCache()  # 球队统计LRU缓存（绑定数据表版本）
+    
+    @property
+    def coefficients(self) -> Dict[str, float]:
+        """当前联赛的系数（系数表重新加载后自动更新）"""
+        table = self.coefficient_table
+        table.refresh()
+        if self._coefficients_version != table.version:
+            self._coefficients = table.coefficients(self.league)
+            self._coefficients_version = table.version
+        return self._coefficients
+        
+    def calculate_team_stats(self, matches: Union[List[MatchData], MatchTable], team_name: str, 
+                           recent_n: Optional[int] = None,
+                           as_of: Optional[int] = None) -> TeamStats:
         """
         计算球队的历史统计数据
         
+        stats_mode为ewma时使用全部历史的指数加权平均（recent_n不起作用）；带as_of的时间点查询总是使用窗口均值。
+        
         Args:
-            matches: 比赛数据列表
+            matches: 比赛数据列表或MatchTable（数据表直接在数组上计算）
             team_name: 球队名称
-            recent_n: 使用最近N场比赛
+            recent_n: 使用最近N场比赛，None使用配置默认值
+            as_of: 时间戳，只使用开球时间早于该时间的比赛（避免使用未来数据），None表示使用全部比赛
             
         Returns:
             TeamStats: 球队统计数据
         """
+        recent_n = DATA_CONFIG["recent_matches_window"] if recent_n is None else recent_n
+        ewma = self.stats_mode == 'ewma' and as_of is None
+        if ewma and not isinstance(matches, MatchTable):
+            matches = MatchTable.from_matches(matches)
+        
+        if isinstance(matches, MatchTable):
+            # 数据表不可变且带版本号，替换数据后旧的缓存条目自动失效
+            cache_key = (team_name, recent_n, as_of, ewma)
+            stats = self.team_stats_cache.get(matches.version, cache_key)
+            if stats is None:
+                if ewma:
+                    stats = TeamFormTracker.for_table(matches).team_stats(team_name)
+                elif as_of is not None:
+                    # 时间点查询走前缀和，每次查询只需一次二分查找
+                    stats = TeamRollingStats.for_table(matches).team_stats(team_name, recent_n, as_of)
+                else:
+                    stats = self._calculate_team_stats_from_table(matches, team_name, recent_n)
+                self.team_stats_cache.put(matches.version, cache_key, stats)
+            return stats
+        
+        # 比赛列表可能被原地修改，无法判断是否过期，不做缓存
+        
         # 筛选该球队参与的比赛
         team_matches = []
         for match in matches:
+            if as_of is not None and match.kickoff_ts >= as_of:
+                continue
             if match.home_team == team_name or match.away_team == team_name:
                 team_matches.append(match)
                 
-        # 按日期排序，取最近的比赛
-        team_matches.sort(key=lambda x: x.date, reverse=True)
-        recent_matches = team_matches[:recent_n]
+        # 按开球时间稳定排序后从近到远取最近的比赛（与MatchTable的时间顺序一致）
+        team_matches.sort(key=lambda x: x.kickoff_ts)
+        recent_matches = team_matches[::-1][:recent_n]
         
         if len(recent_matches) < DATA_CONFIG["min_matches_required"]:
             # 如果数据不足，返回默认值
-            return TeamStats(
-                team_name=team_name,
-                avg_goals_scored=1.0,
-                avg_goals_conceded=1.0,
-                avg_shots=10.0,
-                avg_shots_on_target=3.0,
-                avg_possession=50.0,
-                avg_pass_success_rate=80.0,
-                avg_fouls=12.0,
-                avg_corners=5.0,
-                avg_yellow_cards=2.0,
-                avg_red_cards=0.1,
-                total_matches=len(recent_matches)
-            )
+            return TeamStats.default(team_name, len(recent_matches))
         
         # 计算各项统计数据
         goals_scored = []
@@ -121,9 +166,49 @@ class FootballPredictor:
             total_matches=len(recent_matches)
         )
         
-        # 缓存结果
-        cache_key = f"{team_name}_{recent_n}"
-        self.team_stats_cache[cache_key] = stats
+        return stats
+    
+    def _calculate_team_stats_from_table(self, table: MatchTable, team_name: str,
+                                         recent_n: int) -> TeamStats:
+        """
+        在数组化数据表上计算球队统计数据（结果与逐场计算完全一致）
+        
+        Args:
+            table: 比赛数据表
+            team_name: 球队名称
+            recent_n: 使用最近N场比赛
+            
+        Returns:
+            TeamStats: 球队统计数据
+        """
+        columns = table.columns
+        
+        # 球队出场索引按开球时间排序，最近的比赛即末尾切片
+        recent, is_home = table.team_index().recent(table.team_code(team_name), recent_n)
+        
+        if len(recent) < DATA_CONFIG["min_matches_required"]:
+            return TeamStats.default(team_name, len(recent))
+        
+        def side_mean(field: str, own: bool = True) -> float:
+            home_values = columns[f'home_{field}'][recent]
+            away_values = columns[f'away_{field}'][recent]
+            take_home = is_home if own else ~is_home
+            return np.mean(np.where(take_home, home_values, away_values))
+        
+        stats = TeamStats(
+            team_name=team_name,
+            avg_goals_scored=side_mean('goals'),
+            avg_goals_conceded=side_mean('goals', own=False),
+            avg_shots=side_mean('shots'),
+            avg_shots_on_target=side_mean('shots_on_target'),
+            avg_possession=side_mean('possession'),
+            avg_pass_success_rate=side_mean('pass_success'),
+            avg_fouls=side_mean('fouls'),
+            avg_corners=side_mean('corners'),
+            avg_yellow_cards=side_mean('yellow_cards'),
+            avg_red_cards=side_mean('red_cards'),
+            total_matches=len(recent)
+        )
         
         return stats
     
@@ -279,13 +364,14 @@ class FootballPredictor:
             "total": round(adjusted_total, 1)
         }
     
-    def predict_match(self, match_data: MatchData, historical_matches: List[MatchData]) -> PredictionResult:
+    def predict_match(self, match_data: MatchData,
+                      historical_matches: Union[List[MatchData], MatchTable]) -> PredictionResult:
         """
         对单场比赛进行全面预测
         
         Args:
             match_data: 待预测的比赛数据
-            historical_matches: 历史比赛数据
+            historical_matches: 历史比赛数据（列表或MatchTable）
             
         Returns:
             PredictionResult: 预测结果
@@ -318,19 +404,52 @@ class FootballPredictor:
         return result
     
     def batch_predict(self, matches_to_predict: List[MatchData], 
-                     historical_matches: List[MatchData]) -> List[PredictionResult]:
+                     historical_matches: Union[List[MatchData], MatchTable],
+                     by_league: bool = False) -> List[PredictionResult]:
         """
         批量预测多场比赛
         
         Args:
             matches_to_predict: 待预测的比赛列表
             historical_matches: 历史比赛数据
+            by_league: 是否按每场比赛自身的联赛取系数（混合联赛），False使用预测器的联赛
             
         Returns:
             List[PredictionResult]: 预测结果列表
         """
-        results = []
-        for match in matches_to_predict:
-            prediction = self.predict_match(match, historical_matches)
-            results.append(prediction)
-        return results
\ No newline at end of file
+        # 历史数据只转换一次，每支球队的统计只计算一次，预测公式在整批比赛上向量化计算
+        historical_matches = as_match_table(historical_matches)
+        predictions = BatchPredictionEngine(self).predict_matches(matches_to_predict, historical_matches,
+                                                                  by_league)
+        return to_prediction_results(predictions)
+    
+    def predict_probabilities(self, predictions: List[PredictionResult],
+                              total_line: Optional[float] = None) -> List[MatchProbabilities]:
+        """
+        由进球预测计算胜平负、大小球、两队都进球的概率（双变量泊松比分矩阵，整批向量化计算）
+        
+        Args:
+            predictions: 预测结果列表
+            total_line: 大小球盘口，None使用配置默认值
+            
+        Returns:
+            List[MatchProbabilities]: 概率预测列表
+        """
+        home_rates = [prediction.home_team_goals for prediction in predictions]
+        away_rates = [prediction.away_team_goals for prediction in predictions]
+        return to_match_probabilities(predict_probabilities(home_rates, away_rates, total_line))
+    
+    def predict_league_matrix(self, historical_matches: Union[List[MatchData], MatchTable],
+                              league: Optional[str] = None) -> Tuple[List[str], np.ndarray]:
+        """
+        预测联赛内所有主客队组合（N×N矩阵）
+        
+        Args:
+            historical_matches: 历史比赛数据
+            league: 联赛名称，None表示预测器的联赛
+            
+        Returns:
+            Tuple: (球队列表, N×N结构化预测数组，[i, j]为球队i主场对球队j，字段与PredictionResult一致)
+        """
+        table = as_match_table(historical_matches)
+        return BatchPredictionEngine(self).league_matrix(table, league or self.league)
\ No newline at end of file
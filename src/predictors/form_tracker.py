@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+球队状态跟踪模块
+为每支球队的各项统计维护指数加权移动平均（EWMA），新比赛到达时以O(1)代价更新，
+替代固定窗口的最近N场均值
+"""
+
+from typing import Dict, Iterable, Optional
+
+import numpy as np
+
+from ..models.data_models import MatchData, TeamStats
+from ..models.match_table import MatchTable
+from ..config.league_coefficients import DATA_CONFIG
+from .rolling_stats import ROLLING_METRICS, match_side_values
+
+
+_METRIC_NAMES = list(ROLLING_METRICS)
+
+
+def smoothing_factor(half_life: float) -> float:
+    """半衰期（场数）对应的平滑系数：经过half_life场比赛后旧数据的权重减半"""
+    if half_life <= 0:
+        raise ValueError(f"半衰期必须大于0: {half_life}")
+    return 1.0 - 0.5 ** (1.0 / half_life)
+
+
+class TeamFormTracker:
+    """球队状态跟踪器（每支球队每项统计一个EWMA状态）"""
+
+    def __init__(self, half_life: Optional[float] = None):
+        """
+        初始化跟踪器
+
+        Args:
+            half_life: 半衰期（场数），None使用配置默认值
+        """
+        self.half_life = DATA_CONFIG["form_half_life"] if half_life is None else half_life
+        self.alpha = smoothing_factor(self.half_life)
+        self._state: Dict[str, np.ndarray] = {}
+        self._counts: Dict[str, int] = {}
+
+    @classmethod
+    def from_table(cls, table: MatchTable, half_life: Optional[float] = None) -> 'TeamFormTracker':
+        """
+        由按时间排序的数据表批量构建状态
+
+        逐场递推 s = s + α(x - s)（首场 s = x）的结果可以展开为加权和：
+        球队倒数第r场的权重为 α(1-α)^r，首场的权重为 (1-α)^(k-1)，因此整表可以一次向量化计算。
+
+        Args:
+            table: 比赛数据表
+            half_life: 半衰期（场数），None使用配置默认值
+
+        Returns:
+            TeamFormTracker: 跟踪器
+        """
+        tracker = cls(half_life)
+        index = table.team_index()
+        positions, offsets = index.positions, index.offsets
+        counts = np.diff(offsets)
+        team_of = np.repeat(np.arange(len(counts)), counts)
+        rank_from_end = np.repeat(offsets[1:], counts) - 1 - np.arange(len(positions))
+
+        decay = 1.0 - tracker.alpha
+        weights = tracker.alpha * decay ** rank_from_end
+        first = offsets[:-1][counts > 0]
+        weights[first] = decay ** (counts[counts > 0] - 1)
+
+        state = np.empty((len(counts), len(_METRIC_NAMES)))
+        for column, (field, opponent_side) in enumerate(ROLLING_METRICS.values()):
+            values = np.where(index.is_home != opponent_side,
+                              table.columns[f'home_{field}'][positions],
+                              table.columns[f'away_{field}'][positions])
+            state[:, column] = np.bincount(team_of, weights=weights * values, minlength=len(counts))
+
+        for code in np.flatnonzero(counts).tolist():
+            team = table.teams[code]
+            tracker._state[team] = state[code]
+            tracker._counts[team] = int(counts[code])
+        return tracker
+
+    @classmethod
+    def for_table(cls, table: MatchTable, half_life: Optional[float] = None) -> 'TeamFormTracker':
+        """获取数据表对应的状态（每个数据表、每个半衰期只构建一次，不应再对其调用update）"""
+        half_life = DATA_CONFIG["form_half_life"] if half_life is None else half_life
+        return table.derived(f'form_tracker:{half_life}', lambda: cls.from_table(table, half_life))
+
+    def update_team(self, team: str, values: np.ndarray):
+        """
+        以一场比赛的统计值更新球队状态
+
+        Args:
+            team: 球队名称
+            values: 该队在这场比赛中的统计值（顺序与ROLLING_METRICS一致）
+        """
+        state = self._state.get(team)
+        if state is None:
+            self._state[team] = np.array(values, dtype=np.float64)
+            self._counts[team] = 1
+        else:
+            state += self.alpha * (values - state)
+            self._counts[team] += 1
+
+    def update(self, match: MatchData):
+        """
+        以一场新比赛更新两队状态（比赛需按开球时间顺序到达）
+
+        Args:
+            match: 比赛数据
+        """
+        self.update_team(match.home_team, match_side_values(match, True))
+        if match.away_team != match.home_team:
+            # 主客队相同的异常记录只记一次，与球队出场索引一致
+            self.update_team(match.away_team, match_side_values(match, False))
+
+    def extend(self, matches: Iterable[MatchData]):
+        """按顺序以多场比赛更新状态"""
+        for match in matches:
+            self.update(match)
+
+    def count(self, team_name: str) -> int:
+        """球队已计入的比赛场数"""
+        return self._counts.get(team_name, 0)
+
+    def team_stats(self, team_name: str) -> TeamStats:
+        """
+        球队当前的加权统计数据
+
+        Args:
+            team_name: 球队名称
+
+        Returns:
+            TeamStats: 球队统计数据（比赛场数不足时为默认值）
+        """
+        count = self.count(team_name)
+        if count < DATA_CONFIG["min_matches_required"]:
+            return TeamStats.default(team_name, count)
+        state = self._state[team_name].tolist()
+        return TeamStats(team_name=team_name, total_matches=count, **dict(zip(_METRIC_NAMES, state)))
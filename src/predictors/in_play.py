@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+滚球预测模块
+比赛进行中按当前分钟与当前比分修正全场进球、角球预测：已发生的部分直接取当前值，
+只对剩余时间的期望按赛前预测×剩余时间比例重新估计。剩余时间比例由历史的开场15分钟、半场快照拟合，
+每次更新只需一次插值和几次数组运算，可以在每个比赛事件到达时对所有进行中的比赛重新计算
+"""
+
+from dataclasses import astuple, replace
+from typing import Dict, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from ..models.data_models import PredictionResult
+from ..models.match_table import MatchTable
+from ..config.league_coefficients import DATA_CONFIG
+from .batch_engine import FIXTURE_DEFAULTS, PREDICTION_DTYPE, to_prediction_results
+
+
+# 历史快照：统计项 -> [(比赛分钟, MatchData字段后缀), ...]
+IN_PLAY_SNAPSHOTS = {
+    'goals': [(15, 'goals_15min'), (45, 'half_goals')],
+    'corners': [(45, 'half_corners')],
+}
+
+# 统计项 -> 预测结果中的 (主队, 客队, 总数) 字段
+_PREDICTION_FIELDS = {
+    'goals': ('home_team_goals', 'away_team_goals', 'total_goals'),
+    'corners': ('home_corners', 'away_corners', 'total_corners'),
+}
+
+Number = Union[int, float, np.ndarray]
+
+
+class InPlayModel:
+    """滚球预测模型（每个统计项一条已完成比例随比赛分钟变化的曲线）"""
+
+    def __init__(self, match_minutes: Optional[int] = None):
+        """
+        初始化模型，默认假设进球、角球在比赛时间内均匀发生
+
+        Args:
+            match_minutes: 常规比赛时长（分钟），None使用配置默认值
+        """
+        self.match_minutes = DATA_CONFIG["match_minutes"] if match_minutes is None else match_minutes
+        self.curves: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+        for stat, snapshots in IN_PLAY_SNAPSHOTS.items():
+            minutes = np.array([0] + [minute for minute, _ in snapshots] + [self.match_minutes], dtype=np.float64)
+            self.curves[stat] = (minutes, minutes / self.match_minutes)
+
+    @classmethod
+    def fit(cls, table: MatchTable, match_minutes: Optional[int] = None,
+            min_snapshots: Optional[int] = None) -> 'InPlayModel':
+        """
+        由历史快照拟合已完成比例曲线
+
+        每个快照时间点的比例取有快照的比赛中快照值之和与全场值之和的比值；
+        快照值超过全场值的异常记录不参与拟合，快照数不足时保留均匀假设。
+
+        Args:
+            table: 历史比赛数据表
+            match_minutes: 常规比赛时长（分钟），None使用配置默认值
+            min_snapshots: 每个时间点所需的最少快照数，None使用配置默认值
+
+        Returns:
+            InPlayModel: 拟合后的模型
+        """
+        model = cls(match_minutes)
+        min_snapshots = DATA_CONFIG["in_play_min_snapshots"] if min_snapshots is None else min_snapshots
+        columns = table.columns
+        for stat, snapshots in IN_PLAY_SNAPSHOTS.items():
+            minutes, shares = model.curves[stat]
+            shares = shares.copy()
+            final_home, final_away = columns[f'home_{stat}'], columns[f'away_{stat}']
+            for point, (_, suffix) in enumerate(snapshots, start=1):
+                home, away = columns[f'home_{suffix}'], columns[f'away_{suffix}']
+                valid = (home >= 0) & (away >= 0) & (home <= final_home) & (away <= final_away)
+                final_total = int(final_home[valid].sum()) + int(final_away[valid].sum())
+                if valid.sum() >= min_snapshots and final_total > 0:
+                    shares[point] = (int(home[valid].sum()) + int(away[valid].sum())) / final_total
+            # 已完成比例随时间不减且不超过1
+            model.curves[stat] = (minutes, np.clip(np.maximum.accumulate(shares), 0.0, 1.0))
+        return model
+
+    @classmethod
+    def for_table(cls, table: MatchTable) -> 'InPlayModel':
+        """获取数据表拟合的模型（每个数据表只拟合一次）"""
+        return table.derived('in_play_model', lambda: cls.fit(table))
+
+    def remaining_share(self, stat: str, minute: Number) -> Number:
+        """
+        当前分钟之后剩余部分占全场的比例
+
+        Args:
+            stat: 统计项（goals/corners）
+            minute: 比赛已进行的分钟数（补时阶段按常规时长结束处理）
+
+        Returns:
+            剩余比例，与minute形状相同
+        """
+        minutes, shares = self.curves[stat]
+        return 1.0 - np.interp(minute, minutes, shares)
+
+    def expected_final(self, stat: str, pre_match: Number, minute: Number, current: Number) -> Number:
+        """
+        全场期望值 = 当前值 + 赛前预测 × 剩余比例
+
+        Args:
+            stat: 统计项（goals/corners）
+            pre_match: 赛前预测的全场值
+            minute: 比赛已进行的分钟数
+            current: 当前值
+
+        Returns:
+            全场期望值（支持数组广播）
+        """
+        return current + np.asarray(pre_match, dtype=np.float64) * self.remaining_share(stat, minute)
+
+    def update_predictions(self, predictions: np.ndarray, minute: Number,
+                           home_goals: Number, away_goals: Number,
+                           home_corners: Optional[Number] = None,
+                           away_corners: Optional[Number] = None) -> np.ndarray:
+        """
+        批量更新进行中比赛的预测
+
+        Args:
+            predictions: 赛前结构化预测数组（见BatchPredictionEngine.predict）
+            minute: 每场比赛已进行的分钟数（或整批相同）
+            home_goals: 主队当前进球
+            away_goals: 客队当前进球
+            home_corners: 主队当前角球，None表示未知（保留赛前角球预测）
+            away_corners: 客队当前角球
+
+        Returns:
+            np.ndarray: 更新后的结构化预测数组（保留1位小数，黄牌预测不变）
+        """
+        result = predictions.copy()
+        current = {'goals': (home_goals, away_goals)}
+        if home_corners is not None and away_corners is not None:
+            current['corners'] = (home_corners, away_corners)
+
+        for stat, (home_now, away_now) in current.items():
+            home_now = np.asarray(home_now, dtype=np.float64)
+            away_now = np.asarray(away_now, dtype=np.float64)
+            remaining = self.remaining_share(stat, minute)
+            home_field, away_field, total_field = _PREDICTION_FIELDS[stat]
+            result[home_field] = np.round(home_now + predictions[home_field] * remaining, 1)
+            result[away_field] = np.round(away_now + predictions[away_field] * remaining, 1)
+            result[total_field] = np.round(home_now + away_now + predictions[total_field] * remaining, 1)
+        return result
+
+    def update(self, prediction: PredictionResult, minute: float, home_goals: int, away_goals: int,
+               home_corners: Optional[int] = None, away_corners: Optional[int] = None) -> PredictionResult:
+        """
+        更新单场比赛的预测
+
+        Args:
+            prediction: 赛前预测结果
+            minute: 比赛已进行的分钟数
+            home_goals: 主队当前进球
+            away_goals: 客队当前进球
+            home_corners: 主队当前角球，None表示未知
+            away_corners: 客队当前角球
+
+        Returns:
+            PredictionResult: 更新后的预测结果
+        """
+        predictions = np.array([astuple(prediction)], dtype=PREDICTION_DTYPE)
+        return to_prediction_results(self.update_predictions(predictions, minute, home_goals, away_goals,
+                                                             home_corners, away_corners))[0]
+
+
+def pre_match_totals(table: MatchTable, predictor, rows: Sequence[int]) -> Dict[str, np.ndarray]:
+    """
+    历史比赛的赛前总进球、总角球预测（只使用开球前的数据，比赛内统计取未开赛时的默认值）
+
+    Args:
+        table: 历史比赛数据表
+        predictor: FootballPredictor实例
+        rows: 比赛在数据表中的行号
+
+    Returns:
+        Dict: 统计项 -> 与rows等长的预测数组
+    """
+    goals, corners = [], []
+    for row in rows:
+        match = replace(table.row(row).to_match_data(), **FIXTURE_DEFAULTS)
+        home_stats = predictor.calculate_team_stats(table, match.home_team, as_of=match.kickoff_ts)
+        away_stats = predictor.calculate_team_stats(table, match.away_team, as_of=match.kickoff_ts)
+        goals.append(predictor.predict_total_goals(home_stats, away_stats))
+        corners.append(predictor.predict_corners(match, home_stats, away_stats)["total"])
+    return {'goals': np.array(goals, dtype=np.float64), 'corners': np.array(corners, dtype=np.float64)}
+
+
+def evaluate_in_play(table: MatchTable, predictor, model: Optional[InPlayModel] = None,
+                     holdout: Optional[float] = None) -> Dict[str, Dict[str, float]]:
+    """
+    用历史快照验证滚球预测：比较赛前预测与按快照更新后的预测对全场总数的平均绝对误差
+
+    按开球时间留出最近的一部分比赛作为验证集，模型只用更早的比赛拟合（样本外误差）；
+    传入的模型若由包含验证集的数据拟合，结果为样本内误差。
+
+    Args:
+        table: 历史比赛数据表（按开球时间排序）
+        predictor: FootballPredictor实例
+        model: 滚球预测模型，None使用验证集之前的比赛拟合的模型
+        holdout: 验证集占全部比赛的比例，None使用配置默认值
+
+    Returns:
+        Dict: 快照名称（如 goals_15min）-> {'minute', 'matches', 'pre_match_mae', 'in_play_mae'}
+    """
+    holdout = DATA_CONFIG["in_play_holdout"] if holdout is None else holdout
+    split = len(table) - int(round(len(table) * holdout))
+    if model is None:
+        model = InPlayModel.fit(table.take(np.arange(split)))
+    columns = table.columns
+    valid = {suffix: (columns[f'home_{suffix}'] >= 0) & (columns[f'away_{suffix}'] >= 0)
+             for snapshots in IN_PLAY_SNAPSHOTS.values() for _, suffix in snapshots}
+    rows = split + np.flatnonzero(np.logical_or.reduce([mask[split:] for mask in valid.values()]))
+    pre_match = pre_match_totals(table, predictor, rows.tolist())
+
+    results = {}
+    for stat, snapshots in IN_PLAY_SNAPSHOTS.items():
+        actual = (columns[f'home_{stat}'] + columns[f'away_{stat}'])[rows]
+        for minute, suffix in snapshots:
+            selected = valid[suffix][rows]
+            if not selected.any():
+                continue
+            current = (columns[f'home_{suffix}'] + columns[f'away_{suffix}'])[rows][selected]
+            in_play = model.expected_final(stat, pre_match[stat][selected], minute, current)
+            results[suffix] = {
+                'minute': minute,
+                'matches': int(selected.sum()),
+                'pre_match_mae': float(np.mean(np.abs(pre_match[stat][selected] - actual[selected]))),
+                'in_play_mae': float(np.mean(np.abs(in_play - actual[selected]))),
+            }
+    return results
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+多联赛预测服务
+一次调用预测来自多个联赛的一批比赛：所有联赛共用同一个数据表的球队出场索引与球队统计缓存，
+每场比赛按其联赛编码从系数表取系数，无需为每个联赛构造预测器
+"""
+
+from typing import List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from ..models.data_models import MatchData, PredictionResult, MatchProbabilities
+from ..models.match_table import MatchTable
+from ..config.league_coefficients import DEFAULT_LEAGUE
+from .football_predictor import FootballPredictor
+from .batch_engine import BatchPredictionEngine, to_prediction_results
+from .coefficient_table import CoefficientTable
+from .in_play import InPlayModel
+
+
+class PredictionService:
+    """多联赛预测服务"""
+
+    def __init__(self, matches: MatchTable, stats_mode: Optional[str] = None,
+                 coefficient_table: Optional[CoefficientTable] = None):
+        """
+        初始化服务
+
+        Args:
+            matches: 历史比赛数据表
+            stats_mode: 球队统计方式（window/ewma），None使用配置默认值
+            coefficient_table: 联赛系数表，None使用共享系数表
+        """
+        # 球队统计与联赛无关，所有联赛共用一个预测器的统计缓存
+        self.predictor = FootballPredictor(DEFAULT_LEAGUE, stats_mode, coefficient_table)
+        self.engine = BatchPredictionEngine(self.predictor)
+        self.matches = matches
+
+    @property
+    def matches(self) -> MatchTable:
+        """历史比赛数据表"""
+        return self._matches
+
+    @matches.setter
+    def matches(self, matches: MatchTable):
+        """替换历史数据时清空球队统计缓存"""
+        self._matches = matches
+        self.predictor.team_stats_cache.clear()
+
+    def predict_fixtures(self, fixtures: Sequence[Tuple[str, str, str]]) -> np.ndarray:
+        """
+        批量预测多联赛的比赛
+
+        Args:
+            fixtures: [(主队, 客队, 联赛), ...]
+
+        Returns:
+            np.ndarray: 结构化预测结果数组（字段与PredictionResult一致）
+        """
+        table = self.matches
+        home_codes = [table.team_code(home_team) for home_team, _, _ in fixtures]
+        away_codes = [table.team_code(away_team) for _, away_team, _ in fixtures]
+        leagues = [league for _, _, league in fixtures]
+        return self.engine.predict(table, home_codes, away_codes, leagues=leagues)
+
+    def predict(self, fixtures: Sequence[Tuple[str, str, str]]) -> List[PredictionResult]:
+        """
+        批量预测多联赛的比赛
+
+        Args:
+            fixtures: [(主队, 客队, 联赛), ...]
+
+        Returns:
+            List[PredictionResult]: 预测结果列表
+        """
+        return to_prediction_results(self.predict_fixtures(fixtures))
+
+    def predict_one(self, home_team: str, away_team: str, league: str) -> PredictionResult:
+        """预测单场比赛（使用该比赛联赛的系数）"""
+        return self.predict([(home_team, away_team, league)])[0]
+
+    def predict_matches(self, matches: Sequence[MatchData]) -> List[PredictionResult]:
+        """
+        批量预测一组比赛（每场比赛使用其自身联赛的系数，比赛中的控球率、射门、犯规数据参与预测）
+
+        Args:
+            matches: 待预测的比赛列表
+
+        Returns:
+            List[PredictionResult]: 预测结果列表
+        """
+        return to_prediction_results(self.engine.predict_matches(matches, self.matches, by_league=True))
+
+    def probabilities(self, predictions: List[PredictionResult]) -> List[MatchProbabilities]:
+        """由进球预测计算胜平负、大小球、两队都进球的概率"""
+        return self.predictor.predict_probabilities(predictions)
+
+    def league_matrix(self, league: str) -> Tuple[List[str], np.ndarray]:
+        """联赛内所有主客队组合的预测矩阵，见BatchPredictionEngine.league_matrix"""
+        return self.engine.league_matrix(self.matches, league)
+
+    def update_in_play(self, predictions: np.ndarray, minute: Union[float, np.ndarray],
+                       home_goals: Union[int, np.ndarray], away_goals: Union[int, np.ndarray],
+                       home_corners: Union[int, np.ndarray, None] = None,
+                       away_corners: Union[int, np.ndarray, None] = None) -> np.ndarray:
+        """
+        按当前分钟与比分更新进行中比赛的预测（时间曲线由历史数据表的快照拟合），见InPlayModel.update_predictions
+
+        Args:
+            predictions: 赛前结构化预测数组（如predict_fixtures的结果）
+            minute: 比赛已进行的分钟数
+            home_goals: 主队当前进球
+            away_goals: 客队当前进球
+            home_corners: 主队当前角球，None表示未知
+            away_corners: 客队当前角球
+
+        Returns:
+            np.ndarray: 更新后的结构化预测数组
+        """
+        return InPlayModel.for_table(self.matches).update_predictions(predictions, minute, home_goals, away_goals,
+                                                                      home_corners, away_corners)
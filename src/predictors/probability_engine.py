@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+比分概率模块
+将预测的主客队进球率转换为截断的双变量泊松比分概率矩阵，并推导胜平负、大小球、两队都进球的概率。
+整批比赛以 (n, k, k) 数组一次性计算，k为单队进球数上限+1
+"""
+
+import math
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+from ..models.data_models import MatchProbabilities
+from ..config.league_coefficients import DATA_CONFIG
+
+
+# 概率结果结构化数组的字段（与MatchProbabilities一致）
+PROBABILITY_FIELDS = ['home_win_probability', 'draw_probability', 'away_win_probability',
+                      'over_probability', 'under_probability', 'both_teams_score_probability',
+                      'total_goals_line']
+PROBABILITY_DTYPE = np.dtype([(name, np.float64) for name in PROBABILITY_FIELDS])
+
+
+def poisson_pmf(rates: np.ndarray, max_goals: int) -> np.ndarray:
+    """
+    泊松分布概率（进球数0..max_goals）
+
+    Args:
+        rates: 进球率数组，形状 (n,)
+        max_goals: 进球数上限
+
+    Returns:
+        np.ndarray: 形状 (n, max_goals + 1)
+    """
+    goals = np.arange(max_goals + 1)
+    factorials = np.array([math.factorial(g) for g in goals], dtype=np.float64)
+    rates = np.asarray(rates, dtype=np.float64)[:, None]
+    return np.exp(-rates) * rates ** goals / factorials
+
+
+def scoreline_matrix(home_rates: Sequence[float], away_rates: Sequence[float],
+                     max_goals: Optional[int] = None, covariance: Optional[float] = None) -> np.ndarray:
+    """
+    截断的双变量泊松比分概率矩阵
+
+    主队进球 X = X1 + Z，客队进球 Y = Y2 + Z，X1、Y2、Z为独立泊松变量，Z的均值为协方差项；
+    X1、Y2的均值取进球率减去协方差项，使两队进球的边际均值等于预测进球率。
+    截断到 max_goals 后重新归一化，使每场比赛的概率之和为1。
+
+    Args:
+        home_rates: 主队进球率，形状 (n,)
+        away_rates: 客队进球率，形状 (n,)
+        max_goals: 单队进球数上限，None使用配置默认值
+        covariance: 协方差项，None使用配置默认值，0表示两队进球独立
+
+    Returns:
+        np.ndarray: 形状 (n, k, k)，[i, x, y] 为第i场比赛比分 x:y 的概率
+    """
+    max_goals = DATA_CONFIG["scoreline_max_goals"] if max_goals is None else max_goals
+    covariance = DATA_CONFIG["scoreline_covariance"] if covariance is None else covariance
+    home_rates = np.maximum(np.asarray(home_rates, dtype=np.float64), 0.0)
+    away_rates = np.maximum(np.asarray(away_rates, dtype=np.float64), 0.0)
+
+    # 协方差项不能超过任一方的进球率
+    shared = np.clip(covariance, 0.0, np.minimum(home_rates, away_rates))
+    home_pmf = poisson_pmf(home_rates - shared, max_goals)
+    away_pmf = poisson_pmf(away_rates - shared, max_goals)
+    shared_pmf = poisson_pmf(shared, max_goals)
+
+    # 按共同进球数z叠加：P(x, y) = Σ_z P(Z=z)·P(X1=x-z)·P(Y2=y-z)
+    k = max_goals + 1
+    matrix = np.zeros((len(home_rates), k, k))
+    for z in range(k):
+        matrix[:, z:, z:] += shared_pmf[:, z, None, None] * (home_pmf[:, :k - z, None] * away_pmf[:, None, :k - z])
+
+    return matrix / matrix.sum(axis=(1, 2), keepdims=True)
+
+
+def outcome_probabilities(matrix: np.ndarray, total_line: Optional[float] = None) -> np.ndarray:
+    """
+    由比分概率矩阵推导胜平负、大小球、两队都进球的概率
+
+    Args:
+        matrix: 比分概率矩阵，形状 (n, k, k)
+        total_line: 大小球盘口，None使用配置默认值
+
+    Returns:
+        np.ndarray: 结构化数组，字段与MatchProbabilities一致
+    """
+    total_line = DATA_CONFIG["total_goals_line"] if total_line is None else total_line
+    k = matrix.shape[1]
+    home_goals, away_goals = np.indices((k, k))
+    total_goals = home_goals + away_goals
+
+    result = np.empty(len(matrix), dtype=PROBABILITY_DTYPE)
+    result['home_win_probability'] = matrix[:, home_goals > away_goals].sum(axis=1)
+    result['draw_probability'] = np.trace(matrix, axis1=1, axis2=2)
+    result['away_win_probability'] = matrix[:, home_goals < away_goals].sum(axis=1)
+    result['over_probability'] = matrix[:, total_goals > total_line].sum(axis=1)
+    result['under_probability'] = matrix[:, total_goals < total_line].sum(axis=1)
+    result['both_teams_score_probability'] = matrix[:, (home_goals > 0) & (away_goals > 0)].sum(axis=1)
+    result['total_goals_line'] = total_line
+    return result
+
+
+def predict_probabilities(home_rates: Sequence[float], away_rates: Sequence[float],
+                          total_line: Optional[float] = None) -> np.ndarray:
+    """
+    批量计算比赛结果概率
+
+    Args:
+        home_rates: 主队预测进球数
+        away_rates: 客队预测进球数
+        total_line: 大小球盘口，None使用配置默认值
+
+    Returns:
+        np.ndarray: 结构化概率数组
+    """
+    return outcome_probabilities(scoreline_matrix(home_rates, away_rates), total_line)
+
+
+def to_match_probabilities(probabilities: np.ndarray) -> List[MatchProbabilities]:
+    """将结构化概率数组转换为MatchProbabilities列表"""
+    return [MatchProbabilities(*row) for row in probabilities.tolist()]
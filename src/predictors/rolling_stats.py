@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+球队滚动统计模块
+对每支球队按开球时间排列的出场记录预先计算各项统计的前缀和，
+任意时间点之前最近N场的均值只需一次二分查找和一次前缀和相减
+"""
+
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+import numpy as np
+
+from ..models.data_models import TeamStats
+from ..models.match_table import MatchTable
+from ..config.league_coefficients import DATA_CONFIG
+
+
+# TeamStats字段 -> (MatchData字段后缀, 是否取对手一侧的数据)
+ROLLING_METRICS = {
+    'avg_goals_scored': ('goals', False),
+    'avg_goals_conceded': ('goals', True),
+    'avg_shots': ('shots', False),
+    'avg_shots_on_target': ('shots_on_target', False),
+    'avg_possession': ('possession', False),
+    'avg_pass_success_rate': ('pass_success', False),
+    'avg_fouls': ('fouls', False),
+    'avg_corners': ('corners', False),
+    'avg_yellow_cards': ('yellow_cards', False),
+    'avg_red_cards': ('red_cards', False),
+}
+
+
+def match_side_values(match: Any, is_home: bool) -> np.ndarray:
+    """
+    一场比赛中某一方球队的各项统计值
+
+    Args:
+        match: 比赛数据（MatchData或数据表行视图）
+        is_home: 是否取主队一方
+
+    Returns:
+        np.ndarray: 顺序与ROLLING_METRICS一致
+    """
+    return np.array([getattr(match, f"{'home' if is_home != opponent_side else 'away'}_{field}")
+                     for field, opponent_side in ROLLING_METRICS.values()], dtype=np.float64)
+
+
+def side_value_matrix(table: MatchTable, is_home: bool) -> np.ndarray:
+    """
+    数据表每场比赛中某一方球队的各项统计值
+
+    Args:
+        table: 比赛数据表
+        is_home: 是否取主队一方
+
+    Returns:
+        np.ndarray: 形状 (比赛数, 统计项数)，列顺序与ROLLING_METRICS一致
+    """
+    columns = table.columns
+    return np.column_stack([columns[f"{'home' if is_home != opponent_side else 'away'}_{field}"]
+                            for field, opponent_side in ROLLING_METRICS.values()]).astype(np.float64)
+
+
+class TeamRollingStats:
+    """球队统计前缀和（基于球队出场索引）"""
+
+    def __init__(self, table: MatchTable):
+        """
+        构建前缀和
+
+        整数统计以int64累加，结果与逐场求均值完全一致；控球率、传球成功率以float64累加，
+        与逐场求均值只有浮点舍入级别的差异。
+
+        Args:
+            table: 按开球时间排序的比赛数据表
+        """
+        self.table = table
+        index = table.team_index()
+        positions = index.positions
+        self.offsets = index.offsets
+        self.kickoff = table.columns['kickoff_ts'][positions]
+
+        self.prefix: Dict[str, np.ndarray] = {}
+        for stat, (field, opponent_side) in ROLLING_METRICS.items():
+            home_values = table.columns[f'home_{field}'][positions]
+            away_values = table.columns[f'away_{field}'][positions]
+            values = np.where(index.is_home != opponent_side, home_values, away_values)
+            dtype = np.int64 if values.dtype.kind in 'iu' else np.float64
+            prefix = np.zeros(len(values) + 1, dtype=dtype)
+            np.cumsum(values, dtype=dtype, out=prefix[1:])
+            self.prefix[stat] = prefix
+
+    @classmethod
+    def for_table(cls, table: MatchTable) -> 'TeamRollingStats':
+        """获取数据表对应的前缀和（每个数据表只构建一次）"""
+        return table.derived('rolling_stats', lambda: cls(table))
+
+    def window(self, team_code: int, recent_n: int, as_of: Optional[int] = None) -> Tuple[int, int]:
+        """
+        球队在某时间点之前最近N场出场记录的区间
+
+        Args:
+            team_code: 球队编码（-1表示不存在的球队）
+            recent_n: 场数
+            as_of: 时间戳，只使用开球时间早于该时间的比赛；None表示使用全部比赛
+
+        Returns:
+            Tuple[int, int]: 出场记录区间 [start, end)
+        """
+        if team_code < 0 or team_code + 1 >= len(self.offsets):
+            return 0, 0
+        first, last = int(self.offsets[team_code]), int(self.offsets[team_code + 1])
+        end = last
+        if as_of is not None:
+            end = first + int(np.searchsorted(self.kickoff[first:last], as_of, side='left'))
+        return max(end - max(recent_n, 0), first), end
+
+    def team_stats(self, team_name: str, recent_n: Optional[int] = None,
+                   as_of: Optional[int] = None) -> TeamStats:
+        """
+        计算球队在某时间点之前最近N场的统计数据
+
+        Args:
+            team_name: 球队名称
+            recent_n: 使用最近N场比赛，None使用配置默认值
+            as_of: 时间戳，只使用开球时间早于该时间的比赛；None表示使用全部比赛
+
+        Returns:
+            TeamStats: 球队统计数据（数据不足时为默认值）
+        """
+        recent_n = DATA_CONFIG["recent_matches_window"] if recent_n is None else recent_n
+        start, end = self.window(self.table.team_code(team_name), recent_n, as_of)
+        count = end - start
+        if count < DATA_CONFIG["min_matches_required"]:
+            return TeamStats.default(team_name, count)
+
+        averages = {stat: float(prefix[end] - prefix[start]) / count for stat, prefix in self.prefix.items()}
+        return TeamStats(team_name=team_name, total_matches=count, **averages)
+
+
+class TeamWindowTracker:
+    """球队最近N场统计的增量跟踪器（每支球队一个环形缓冲区，新比赛到达时O(1)更新）"""
+
+    def __init__(self, recent_n: Optional[int] = None):
+        """
+        初始化跟踪器
+
+        Args:
+            recent_n: 使用最近N场比赛，None使用配置默认值
+        """
+        self.recent_n = DATA_CONFIG["recent_matches_window"] if recent_n is None else recent_n
+        self._buffers: Dict[str, np.ndarray] = {}
+        self._counts: Dict[str, int] = {}
+
+    def update_team(self, team: str, values: np.ndarray):
+        """
+        以一场比赛的统计值更新球队状态
+
+        Args:
+            team: 球队名称
+            values: 该队在这场比赛中的统计值（顺序与ROLLING_METRICS一致）
+        """
+        buffer = self._buffers.get(team)
+        if buffer is None:
+            buffer = self._buffers[team] = np.zeros((max(self.recent_n, 1), len(ROLLING_METRICS)))
+        count = self._counts.get(team, 0)
+        buffer[count % len(buffer)] = values
+        self._counts[team] = count + 1
+
+    def update(self, match: Any):
+        """
+        以一场新比赛更新两队状态（比赛需按开球时间顺序到达）
+
+        Args:
+            match: 比赛数据
+        """
+        self.update_team(match.home_team, match_side_values(match, True))
+        if match.away_team != match.home_team:
+            # 主客队相同的异常记录只记一次，与球队出场索引一致
+            self.update_team(match.away_team, match_side_values(match, False))
+
+    def extend(self, matches: Iterable[Any]):
+        """按顺序以多场比赛更新状态"""
+        for match in matches:
+            self.update(match)
+
+    def count(self, team_name: str) -> int:
+        """球队当前窗口内的比赛场数"""
+        return min(self._counts.get(team_name, 0), max(self.recent_n, 0))
+
+    def team_stats(self, team_name: str) -> TeamStats:
+        """
+        球队最近N场的统计数据（与TeamRollingStats在同一时间点的结果一致）
+
+        Args:
+            team_name: 球队名称
+
+        Returns:
+            TeamStats: 球队统计数据（比赛场数不足时为默认值）
+        """
+        count = self.count(team_name)
+        if count < DATA_CONFIG["min_matches_required"]:
+            return TeamStats.default(team_name, count)
+        averages = (self._buffers[team_name][:count].sum(axis=0) / count).tolist()
+        return TeamStats(team_name=team_name, total_matches=count, **dict(zip(ROLLING_METRICS, averages)))
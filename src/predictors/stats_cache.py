@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+球队统计缓存模块
+以 (球队, 最近场数, 时间点) 为键的有界LRU缓存，绑定数据表版本：
+比赛数据被替换（数据表版本变化）时整个缓存自动失效
+"""
+
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+from ..models.data_models import TeamStats
+from ..config.league_coefficients import DATA_CONFIG
+
+
+class TeamStatsCache:
+    """球队统计数据的LRU缓存"""
+
+    def __init__(self, maxsize: Optional[int] = None):
+        """
+        初始化缓存
+
+        Args:
+            maxsize: 最大条目数，None使用配置默认值，<=0表示不缓存
+        """
+        self.maxsize = DATA_CONFIG["team_stats_cache_size"] if maxsize is None else maxsize
+        self.dataset_version: Optional[int] = None
+        self.hits = 0
+        self.misses = 0
+        self._entries: 'OrderedDict[Hashable, TeamStats]' = OrderedDict()
+
+    def _bind(self, dataset_version: int):
+        """切换到新版本的数据时清空缓存"""
+        if dataset_version != self.dataset_version:
+            self._entries.clear()
+            self.dataset_version = dataset_version
+
+    def get(self, dataset_version: int, key: Hashable) -> Optional[TeamStats]:
+        """
+        查询缓存
+
+        Args:
+            dataset_version: 数据表版本
+            key: 缓存键
+
+        Returns:
+            Optional[TeamStats]: 命中时返回统计数据，否则返回None
+        """
+        self._bind(dataset_version)
+        stats = self._entries.get(key)
+        if stats is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return stats
+
+    def put(self, dataset_version: int, key: Hashable, stats: TeamStats):
+        """
+        写入缓存，超出容量时淘汰最久未使用的条目
+
+        Args:
+            dataset_version: 数据表版本
+            key: 缓存键
+            stats: 球队统计数据
+        """
+        if self.maxsize <= 0:
+            return
+        self._bind(dataset_version)
+        self._entries[key] = stats
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        """清空缓存（保留命中统计）"""
+        self._entries.clear()
+        self.dataset_version = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def info(self) -> Dict[str, Any]:
+        """缓存状态：条目数、容量、命中与未命中次数"""
+        return {
+            'size': len(self._entries),
+            'maxsize': self.maxsize,
+            'hits': self.hits,
+            'misses': self.misses,
+            'dataset_version': self.dataset_version
+        }
@@ -5,5 +5,12 @@
 """
 
 from .baseline_trainer import BaselineTrainer, train_baselines_from_directories
+from .backtester import WalkForwardBacktester, LeagueBaselineState
+from .metrics import MetricsAccumulator, evaluate_arrays
+from .league_accumulator import LeagueAccumulator
+from .tuner import HyperparameterTuner
+from .bootstrap import bootstrap_league_intervals
 
-__all__ = ['BaselineTrainer', 'train_baselines_from_directories']
\ No newline at end of file
+__all__ = ['BaselineTrainer', 'train_baselines_from_directories', 'WalkForwardBacktester', 'LeagueBaselineState',
+           'MetricsAccumulator', 'evaluate_arrays', 'LeagueAccumulator', 'HyperparameterTuner',
+           'bootstrap_league_intervals']
\ No newline at end of file
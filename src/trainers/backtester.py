@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+逐期回测模块
+按开球时间顺序以天或周为单位推进：每期比赛只用之前各期的数据预测，评估后再并入球队与联赛的增量状态。
+整个历史只遍历一次，不需要像K折交叉验证那样每折重新计算全部统计，也不会用到未来比赛的数据
+"""
+
+import time
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+import numpy as np
+
+from ..models.data_models import MatchData
+from ..models.match_table import MatchTable, as_match_table
+from ..config.league_coefficients import LEAGUE_COEFFICIENTS, DEFAULT_LEAGUE, DATA_CONFIG
+from ..predictors.football_predictor import FootballPredictor
+from ..predictors.batch_engine import BatchPredictionEngine, PREDICTION_DTYPE, stat_arrays
+from ..predictors.coefficient_table import COEFFICIENT_FIELDS
+from ..predictors.rolling_stats import TeamWindowTracker, side_value_matrix
+from ..predictors.form_tracker import TeamFormTracker
+from ..predictors.probability_engine import predict_probabilities
+from .baseline_trainer import BaselineTrainer
+from .metrics import MetricsAccumulator, actual_columns
+
+
+# 回测周期 -> 每期天数
+BACKTEST_PERIODS = {'day': 1, 'week': 7}
+
+_SECONDS_PER_DAY = 86400
+
+# 1970-01-01是星期四，按周划分时平移3天，使每期从星期一开始
+_WEEK_START_OFFSET = 3
+
+class LeagueBaselineState:
+    """各联赛基线参数的增量状态（基于BaselineTrainer的联赛累加器），按联赛编码批量取系数"""
+
+    def __init__(self, leagues: Sequence[str]):
+        """
+        初始化状态
+
+        Args:
+            leagues: 联赛词表（如MatchTable.leagues），coefficients以该词表的编码表示联赛
+        """
+        self.leagues = list(leagues)
+        self.trainer = BaselineTrainer()
+        # 样本不足的联赛使用配置中的系数
+        self._fallback = np.array([[LEAGUE_COEFFICIENTS.get(league, LEAGUE_COEFFICIENTS[DEFAULT_LEAGUE])[field]
+                                    for field in COEFFICIENT_FIELDS] for league in self.leagues], dtype=np.float64)
+        self._matrix = self._fallback.reshape(len(self.leagues), len(COEFFICIENT_FIELDS))
+
+    def update(self, table: MatchTable, rows: Union[slice, np.ndarray]):
+        """
+        将数据表中若干场比赛并入状态
+
+        Args:
+            table: 比赛数据表（联赛词表与初始化时一致）
+            rows: 行号切片或数组
+        """
+        self.trainer.collect_league_statistics(table.take(rows))
+        codes = {league: code for code, league in enumerate(self.leagues)}
+        matrix = self._matrix.copy()
+        for league, params in self.baselines().items():
+            matrix[codes[league]] = [params[field] for field in COEFFICIENT_FIELDS]
+        self._matrix = matrix
+
+    def coefficients(self, league_codes: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        按联赛编码批量取当前系数
+
+        Args:
+            league_codes: 联赛编码数组
+
+        Returns:
+            Dict: 系数字段 -> 与league_codes等长的数组
+        """
+        rows = self._matrix[league_codes]
+        return {field: rows[:, column] for column, field in enumerate(COEFFICIENT_FIELDS)}
+
+    def baselines(self) -> Dict[str, Dict[str, float]]:
+        """当前的联赛基线参数（见BaselineTrainer.calculate_league_baselines）"""
+        return self.trainer.calculate_league_baselines()
+
+
+class WalkForwardBacktester:
+    """逐期回测器"""
+
+    def __init__(self, period: str = 'day', stats_mode: Optional[str] = None, recent_n: Optional[int] = None):
+        """
+        初始化回测器
+
+        Args:
+            period: 回测周期（day/week）
+            stats_mode: 球队统计方式（window/ewma），None使用配置默认值
+            recent_n: window方式使用的最近比赛场数，None使用配置默认值
+        """
+        if period not in BACKTEST_PERIODS:
+            raise ValueError(f"不支持的回测周期: {period}，可选: {', '.join(BACKTEST_PERIODS)}")
+        self.period = period
+        self.predictor = FootballPredictor(stats_mode=stats_mode)
+        self.stats_mode = self.predictor.stats_mode
+        self.recent_n = DATA_CONFIG["recent_matches_window"] if recent_n is None else recent_n
+        self.engine = BatchPredictionEngine(self.predictor)
+
+    def period_ids(self, kickoff_ts: np.ndarray) -> np.ndarray:
+        """开球时间对应的期编号（按天或按周，周一为每周第一天）"""
+        days = kickoff_ts // _SECONDS_PER_DAY
+        if self.period == 'week':
+            return (days + _WEEK_START_OFFSET) // 7
+        return days
+
+    def period_start(self, period_id: int) -> int:
+        """期编号对应的起始时间戳"""
+        if self.period == 'week':
+            return (period_id * 7 - _WEEK_START_OFFSET) * _SECONDS_PER_DAY
+        return period_id * _SECONDS_PER_DAY
+
+    def new_team_tracker(self) -> Union[TeamWindowTracker, TeamFormTracker]:
+        """按统计方式创建球队增量状态"""
+        if self.stats_mode == 'ewma':
+            return TeamFormTracker()
+        return TeamWindowTracker(self.recent_n)
+
+    def run(self, matches: Union[List[MatchData], MatchTable]) -> Dict[str, Any]:
+        """
+        运行回测
+
+        Args:
+            matches: 比赛数据列表或MatchTable
+
+        Returns:
+            Dict: {'periods': 每期的评估指标列表, 'overall': 整体评估指标,
+                   'predictions': 每场比赛的赛前预测（结构化数组，与数据表行顺序一致）,
+                   'league_baselines': 回测结束时的联赛基线参数}
+        """
+        start_time = time.perf_counter()
+        table = as_match_table(matches)
+        columns = table.columns
+        teams = table.teams
+        home_codes, away_codes = columns['home_team_code'], columns['away_team_code']
+        home_values, away_values = side_value_matrix(table, True), side_value_matrix(table, False)
+
+        period_ids = self.period_ids(columns['kickoff_ts'])
+        boundaries = (np.flatnonzero(np.diff(period_ids)) + 1).tolist()
+        starts, ends = ([0] + boundaries, boundaries + [len(table)]) if len(table) else ([], [])
+
+        print(f"\n开始逐期回测（周期: {self.period}，共 {len(starts)} 期，{len(table)} 场比赛）...")
+
+        team_tracker = self.new_team_tracker()
+        league_state = LeagueBaselineState(table.leagues)
+        overall = MetricsAccumulator()
+        predictions = np.empty(len(table), dtype=PREDICTION_DTYPE)
+        periods = []
+
+        for start, end in zip(starts, ends):
+            rows = slice(start, end)
+            # 只用之前各期的状态预测本期全部比赛（比赛内统计使用未开赛时的默认值）
+            codes, inverse = np.unique(np.concatenate([home_codes[rows], away_codes[rows]]), return_inverse=True)
+            team_stats = {name: values[inverse]
+                          for name, values in stat_arrays([team_tracker.team_stats(teams[code])
+                                                           for code in codes.tolist()]).items()}
+            size = end - start
+            home = {name: values[:size] for name, values in team_stats.items()}
+            away = {name: values[size:] for name, values in team_stats.items()}
+            predictions[rows] = self.engine.predict_stats(home, away,
+                                                          league_state.coefficients(columns['league_code'][rows]))
+
+            # 本期指标单独累计后并入整体，不需要保留每场比赛的误差
+            metrics = MetricsAccumulator()
+            metrics.update(predictions[rows], actual_columns(columns, rows),
+                           predict_probabilities(predictions['home_team_goals'][rows],
+                                                 predictions['away_team_goals'][rows]))
+            overall.merge(metrics)
+            periods.append({'period': time.strftime('%Y-%m-%d', time.gmtime(self.period_start(int(period_ids[start])))),
+                            'matches': size, **metrics.summary()})
+
+            # 评估后并入本期比赛
+            for i in range(start, end):
+                team_tracker.update_team(teams[home_codes[i]], home_values[i])
+                if away_codes[i] != home_codes[i]:
+                    # 主客队相同的异常记录只记一次，与球队出场索引一致
+                    team_tracker.update_team(teams[away_codes[i]], away_values[i])
+            league_state.update(table, rows)
+
+        overall = overall.summary()
+        if len(table):
+            print(f"回测结果: 进球MAE {overall['MAE_goals']:.3f}, 角球MAE {overall['total_corners_MAE']:.3f}, "
+                  f"黄牌MAE {overall['total_yellow_cards_MAE']:.3f}, 准确率 {overall['accuracy_direction']:.3f}, "
+                  f"胜平负Brier {overall['brier_1x2']:.3f}")
+        print(f"回测用时: {time.perf_counter() - start_time:.2f} 秒")
+
+        return {
+            'periods': periods,
+            'overall': overall,
+            'predictions': predictions,
+            'league_baselines': league_state.baselines(),
+        }
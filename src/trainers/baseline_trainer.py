@@ -8,11 +8,23 @@
 import numpy as np
 import pandas as pd
 from collections import defaultdict
-from typing import Dict, List, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Tuple, Iterable, Optional, Union
 import json
+import time
 
 from ..models.data_models import MatchData
-from ..config.league_coefficients import LEAGUE_COEFFICIENTS
+from ..models.match_table import MatchTable, as_match_table
+from ..config.league_coefficients import LEAGUE_COEFFICIENTS, DATA_CONFIG
+from ..data.data_processor import iter_chunks, resolve_workers
+from ..data.shared_table import SharedMatchTable
+from .metrics import goal_direction_metrics
+from .league_accumulator import LeagueAccumulator, LEAGUE_METRICS, league_coefficients, league_metric_columns
+from .bootstrap import BOOTSTRAP_COEFFICIENTS, bootstrap_league_intervals
+
+
+# 计算联赛基线所需的最少比赛数（数据量太少的联赛跳过，使用配置中的系数）
+MIN_LEAGUE_SAMPLE_SIZE = 10
 
 
 class BaselineTrainer:
@@ -20,30 +32,87 @@ class BaselineTrainer:
     
     def __init__(self):
         """初始化训练器"""
-        self.league_stats = defaultdict(list)  # 存储各联赛的统计数据
+        # 各联赛的统计累加器：联赛名 -> LeagueAccumulator
+        self.league_stats: Dict[str, LeagueAccumulator] = defaultdict(LeagueAccumulator)
     
-    def collect_league_statistics(self, matches: List[MatchData]):
+    def collect_league_statistics(self, matches: Union[Iterable[MatchData], MatchTable],
+                                  chunk_size: Optional[int] = None) -> int:
         """
         收集各联赛的统计数据
         
+        支持列表或生成器（如iter_matches）输入，按块消费，不要求整个数据集驻留内存；
+        MatchTable输入直接在数组上按联赛分组。每块数据并入各联赛的累加器后即可丢弃，
+        新增数据时只需继续收集，不需要重新处理已训练的数据。
+        
+        Args:
+            matches: 比赛数据列表、生成器或MatchTable
+            chunk_size: 每块比赛数，None使用配置默认值
+            
+        Returns:
+            int: 本次收集的比赛数
+        """
+        if isinstance(matches, MatchTable):
+            self._collect_table(matches)
+            return len(matches)
+        
+        collected = 0
+        for chunk in iter_chunks(matches, chunk_size):
+            self._collect_table(MatchTable.from_matches(chunk))
+            collected += len(chunk)
+        
+        return collected
+    
+    def _collect_table(self, table: MatchTable):
+        """
+        按联赛分组将数据表中的各项统计并入累加器
+        
         Args:
-            matches: 比赛数据列表
+            table: 比赛数据表
         """
-        for match in matches:
-            league = match.league
+        if len(table) == 0:
+            return
+        
+        metrics = league_metric_columns(table.columns)
+        
+        # 稳定排序后按联赛编码切分
+        league_codes = table.columns['league_code']
+        order = np.argsort(league_codes, kind='stable')
+        sorted_codes = league_codes[order]
+        boundaries = np.flatnonzero(np.diff(sorted_codes)) + 1
+        
+        for group in np.split(order, boundaries):
+            league = table.leagues[int(league_codes[group[0]])]
+            self.league_stats[league].update_batch({name: values[group] for name, values in metrics.items()})
+    
+    def update_match(self, match: MatchData):
+        """
+        以一场新比赛更新所属联赛的累加器（O(1)）
+        
+        Args:
+            match: 比赛数据
+        """
+        self.league_stats[match.league].update({
+            'total_goals': match.home_goals + match.away_goals,
+            'total_corners': match.home_corners + match.away_corners,
+            'total_yellow_cards': match.home_yellow_cards + match.away_yellow_cards,
+            'home_goals': match.home_goals,
+            'away_goals': match.away_goals,
+            'total_fouls': match.home_fouls + match.away_fouls,
+        })
+    
+    def merge(self, other: 'BaselineTrainer') -> 'BaselineTrainer':
+        """
+        合并另一个训练器收集的统计数据（如并行处理不同数据分片的结果）
+        
+        Args:
+            other: 另一个训练器
             
-            # 收集各项统计数据
-            self.league_stats[league].append({
-                'total_goals': match.home_goals + match.away_goals,
-                'total_corners': match.home_corners + match.away_corners,
-                'total_yellow_cards': match.home_yellow_cards + match.away_yellow_cards,
-                'home_goals': match.home_goals,
-                'away_goals': match.away_goals,
-                'home_possession': match.home_possession,
-                'away_possession': match.away_possession,
-                'home_fouls': match.home_fouls,
-                'away_fouls': match.away_fouls
-            })
+        Returns:
+            BaselineTrainer: self
+        """
+        for league, accumulator in other.league_stats.items():
+            self.league_stats[league].merge(accumulator)
+        return self
     
     def calculate_league_baselines(self) -> Dict[str, Dict[str, float]]:
         """
@@ -54,72 +123,97 @@ class BaselineTrainer:
         """
         baselines = {}
         
-        for league, stats_list in self.league_stats.items():
-            if len(stats_list) < 10:  # 数据量太少的联赛跳过
+        for league, accumulator in self.league_stats.items():
+            sample_size = accumulator.count
+            if sample_size < MIN_LEAGUE_SAMPLE_SIZE:  # 数据量太少的联赛跳过
                 continue
-                
-            # 转换为numpy数组便于计算
-            total_goals = np.array([s['total_goals'] for s in stats_list])
-            total_corners = np.array([s['total_corners'] for s in stats_list])
-            total_yellow = np.array([s['total_yellow_cards'] for s in stats_list])
-            home_goals = np.array([s['home_goals'] for s in stats_list])
-            away_goals = np.array([s['away_goals'] for s in stats_list])
-            home_fouls = np.array([s['home_fouls'] for s in stats_list])
-            away_fouls = np.array([s['away_fouls'] for s in stats_list])
-            
-            # 计算基本统计量
-            avg_total_goals = np.mean(total_goals)
-            avg_total_corners = np.mean(total_corners)
-            avg_total_yellow = np.mean(total_yellow)
-            
-            # 计算主场优势（主场进球/客场进球）
-            home_advantage = np.mean(home_goals) / (np.mean(away_goals) + 1e-8)
             
-            # 计算犯规到黄牌的转换率
-            total_fouls = np.mean(home_fouls + away_fouls)
-            foul_to_yellow_ratio = avg_total_yellow / (total_fouls + 1e-8)
+            coefficients = league_coefficients({name: accumulator.mean(name) for name in LEAGUE_METRICS})
             
             # 构造基线系数
-            baselines[league] = {
-                'goal_baseline': float(avg_total_goals),
-                'corner_baseline': float(avg_total_corners),
-                'yellow_card_baseline': float(avg_total_yellow),
-                'home_advantage': float(home_advantage),
-                'foul_to_yellow': float(foul_to_yellow_ratio),
+            baselines[league] = {name: float(value) for name, value in coefficients.items()}
+            baselines[league].update({
                 'red_card_penalty': 2.0,  # 红牌折算保持默认值
-                'sample_size': len(stats_list)
-            }
+                'sample_size': sample_size
+            })
         
         return baselines
     
-    def train_from_matches(self, matches: List[MatchData]) -> Dict[str, Dict[str, float]]:
+    def skipped_leagues(self) -> Dict[str, int]:
+        """
+        样本不足、未计算基线参数的联赛
+        
+        Returns:
+            Dict: 联赛名 -> 比赛数
+        """
+        return {league: accumulator.count for league, accumulator in self.league_stats.items()
+                if accumulator.count < MIN_LEAGUE_SAMPLE_SIZE}
+    
+    def train_from_matches(self, matches: Iterable[MatchData], bootstrap_resamples: Optional[int] = None,
+                           seed: Optional[int] = None) -> Dict[str, Dict[str, float]]:
         """
         从比赛数据训练基线参数
         
+        重抽样次数大于0且输入为列表或MatchTable时，同时计算各系数的自助法置信区间，保存在 {系数名}_ci 中；
+        生成器输入不保留逐场数据，只计算点估计。
+        
         Args:
-            matches: 比赛数据列表
+            matches: 比赛数据列表、生成器或MatchTable
+            bootstrap_resamples: 自助法重抽样次数，None使用配置默认值，0表示不计算置信区间
+            seed: 自助法随机种子，None使用全局随机状态
             
         Returns:
             Dict: 训练得到的基线系数
         """
-        print(f"开始训练基线参数，共 {len(matches)} 场比赛...")
+        if hasattr(matches, '__len__'):
+            print(f"开始训练基线参数，共 {len(matches)} 场比赛...")
+        else:
+            print("开始训练基线参数（流式读取比赛数据）...")
         
         # 收集统计数据
-        self.collect_league_statistics(matches)
+        collected = self.collect_league_statistics(matches)
+        if not hasattr(matches, '__len__'):
+            print(f"共读取 {collected} 场比赛")
         
         # 计算基线参数
         baselines = self.calculate_league_baselines()
         
+        # 自助法置信区间（需要逐场数据）
+        bootstrap_resamples = DATA_CONFIG["bootstrap_resamples"] if bootstrap_resamples is None else bootstrap_resamples
+        intervals = {}
+        if bootstrap_resamples > 0 and hasattr(matches, '__len__'):
+            start_time = time.perf_counter()
+            intervals = bootstrap_league_intervals(as_match_table(matches), bootstrap_resamples, seed=seed)
+            if intervals:
+                print(f"自助法置信区间计算完成，用时 {time.perf_counter() - start_time:.2f} 秒")
+        elif bootstrap_resamples > 0:
+            print("流式输入不保留逐场数据，未计算置信区间")
+        for league, params in baselines.items():
+            if league in intervals:
+                params.update({f'{name}_ci': intervals[league][name] for name in BOOTSTRAP_COEFFICIENTS})
+        
         # 显示训练结果
         print("\n训练完成！各联赛基线参数:")
         print("-" * 50)
         for league, params in baselines.items():
             print(f"\n{league} (样本数: {params['sample_size']}):")
-            print(f"  场均总进球: {params['goal_baseline']:.2f}")
-            print(f"  场均总角球: {params['corner_baseline']:.2f}")
-            print(f"  场均总黄牌: {params['yellow_card_baseline']:.2f}")
-            print(f"  主场优势系数: {params['home_advantage']:.3f}")
-            print(f"  犯规转黄牌系数: {params['foul_to_yellow']:.3f}")
+            print(f"  场均总进球: {params['goal_baseline']:.2f}{_format_interval(params, 'goal_baseline', 2)}")
+            print(f"  场均总角球: {params['corner_baseline']:.2f}{_format_interval(params, 'corner_baseline', 2)}")
+            print(f"  场均总黄牌: {params['yellow_card_baseline']:.2f}"
+                  f"{_format_interval(params, 'yellow_card_baseline', 2)}")
+            print(f"  主场优势系数: {params['home_advantage']:.3f}{_format_interval(params, 'home_advantage', 3)}")
+            print(f"  犯规转黄牌系数: {params['foul_to_yellow']:.3f}{_format_interval(params, 'foul_to_yellow', 3)}")
+        
+        # 样本不足的联赛不写入基线参数（使用配置中的系数），在这里列出
+        skipped = self.skipped_leagues()
+        if skipped:
+            print(f"\n样本数不足 {MIN_LEAGUE_SAMPLE_SIZE} 场、使用配置系数的联赛:")
+            for league, count in skipped.items():
+                detail = ""
+                if league in intervals:
+                    lower, upper = intervals[league]['home_advantage']
+                    detail = f"，主场优势区间 [{lower:.3f}, {upper:.3f}]"
+                print(f"  {league} (样本数: {count}{detail})")
         
         return baselines
     
@@ -128,21 +222,20 @@ class BaselineTrainer:
         保存训练得到的基线参数
         
         Args:
-            baselines: 基线参数字典
+            baselines: 基线参数字典（可包含 {系数名}_ci 置信区间）
             file_path: 保存文件路径
         """
-        # 转换为可序列化的格式
+        # 转换为可序列化的格式（有置信区间时写在对应系数之后）
         serializable_baselines = {}
         for league, params in baselines.items():
-            serializable_baselines[league] = {
-                'goal_baseline': float(params['goal_baseline']),
-                'corner_baseline': float(params['corner_baseline']),
-                'yellow_card_baseline': float(params['yellow_card_baseline']),
-                'home_advantage': float(params['home_advantage']),
-                'foul_to_yellow': float(params['foul_to_yellow']),
-                'red_card_penalty': float(params['red_card_penalty']),
-                'sample_size': int(params['sample_size'])
-            }
+            serializable = {}
+            for name in ('goal_baseline', 'corner_baseline', 'yellow_card_baseline',
+                         'home_advantage', 'foul_to_yellow', 'red_card_penalty'):
+                serializable[name] = float(params[name])
+                if f'{name}_ci' in params:
+                    serializable[f'{name}_ci'] = [float(value) for value in params[f'{name}_ci']]
+            serializable['sample_size'] = int(params['sample_size'])
+            serializable_baselines[league] = serializable
         
         with open(file_path, 'w', encoding='utf-8') as f:
             json.dump(serializable_baselines, f, indent=2, ensure_ascii=False)
@@ -164,89 +257,68 @@ class BaselineTrainer:
         if len(predictions) != len(actual_results):
             raise ValueError("预测数量与实际结果数量不匹配")
         
-        # 计算各种误差指标
-        mae_goals = []  # 平均绝对误差
-        rmse_goals = []  # 均方根误差
-        correct_direction = 0  # 胜平负方向正确的次数
-        
-        total_predictions = len(predictions)
-        
-        for pred, actual in zip(predictions, actual_results):
-            pred_home, pred_away = pred
-            actual_home, actual_away = actual
-            
-            # 进球数误差
-            home_error = abs(pred_home - actual_home)
-            away_error = abs(pred_away - actual_away)
-            mae_goals.extend([home_error, away_error])
-            rmse_goals.extend([(pred_home - actual_home)**2, (pred_away - actual_away)**2])
-            
-            # 胜平负方向判断
-            pred_result = "win" if pred_home > pred_away else "draw" if pred_home == pred_away else "lose"
-            actual_result = "win" if actual_home > actual_away else "draw" if actual_home == actual_away else "lose"
-            
-            if pred_result == actual_result:
-                correct_direction += 1
-        
-        # 计算最终指标
-        metrics = {
-            'MAE_goals': np.mean(mae_goals),
-            'RMSE_goals': np.sqrt(np.mean(rmse_goals)),
-            'accuracy_direction': correct_direction / total_predictions,
-            'total_samples': total_predictions
-        }
-        
-        return metrics
+        # 进球误差（主客队合并）与胜平负方向准确率，在数组上一次计算
+        return goal_direction_metrics(predictions, actual_results)
     
-    def cross_validate(self, matches: List[MatchData], k_folds: int = 5) -> Dict[str, float]:
+    def cross_validate(self, matches: Union[List[MatchData], MatchTable], k_folds: int = 5,
+                       workers: Optional[int] = None, seed: Optional[int] = None) -> Dict[str, float]:
         """
         K折交叉验证评估模型性能
         
+        比赛数据只转换一次为数据表；多进程时各折在进程池中并行运行，子进程从共享内存映射数据表，
+        只接收该折的下标。每折的随机种子由总种子派生，结果与进程数和完成顺序无关。
+        
         Args:
-            matches: 比赛数据
+            matches: 比赛数据列表或MatchTable
             k_folds: 折数
+            workers: 并行进程数，None使用配置默认值，<=0表示使用全部CPU核心
+            seed: 随机种子，None使用NumPy全局随机状态（可由np.random.seed控制）
             
         Returns:
             Dict: 平均评估指标
         """
-        from ..predictors.football_predictor import FootballPredictor
-        
-        # 随机打乱数据
-        np.random.shuffle(matches)
+        start_time = time.perf_counter()
         
-        fold_size = len(matches) // k_folds
-        all_metrics = []
+        if isinstance(matches, MatchTable):
+            table = matches
+            row_of = np.arange(len(table))
+        else:
+            # 数据表按开球时间稳定排序，记录列表下标对应的数据表行号
+            table = MatchTable.from_matches(matches)
+            order = np.argsort(np.array([match.kickoff_ts for match in matches], dtype=np.int64), kind='stable')
+            row_of = np.empty(len(order), dtype=np.int64)
+            row_of[order] = np.arange(len(order))
         
-        print(f"\n开始 {k_folds} 折交叉验证...")
+        # 随机打乱数据（各折的评估本身是确定的，不使用随机数）
+        rng = np.random if seed is None else np.random.RandomState(seed)
+        shuffled = row_of[rng.permutation(len(row_of))]
         
+        fold_size = len(shuffled) // k_folds
+        kickoff = table.columns['kickoff_ts']
+        folds = []
         for fold in range(k_folds):
-            # 分割训练集和测试集
+            # 分割训练集和测试集，训练集按开球时间稳定排序（与由比赛列表构建数据表的顺序一致）
             test_start = fold * fold_size
-            test_end = test_start + fold_size if fold < k_folds - 1 else len(matches)
-            
-            test_matches = matches[test_start:test_end]
-            train_matches = matches[:test_start] + matches[test_end:]
-            
-            # 训练基线参数
-            temp_trainer = BaselineTrainer()
-            baselines = temp_trainer.train_from_matches(train_matches)
-            
-            # 进行预测
-            predictor = FootballPredictor()
-            predictions = []
-            actual_results = []
-            
-            for match in test_matches:
-                pred_result = predictor.predict_match(match, train_matches)
-                predictions.append((pred_result.home_team_goals, pred_result.away_team_goals))
-                actual_results.append((match.home_goals, match.away_goals))
-            
-            # 评估
-            metrics = self.evaluate_predictions(predictions, actual_results)
-            all_metrics.append(metrics)
-            
-            print(f"第 {fold + 1} 折 - MAE: {metrics['MAE_goals']:.3f}, "
-                  f"准确率: {metrics['accuracy_direction']:.3f}")
+            test_end = test_start + fold_size if fold < k_folds - 1 else len(shuffled)
+            train_rows = np.concatenate([shuffled[:test_start], shuffled[test_end:]])
+            train_rows = train_rows[np.argsort(kickoff[train_rows], kind='stable')]
+            folds.append((fold, shuffled[test_start:test_end], train_rows))
+        
+        workers = DATA_CONFIG["cv_workers"] if workers is None else workers
+        workers = min(resolve_workers(workers), k_folds)
+        
+        print(f"\n开始 {k_folds} 折交叉验证（{workers} 个进程）...")
+        
+        all_metrics = []
+        if workers <= 1:
+            results = (_evaluate_fold(table, *task) for task in folds)
+            all_metrics = self._report_folds(results)
+        else:
+            with SharedMatchTable(table) as shared:
+                with ProcessPoolExecutor(max_workers=workers, initializer=_attach_fold_table,
+                                         initargs=(shared.spec,)) as executor:
+                    # executor.map按折的顺序返回结果，输出与串行运行一致
+                    all_metrics = self._report_folds(executor.map(_evaluate_shared_fold, folds))
         
         # 计算平均指标
         avg_metrics = {
@@ -259,37 +331,124 @@ class BaselineTrainer:
         print(f"\n交叉验证结果:")
         print(f"平均MAE: {avg_metrics['avg_MAE_goals']:.3f} ± {avg_metrics['std_MAE_goals']:.3f}")
         print(f"平均准确率: {avg_metrics['avg_accuracy_direction']:.3f}")
+        print(f"交叉验证用时: {time.perf_counter() - start_time:.2f} 秒")
         
         return avg_metrics
+    
+    @staticmethod
+    def _report_folds(results: Iterable[Tuple[int, Dict[str, float]]]) -> List[Dict[str, float]]:
+        """按顺序收集各折的评估指标并输出进度"""
+        all_metrics = []
+        for fold, metrics in results:
+            all_metrics.append(metrics)
+            print(f"第 {fold + 1} 折 - MAE: {metrics['MAE_goals']:.3f}, "
+                  f"准确率: {metrics['accuracy_direction']:.3f}")
+        return all_metrics
+
+
+# 进程池子进程中从共享内存映射的数据表（共享内存对象需与数据表一同保留）
+_fold_table: Optional[Tuple[Any, MatchTable]] = None
+
+
+def _attach_fold_table(spec: Dict[str, Any]):
+    """进程池初始化：映射共享内存中的数据表"""
+    global _fold_table
+    _fold_table = SharedMatchTable.attach(spec)
+
+
+def _evaluate_shared_fold(task: Tuple[int, np.ndarray, np.ndarray]) -> Tuple[int, Dict[str, float]]:
+    """进程池任务：在共享数据表上评估一折"""
+    return _evaluate_fold(_fold_table[1], *task)
+
+
+def _evaluate_fold(table: MatchTable, fold: int, test_rows: np.ndarray,
+                   train_rows: np.ndarray) -> Tuple[int, Dict[str, float]]:
+    """
+    评估交叉验证的一折
+    
+    Args:
+        table: 全部比赛的数据表
+        fold: 折序号
+        test_rows: 测试集行号
+        train_rows: 训练集行号（按开球时间排序）
+        
+    Returns:
+        Tuple: (折序号, 评估指标)
+    """
+    from ..predictors.football_predictor import FootballPredictor
+    from ..predictors.batch_engine import BatchPredictionEngine, FIXTURE_DEFAULTS
+    from ..predictors.coefficient_table import CoefficientTable
+    
+    # 训练集与全表共享词表，测试比赛的球队编码可直接使用
+    train_table = table.take(train_rows)
+    
+    # 训练基线参数（只用该折训练集，不读取全量数据训练得到的基线文件，避免泄漏测试集信息）
+    temp_trainer = BaselineTrainer()
+    temp_trainer.collect_league_statistics(train_table)
+    coefficient_table = CoefficientTable.from_baselines(temp_trainer.calculate_league_baselines())
+    
+    # 进行预测（整折向量化，结果与逐场预测一致）
+    columns = table.columns
+    fixtures = {name: columns[name][test_rows] for name in FIXTURE_DEFAULTS}
+    predictor = FootballPredictor(coefficient_table=coefficient_table)
+    predictions = BatchPredictionEngine(predictor).predict(
+        train_table, columns['home_team_code'][test_rows], columns['away_team_code'][test_rows], fixtures)
+    
+    predicted = list(zip(predictions['home_team_goals'].tolist(), predictions['away_team_goals'].tolist()))
+    actual_results = list(zip(columns['home_goals'][test_rows].tolist(), columns['away_goals'][test_rows].tolist()))
+    return fold, temp_trainer.evaluate_predictions(predicted, actual_results)
+
+
+def _format_interval(params: Dict[str, Any], name: str, digits: int) -> str:
+    """格式化系数的置信区间（没有置信区间时为空字符串）"""
+    if f'{name}_ci' not in params:
+        return ""
+    lower, upper = params[f'{name}_ci']
+    return f" [{lower:.{digits}f}, {upper:.{digits}f}]"
 
 
 # 便捷训练函数
 def train_baselines_from_directories(directories: List[str], 
-                                   output_file: str = "trained_baselines.json") -> Dict[str, Dict[str, float]]:
+                                   output_file: Optional[str] = None,
+                                   stream: bool = False,
+                                   store_dir: Optional[str] = None) -> Dict[str, Dict[str, float]]:
     """
     从目录训练基线参数的便捷函数
     
     Args:
         directories: 数据目录列表
-        output_file: 输出文件名
+        output_file: 输出文件名，None使用预测器默认加载的基线文件（相对项目根目录）
+        stream: 是否流式读取原始数据（不生成中间CSV，也不将全部比赛载入内存）
+        store_dir: 列式二进制存储目录，提供时优先从存储加载
         
     Returns:
         Dict: 训练得到的基线参数
     """
-    from ..data.data_processor import process_football_data
+    from ..data.data_processor import process_football_data, load_football_data, iter_matches
+    from ..predictors.coefficient_table import default_baselines_file
     
-    # 处理数据
-    print("正在处理训练数据...")
-    matches = process_football_data(directories)
-    
-    if not matches:
-        raise ValueError("没有找到有效的训练数据")
-    
-    # 训练基线参数
     trainer = BaselineTrainer()
-    baselines = trainer.train_from_matches(matches)
+    
+    if stream:
+        print("正在流式读取训练数据...")
+        baselines = trainer.train_from_matches(iter_matches(directories))
+        if not trainer.league_stats:
+            raise ValueError("没有找到有效的训练数据")
+    else:
+        # 处理数据
+        print("正在处理训练数据...")
+        if store_dir:
+            matches = load_football_data(directories, store_dir, as_table=True)
+        else:
+            matches = process_football_data(directories)
+        
+        if not matches:
+            raise ValueError("没有找到有效的训练数据")
+        
+        # 训练基线参数
+        baselines = trainer.train_from_matches(matches)
     
     # 保存结果
-    trainer.save_baselines(baselines, output_file)
+    trainer.save_baselines(baselines, output_file or default_baselines_file())
     
     return baselines
\ No newline at end of file
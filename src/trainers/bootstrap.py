@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+联赛系数的自助法置信区间模块
+每个联赛的全部重抽样以一个索引矩阵一次抽取，各项指标的重抽样均值由数组索引与按行求和得到，
+不需要逐次重抽样的Python循环；系数由与点估计相同的公式（league_coefficients）逐元素计算
+"""
+
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+from ..models.match_table import MatchTable
+from ..config.league_coefficients import DATA_CONFIG
+from .league_accumulator import LEAGUE_METRICS, league_coefficients, league_metric_columns
+
+
+# 计算置信区间的联赛系数（red_card_penalty为固定值，不需要估计）
+BOOTSTRAP_COEFFICIENTS = ('goal_baseline', 'corner_baseline', 'yellow_card_baseline', 'home_advantage', 'foul_to_yellow')
+
+# 每块重抽样索引矩阵的最大元素数（大联赛按块抽取，限制内存占用）
+_MAX_BLOCK_ELEMENTS = 1 << 22
+
+
+def bootstrap_coefficients(values: np.ndarray, n_resamples: int, rng: Any = np.random) -> Dict[str, np.ndarray]:
+    """
+    单个联赛各系数的自助法重抽样分布
+
+    Args:
+        values: 形状 (比赛数, 指标数) 的逐场指标，列顺序与LEAGUE_METRICS一致
+        n_resamples: 重抽样次数
+        rng: 随机数生成器（np.random或RandomState）
+
+    Returns:
+        Dict: 系数名 -> 长度为n_resamples的重抽样系数
+    """
+    n = len(values)
+    sums = np.empty((n_resamples, values.shape[1]))
+    block = max(1, _MAX_BLOCK_ELEMENTS // max(n, 1))
+    for start in range(0, n_resamples, block):
+        size = min(block, n_resamples - start)
+        indices = rng.randint(0, n, size=(size, n))
+        for column in range(values.shape[1]):
+            sums[start:start + size, column] = values[:, column][indices].sum(axis=1)
+    return league_coefficients(dict(zip(LEAGUE_METRICS, (sums / n).T)))
+
+
+def bootstrap_league_intervals(table: MatchTable, n_resamples: Optional[int] = None,
+                               confidence: Optional[float] = None,
+                               seed: Optional[int] = None) -> Dict[str, Dict[str, Any]]:
+    """
+    计算各联赛系数的自助法百分位置信区间（包括样本不足、不参与训练的联赛）
+
+    Args:
+        table: 比赛数据表
+        n_resamples: 重抽样次数，None使用配置默认值
+        confidence: 置信水平，None使用配置默认值
+        seed: 随机种子，None使用全局随机状态
+
+    Returns:
+        Dict: 联赛名 -> {'sample_size': 比赛数, 系数名: (下限, 上限), ...}
+    """
+    n_resamples = DATA_CONFIG["bootstrap_resamples"] if n_resamples is None else n_resamples
+    confidence = DATA_CONFIG["bootstrap_confidence"] if confidence is None else confidence
+    rng = np.random if seed is None else np.random.RandomState(seed)
+    if len(table) == 0 or n_resamples <= 0:
+        return {}
+
+    metrics = league_metric_columns(table.columns)
+    values = np.column_stack([np.asarray(metrics[name], dtype=np.float64) for name in LEAGUE_METRICS])
+    percentiles = [50 * (1 - confidence), 50 * (1 + confidence)]
+
+    # 稳定排序后按联赛编码切分
+    league_codes = table.columns['league_code']
+    order = np.argsort(league_codes, kind='stable')
+    boundaries = np.flatnonzero(np.diff(league_codes[order])) + 1
+
+    intervals = {}
+    for group in np.split(order, boundaries):
+        samples = bootstrap_coefficients(values[group], n_resamples, rng)
+        interval = {'sample_size': len(group)}
+        for name in BOOTSTRAP_COEFFICIENTS:
+            lower, upper = np.percentile(samples[name], percentiles)
+            interval[name] = (float(lower), float(upper))
+        intervals[table.leagues[int(league_codes[group[0]])]] = interval
+    return intervals
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+联赛统计累加器模块
+每个联赛只保存比赛数、各项指标之和与Welford方差状态，新比赛以O(1)代价并入；
+不同数据分片（如并行处理的文件）得到的累加器可以直接合并，不需要保留逐场数据
+"""
+
+from typing import Dict, Mapping, Union
+
+import numpy as np
+
+
+# 累计的指标（均为整数，指标之和以float64精确表示）
+LEAGUE_METRICS = ('total_goals', 'total_corners', 'total_yellow_cards', 'home_goals', 'away_goals', 'total_fouls')
+
+
+def league_metric_columns(columns: Mapping[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    """
+    由比赛数据列计算各项联赛指标
+
+    Args:
+        columns: 列名 -> 数组（如MatchTable.columns或其切片）
+
+    Returns:
+        Dict: 指标名 -> 数组
+    """
+    return {
+        'total_goals': columns['home_goals'] + columns['away_goals'],
+        'total_corners': columns['home_corners'] + columns['away_corners'],
+        'total_yellow_cards': columns['home_yellow_cards'] + columns['away_yellow_cards'],
+        'home_goals': columns['home_goals'],
+        'away_goals': columns['away_goals'],
+        'total_fouls': columns['home_fouls'] + columns['away_fouls'],
+    }
+
+
+def league_coefficients(means: Mapping[str, Union[float, np.ndarray]]) -> Dict[str, Union[float, np.ndarray]]:
+    """
+    由各项指标均值计算联赛系数（标量或逐元素计算的数组，如自助法重抽样的均值）
+
+    Args:
+        means: 指标名 -> 均值
+
+    Returns:
+        Dict: 系数名 -> 值（goal_baseline、corner_baseline、yellow_card_baseline、home_advantage、foul_to_yellow）
+    """
+    return {
+        'goal_baseline': means['total_goals'],
+        'corner_baseline': means['total_corners'],
+        'yellow_card_baseline': means['total_yellow_cards'],
+        # 主场优势：主场进球/客场进球
+        'home_advantage': means['home_goals'] / (means['away_goals'] + 1e-8),
+        # 犯规到黄牌的转换率
+        'foul_to_yellow': means['total_yellow_cards'] / (means['total_fouls'] + 1e-8),
+    }
+
+
+class LeagueAccumulator:
+    """单个联赛的统计累加器"""
+
+    def __init__(self):
+        """初始化空累加器"""
+        self.count = 0
+        # 指标之和（用于均值，结果与对全部数据求np.mean一致）
+        self.sums = np.zeros(len(LEAGUE_METRICS))
+        # Welford状态：均值与离差平方和（用于方差）
+        self.means = np.zeros(len(LEAGUE_METRICS))
+        self.m2 = np.zeros(len(LEAGUE_METRICS))
+
+    def update(self, values: Mapping[str, float]):
+        """
+        并入一场比赛
+
+        Args:
+            values: 指标名 -> 该场比赛的值
+        """
+        row = np.array([values[name] for name in LEAGUE_METRICS], dtype=np.float64)
+        self.count += 1
+        self.sums += row
+        delta = row - self.means
+        self.means += delta / self.count
+        self.m2 += delta * (row - self.means)
+
+    def update_batch(self, metrics: Mapping[str, np.ndarray]):
+        """
+        并入一批比赛
+
+        Args:
+            metrics: 指标名 -> 数组（见league_metric_columns）
+        """
+        values = np.column_stack([np.asarray(metrics[name], dtype=np.float64) for name in LEAGUE_METRICS])
+        if len(values) == 0:
+            return
+        batch = LeagueAccumulator()
+        batch.count = len(values)
+        batch.sums = values.sum(axis=0)
+        batch.means = batch.sums / batch.count
+        batch.m2 = ((values - batch.means) ** 2).sum(axis=0)
+        self.merge(batch)
+
+    def merge(self, other: 'LeagueAccumulator') -> 'LeagueAccumulator':
+        """
+        合并另一个累加器（Chan等人的并行方差合并公式）
+
+        Args:
+            other: 另一个累加器
+
+        Returns:
+            LeagueAccumulator: self
+        """
+        if other.count == 0:
+            return self
+        count = self.count + other.count
+        delta = other.means - self.means
+        self.m2 = self.m2 + other.m2 + delta ** 2 * (self.count * other.count / count)
+        self.means = self.means + delta * (other.count / count)
+        self.sums = self.sums + other.sums
+        self.count = count
+        return self
+
+    def mean(self, name: str) -> float:
+        """指标均值"""
+        return self.sums[LEAGUE_METRICS.index(name)] / self.count
+
+    def variance(self, name: str) -> float:
+        """指标的样本方差（比赛数不足2时为0）"""
+        if self.count < 2:
+            return 0.0
+        return float(self.m2[LEAGUE_METRICS.index(name)] / (self.count - 1))
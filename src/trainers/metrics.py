@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+评估指标模块
+在NumPy数组上计算进球、角球、黄牌预测的MAE、RMSE、偏差，以及概率预测的Brier分数与对数损失；
+MetricsAccumulator只保存各项误差的累计和，可以分块更新、跨进程合并，评估大规模回测时不需要保留全部预测
+"""
+
+from typing import Dict, Mapping, Optional, Tuple
+
+import numpy as np
+
+
+# 预测目标 -> (预测结果字段, 实际值为哪些比赛字段之和)
+PREDICTION_TARGETS = {
+    'home_goals': ('home_team_goals', ('home_goals',)),
+    'away_goals': ('away_team_goals', ('away_goals',)),
+    'total_goals': ('total_goals', ('home_goals', 'away_goals')),
+    'home_corners': ('home_corners', ('home_corners',)),
+    'away_corners': ('away_corners', ('away_corners',)),
+    'total_corners': ('total_corners', ('home_corners', 'away_corners')),
+    'home_yellow_cards': ('home_yellow_cards', ('home_yellow_cards',)),
+    'away_yellow_cards': ('away_yellow_cards', ('away_yellow_cards',)),
+    'total_yellow_cards': ('total_yellow_cards', ('home_yellow_cards', 'away_yellow_cards')),
+}
+
+# 评估需要的比赛字段
+ACTUAL_FIELDS = sorted({name for _, fields in PREDICTION_TARGETS.values() for name in fields})
+
+# 概率预测的评估项 -> 概率字段（多分类时为多个字段）
+PROBABILITY_TARGETS = {
+    '1x2': ('home_win_probability', 'draw_probability', 'away_win_probability'),
+    'over_under': ('over_probability',),
+    'btts': ('both_teams_score_probability',),
+}
+
+# 对数损失中概率的下限，避免log(0)
+LOG_LOSS_EPSILON = 1e-15
+
+
+def actual_columns(columns: Mapping[str, np.ndarray], rows=slice(None)) -> Dict[str, np.ndarray]:
+    """
+    从数据表的列中取出评估需要的实际值
+
+    Args:
+        columns: 列名 -> 数组（如MatchTable.columns）
+        rows: 行号切片、数组或布尔掩码
+
+    Returns:
+        Dict: 比赛字段 -> 数组
+    """
+    return {name: np.asarray(columns[name][rows]) for name in ACTUAL_FIELDS}
+
+
+def regression_errors(predicted: np.ndarray, actual: np.ndarray) -> Dict[str, float]:
+    """
+    数值预测的误差指标
+
+    Args:
+        predicted: 预测值数组
+        actual: 实际值数组
+
+    Returns:
+        Dict: {'MAE', 'RMSE', 'bias'（预测值减实际值的均值）, 'count'}
+    """
+    errors = np.asarray(predicted, dtype=np.float64) - np.asarray(actual, dtype=np.float64)
+    return {
+        'MAE': float(np.mean(np.abs(errors))),
+        'RMSE': float(np.sqrt(np.mean(errors ** 2))),
+        'bias': float(np.mean(errors)),
+        'count': len(errors),
+    }
+
+
+def outcome_labels(home_goals: np.ndarray, away_goals: np.ndarray) -> np.ndarray:
+    """比赛结果编码：0 主胜，1 平局，2 客胜（与1x2概率字段顺序一致）"""
+    return 1 - np.sign(np.asarray(home_goals) - np.asarray(away_goals)).astype(np.int64)
+
+
+def brier_score(probabilities: np.ndarray, labels: np.ndarray) -> float:
+    """
+    Brier分数（各类别概率与实际结果独热编码之差的平方和的均值）
+
+    Args:
+        probabilities: 形状 (n, k) 的类别概率，二分类时也可以是形状 (n,) 的正类概率
+        labels: 实际类别（二分类时为0/1）
+
+    Returns:
+        float: Brier分数（越小越好）
+    """
+    return float(np.mean(_brier_terms(*_as_categorical(probabilities, labels))))
+
+
+def log_loss(probabilities: np.ndarray, labels: np.ndarray) -> float:
+    """
+    对数损失（实际类别概率的负对数的均值）
+
+    Args:
+        probabilities: 形状 (n, k) 的类别概率，二分类时也可以是形状 (n,) 的正类概率
+        labels: 实际类别（二分类时为0/1）
+
+    Returns:
+        float: 对数损失（越小越好）
+    """
+    return float(np.mean(_log_loss_terms(*_as_categorical(probabilities, labels))))
+
+
+def _as_categorical(probabilities: np.ndarray, labels: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """统一为 (n, k) 概率矩阵与整数类别"""
+    probabilities = np.asarray(probabilities, dtype=np.float64)
+    if probabilities.ndim == 1:
+        probabilities = np.column_stack([1.0 - probabilities, probabilities])
+    return probabilities, np.asarray(labels, dtype=np.int64)
+
+
+def _brier_terms(probabilities: np.ndarray, labels: np.ndarray) -> np.ndarray:
+    """每场比赛的Brier分数"""
+    onehot = np.zeros_like(probabilities)
+    onehot[np.arange(len(labels)), labels] = 1.0
+    return ((probabilities - onehot) ** 2).sum(axis=1)
+
+
+def _log_loss_terms(probabilities: np.ndarray, labels: np.ndarray) -> np.ndarray:
+    """每场比赛的对数损失"""
+    return -np.log(np.clip(probabilities[np.arange(len(labels)), labels], LOG_LOSS_EPSILON, 1.0))
+
+
+def probability_labels(probabilities: np.ndarray, actual: Mapping[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    """
+    概率预测各评估项的实际类别
+
+    Args:
+        probabilities: 结构化概率数组（字段与MatchProbabilities一致）
+        actual: 比赛字段 -> 数组
+
+    Returns:
+        Dict: 评估项 -> 实际类别数组
+    """
+    home_goals, away_goals = np.asarray(actual['home_goals']), np.asarray(actual['away_goals'])
+    return {
+        '1x2': outcome_labels(home_goals, away_goals),
+        'over_under': (home_goals + away_goals > probabilities['total_goals_line']).astype(np.int64),
+        'btts': ((home_goals > 0) & (away_goals > 0)).astype(np.int64),
+    }
+
+
+def goal_direction_metrics(predicted: np.ndarray, actual: np.ndarray) -> Dict[str, float]:
+    """
+    主客队进球预测的综合指标（两队误差合并计算）
+
+    Args:
+        predicted: 形状 (n, 2) 的预测进球 [主队, 客队]
+        actual: 形状 (n, 2) 的实际进球
+
+    Returns:
+        Dict: {'MAE_goals', 'RMSE_goals', 'accuracy_direction', 'total_samples'}
+    """
+    predicted = np.asarray(predicted, dtype=np.float64).reshape(-1, 2)
+    actual = np.asarray(actual, dtype=np.float64).reshape(-1, 2)
+    errors = predicted - actual
+    correct = outcome_labels(predicted[:, 0], predicted[:, 1]) == outcome_labels(actual[:, 0], actual[:, 1])
+    return {
+        'MAE_goals': np.mean(np.abs(errors)),
+        'RMSE_goals': np.sqrt(np.mean(errors ** 2)),
+        'accuracy_direction': int(correct.sum()) / len(predicted),
+        'total_samples': len(predicted),
+    }
+
+
+class MetricsAccumulator:
+    """可合并的流式评估累加器（只保存误差的累计和）"""
+
+    def __init__(self):
+        """初始化累加器"""
+        self.count = 0
+        self.direction_correct = 0
+        # 预测目标 -> [误差和, 绝对误差和, 误差平方和]
+        self.error_sums = {target: np.zeros(3) for target in PREDICTION_TARGETS}
+        # 概率评估项 -> [样本数, Brier分数和, 对数损失和]
+        self.probability_sums = {target: np.zeros(3) for target in PROBABILITY_TARGETS}
+
+    def update(self, predictions: np.ndarray, actual: Mapping[str, np.ndarray],
+               probabilities: Optional[np.ndarray] = None):
+        """
+        并入一批预测
+
+        Args:
+            predictions: 结构化预测数组（字段与PredictionResult一致）
+            actual: 比赛字段 -> 与predictions等长的实际值数组（见actual_columns）
+            probabilities: 结构化概率数组（字段与MatchProbabilities一致），None表示不评估概率
+        """
+        self.count += len(predictions)
+        for target, (field, actual_fields) in PREDICTION_TARGETS.items():
+            errors = predictions[field] - sum(np.asarray(actual[name], dtype=np.float64) for name in actual_fields)
+            self.error_sums[target] += [errors.sum(), np.abs(errors).sum(), (errors ** 2).sum()]
+
+        predicted_outcome = outcome_labels(predictions['home_team_goals'], predictions['away_team_goals'])
+        self.direction_correct += int((predicted_outcome == outcome_labels(actual['home_goals'],
+                                                                           actual['away_goals'])).sum())
+
+        if probabilities is not None:
+            labels = probability_labels(probabilities, actual)
+            for target, fields in PROBABILITY_TARGETS.items():
+                values = np.column_stack([probabilities[name] for name in fields])
+                matrix, target_labels = _as_categorical(values if len(fields) > 1 else values[:, 0], labels[target])
+                self.probability_sums[target] += [len(target_labels), _brier_terms(matrix, target_labels).sum(),
+                                                  _log_loss_terms(matrix, target_labels).sum()]
+
+    def merge(self, other: 'MetricsAccumulator') -> 'MetricsAccumulator':
+        """
+        合并另一个累加器（如并行各折或各分块的结果）
+
+        Args:
+            other: 另一个累加器
+
+        Returns:
+            MetricsAccumulator: self
+        """
+        self.count += other.count
+        self.direction_correct += other.direction_correct
+        for target in PREDICTION_TARGETS:
+            self.error_sums[target] += other.error_sums[target]
+        for target in PROBABILITY_TARGETS:
+            self.probability_sums[target] += other.probability_sums[target]
+        return self
+
+    def target_metrics(self, target: str) -> Dict[str, float]:
+        """单个预测目标的 MAE、RMSE、偏差"""
+        total, absolute, squared = (self.error_sums[target] / max(self.count, 1)).tolist()
+        return {'MAE': absolute, 'RMSE': float(np.sqrt(squared)), 'bias': total, 'count': self.count}
+
+    def summary(self) -> Dict[str, float]:
+        """
+        汇总指标
+
+        Returns:
+            Dict: 两队合并的进球指标（MAE_goals、RMSE_goals，与BaselineTrainer.evaluate_predictions含义相同）、
+                  胜平负方向准确率、各预测目标的 {目标}_MAE/{目标}_RMSE/{目标}_bias，
+                  以及有概率预测时各评估项的 brier_{项}/log_loss_{项}
+        """
+        count = max(self.count, 1)
+        goal_sums = self.error_sums['home_goals'] + self.error_sums['away_goals']
+        summary = {
+            'MAE_goals': float(goal_sums[1] / (2 * count)),
+            'RMSE_goals': float(np.sqrt(goal_sums[2] / (2 * count))),
+            'accuracy_direction': self.direction_correct / count,
+            'total_samples': self.count,
+        }
+        for target in PREDICTION_TARGETS:
+            metrics = self.target_metrics(target)
+            summary.update({f'{target}_{name}': metrics[name] for name in ('MAE', 'RMSE', 'bias')})
+        for target, (samples, brier, loss) in self.probability_sums.items():
+            if samples:
+                summary[f'brier_{target}'] = float(brier / samples)
+                summary[f'log_loss_{target}'] = float(loss / samples)
+        return summary
+
+
+def evaluate_arrays(predictions: np.ndarray, actual: Mapping[str, np.ndarray],
+                    probabilities: Optional[np.ndarray] = None) -> Dict[str, float]:
+    """
+    一次性评估一批预测（见MetricsAccumulator.summary）
+
+    Args:
+        predictions: 结构化预测数组
+        actual: 比赛字段 -> 实际值数组
+        probabilities: 结构化概率数组，None表示不评估概率
+
+    Returns:
+        Dict: 汇总指标
+    """
+    accumulator = MetricsAccumulator()
+    accumulator.update(predictions, actual, probabilities)
+    return accumulator.summary()
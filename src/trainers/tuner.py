@@ -0,0 +1,417 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+超参数搜索模块
+在网格或随机空间中搜索球队统计窗口、最少场数、预测范围限制以及各联赛的主场优势、犯规转黄牌系数。
+
+球队出场索引、统计前缀和、每场比赛在球队出场记录中的时间点位置只计算一次并放入共享内存，
+进程池中的每个候选参数只需重新计算窗口均值与预测公式。每场比赛的联赛系数与逐期回测一样只用之前各期的比赛训练，
+目标函数与回测指标一致（样本外）。各联赛系数只影响本联赛比赛的误差，
+因此对每组全局参数，所有联赛的系数网格在一次向量化预测中同时评估，并逐联赛取误差最小的取值
+"""
+
+import itertools
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from ..models.data_models import MatchData, TeamStats
+from ..models.match_table import MatchTable, as_match_table
+from ..config.league_coefficients import LEAGUE_COEFFICIENTS, DEFAULT_LEAGUE, DATA_CONFIG
+from ..data.data_processor import resolve_workers
+from ..data.shared_table import SharedArrays
+from ..predictors.batch_engine import BatchPredictionEngine, LIMIT_KEYS
+from ..predictors.coefficient_table import COEFFICIENT_FIELDS
+from ..predictors.rolling_stats import TeamRollingStats
+from .baseline_trainer import BaselineTrainer, MIN_LEAGUE_SAMPLE_SIZE
+from .backtester import WalkForwardBacktester, LeagueBaselineState
+
+
+# 全局参数的默认搜索空间：DATA_CONFIG配置项 -> 候选值
+DEFAULT_SEARCH_SPACE = {
+    'recent_matches_window': [5, 6, 8, 10, 12, 15, 20],
+    'min_matches_required': [1, 2, 3, 4, 5],
+    'goal_limits': [(0.0, 3.0), (0.0, 4.0), (0.0, 5.0), (0.0, 6.0)],
+    'corner_limits': [(0.0, 12.0), (0.0, 15.0), (0.0, 20.0), (0.0, 25.0)],
+    'yellow_card_limits': [(0.0, 6.0), (0.0, 8.0), (0.0, 10.0)],
+}
+
+# 各联赛系数的搜索网格
+DEFAULT_LEAGUE_GRIDS = {
+    'home_advantage': np.round(np.linspace(0.8, 1.6, 33), 3).tolist(),
+    'foul_to_yellow': np.round(np.linspace(0.05, 0.35, 31), 3).tolist(),
+}
+
+# 各联赛系数影响的预测目标：系数 -> (预测结果字段, 实际值数组名)
+_LEAGUE_GRID_TARGETS = {
+    'home_advantage': ('total_goals', 'actual_goals'),
+    'foul_to_yellow': ('total_yellow_cards', 'actual_yellow_cards'),
+}
+
+# 预测公式用到的球队统计字段
+_STAT_NAMES = ('avg_goals_scored', 'avg_goals_conceded', 'avg_corners', 'avg_yellow_cards', 'avg_red_cards')
+
+# 球队统计不足时的默认值
+_DEFAULT_STATS = TeamStats.default("").to_dict()
+
+
+class TuningData:
+    """所有候选参数共用的预计算数据（全部为数组，可放入共享内存）"""
+
+    def __init__(self, arrays: Dict[str, np.ndarray], leagues: Sequence[str]):
+        """
+        Args:
+            arrays: 名称 -> 数组（见build）
+            leagues: 联赛词表
+        """
+        self.arrays = arrays
+        self.leagues = list(leagues)
+
+    @classmethod
+    def build(cls, table: MatchTable, period: str = 'day') -> 'TuningData':
+        """
+        由比赛数据表构建预计算数据
+
+        每场比赛的两队统计与联赛系数只使用该场所在回测期开始之前的比赛（与逐期回测一致），
+        对应的出场记录区间终点在这里一次确定，候选参数只改变区间起点。
+
+        Args:
+            table: 按开球时间排序的比赛数据表
+            period: 回测周期（day/week）
+
+        Returns:
+            TuningData: 预计算数据
+        """
+        columns = table.columns
+        rolling = TeamRollingStats.for_table(table)
+        backtester = WalkForwardBacktester(period)
+        as_of = backtester.period_start(backtester.period_ids(columns['kickoff_ts']))
+
+        # 主队在前、客队在后，每场比赛每一方在其球队出场记录中的区间终点
+        team_codes = np.concatenate([columns['home_team_code'], columns['away_team_code']]).astype(np.int64)
+        as_of = np.concatenate([as_of, as_of])
+        offsets = rolling.offsets
+        counts = np.diff(offsets)
+        appearance_team = np.repeat(np.arange(len(counts)), counts)
+        base = min(int(as_of.min()), int(rolling.kickoff.min())) if len(table) else 0
+        keys = (appearance_team << 32) + (rolling.kickoff - base)
+        end = np.searchsorted(keys, (team_codes << 32) + (as_of - base), side='left')
+
+        arrays = {
+            'first': offsets[team_codes],
+            'end': end,
+            'league_code': columns['league_code'],
+            'actual_goals': columns['home_goals'] + columns['away_goals'],
+            'actual_corners': columns['home_corners'] + columns['away_corners'],
+            'actual_yellow_cards': columns['home_yellow_cards'] + columns['away_yellow_cards'],
+            'match_coefficients': period_coefficients(table, backtester),
+            'base_coefficients': base_coefficients(table),
+            'tunable': league_sample_sizes(table) >= MIN_LEAGUE_SAMPLE_SIZE,
+        }
+        arrays.update({f'prefix_{name}': rolling.prefix[name] for name in _STAT_NAMES})
+        return cls(arrays, table.leagues)
+
+    def window_stats(self, recent_n: int, min_matches: int) -> Tuple[Dict[str, np.ndarray], Dict[str, np.ndarray]]:
+        """
+        按窗口与最少场数计算每场比赛两队的统计（结果与TeamRollingStats.team_stats一致）
+
+        Args:
+            recent_n: 使用最近N场比赛
+            min_matches: 所需的最少比赛场数，不足时使用默认统计
+
+        Returns:
+            Tuple: (主队统计字段 -> 数组, 客队统计字段 -> 数组)
+        """
+        arrays = self.arrays
+        end, first = arrays['end'], arrays['first']
+        start = np.maximum(end - max(recent_n, 0), first)
+        count = end - start
+        enough = count >= min_matches
+        safe_count = np.maximum(count, 1)
+        size = len(end) // 2
+        home, away = {}, {}
+        for name in _STAT_NAMES:
+            prefix = arrays[f'prefix_{name}']
+            values = np.where(enough, (prefix[end] - prefix[start]) / safe_count, _DEFAULT_STATS[name])
+            home[name], away[name] = values[:size], values[size:]
+        return home, away
+
+
+def league_sample_sizes(table: MatchTable) -> np.ndarray:
+    """各联赛（按数据表的联赛编码）的比赛数"""
+    return np.bincount(table.columns['league_code'], minlength=len(table.leagues))
+
+
+def period_coefficients(table: MatchTable, backtester: WalkForwardBacktester) -> np.ndarray:
+    """
+    每场比赛所在回测期开始之前的联赛系数（与逐期回测的LeagueBaselineState一致）
+
+    Args:
+        table: 按开球时间排序的比赛数据表
+        backtester: 划分回测期的回测器
+
+    Returns:
+        np.ndarray: 形状 (比赛数, 系数字段数)
+    """
+    league_codes = table.columns['league_code']
+    period_ids = backtester.period_ids(table.columns['kickoff_ts'])
+    boundaries = (np.flatnonzero(np.diff(period_ids)) + 1).tolist()
+    starts, ends = ([0] + boundaries, boundaries + [len(table)]) if len(table) else ([], [])
+
+    state = LeagueBaselineState(table.leagues)
+    result = np.empty((len(table), len(COEFFICIENT_FIELDS)))
+    for start, end in zip(starts, ends):
+        coefficients = state.coefficients(league_codes[start:end])
+        result[start:end] = np.column_stack([coefficients[field] for field in COEFFICIENT_FIELDS])
+        state.update(table, slice(start, end))
+    return result
+
+
+def base_coefficients(table: MatchTable) -> np.ndarray:
+    """
+    由全部数据训练的联赛系数（样本不足的联赛使用配置），与加载训练结果文件后的系数表一致
+
+    Args:
+        table: 比赛数据表
+
+    Returns:
+        np.ndarray: 形状 (联赛数, 系数字段数)
+    """
+    trainer = BaselineTrainer()
+    trainer.collect_league_statistics(table)
+    trained = trainer.calculate_league_baselines()
+    return np.array([[trained.get(league, LEAGUE_COEFFICIENTS.get(league, LEAGUE_COEFFICIENTS[DEFAULT_LEAGUE]))[field]
+                      for field in COEFFICIENT_FIELDS] for league in table.leagues], dtype=np.float64).reshape(
+        len(table.leagues), len(COEFFICIENT_FIELDS))
+
+
+def evaluate_candidate(data: TuningData, params: Dict[str, Any],
+                       league_grids: Dict[str, Sequence[float]]) -> Dict[str, Any]:
+    """
+    评估一组全局参数，并为每个联赛选出误差最小的系数
+
+    Args:
+        data: 预计算数据
+        params: 全局参数（DATA_CONFIG配置项 -> 取值）
+        league_grids: 联赛系数 -> 候选值
+
+    Returns:
+        Dict: {'params', 'objective'（总进球、总角球、总黄牌MAE之和）, 'mae'（各项MAE）,
+               'league_values'（联赛系数 -> 每个联赛的最优取值，不可调的联赛保留原值）}
+    """
+    arrays = data.arrays
+    home, away = data.window_stats(params['recent_matches_window'], params['min_matches_required'])
+    limits = {name: params[name] for name in LIMIT_KEYS}
+    league_codes = arrays['league_code']
+    n, leagues = len(league_codes), len(data.leagues)
+
+    # 所有系数网格展开为同一批预测：第g份拷贝使用每个系数网格的第g个取值（较短的网格重复最后一个值），
+    # 不在搜索范围内的系数使用每场比赛开赛前训练的值
+    copies = max([len(grid) for grid in league_grids.values()] + [1])
+    coefficients = {field: np.tile(arrays['match_coefficients'][:, column], copies)
+                    for column, field in enumerate(COEFFICIENT_FIELDS)}
+    tunable = np.tile(arrays['tunable'][league_codes], copies)
+    for field, grid in league_grids.items():
+        padded = np.asarray(list(grid) + [grid[-1]] * (copies - len(grid)), dtype=np.float64)
+        coefficients[field] = np.where(tunable, np.repeat(padded, n), coefficients[field])
+
+    predictions = _ENGINE.predict_stats({name: np.tile(values, copies) for name, values in home.items()},
+                                        {name: np.tile(values, copies) for name, values in away.items()},
+                                        coefficients, limits=limits)
+
+    # 按(拷贝, 联赛)汇总绝对误差，各联赛独立取最优拷贝；不在搜索范围内的系数保留原值
+    group = np.repeat(np.arange(copies), n) * leagues + np.tile(league_codes, copies)
+    league_values = {}
+    total_errors = {}
+    for field, (target, actual_name) in _LEAGUE_GRID_TARGETS.items():
+        errors = np.abs(predictions[target] - np.tile(arrays[actual_name], copies))
+        by_league = np.bincount(group, weights=errors, minlength=copies * leagues).reshape(copies, leagues)
+        column = COEFFICIENT_FIELDS.index(field)
+        best = np.argmin(by_league, axis=0) if field in league_grids else np.zeros(leagues, dtype=np.int64)
+        total_errors[target] = float(by_league[best, np.arange(leagues)].sum())
+        values = arrays['base_coefficients'][:, column]
+        if field in league_grids:
+            grid = np.asarray(league_grids[field], dtype=np.float64)
+            values = np.where(arrays['tunable'], grid[np.minimum(best, len(grid) - 1)], values)
+        league_values[field] = values.tolist()
+    total_errors['total_corners'] = float(np.abs(predictions['total_corners'][:n] - arrays['actual_corners']).sum())
+
+    mae = {target: errors / max(n, 1) for target, errors in total_errors.items()}
+    return {'params': params, 'objective': sum(mae.values()), 'mae': mae, 'league_values': league_values}
+
+
+def search_candidates(search_space: Dict[str, Sequence[Any]], n_samples: int = 0,
+                      seed: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    生成候选全局参数
+
+    Args:
+        search_space: 配置项 -> 候选值
+        n_samples: 随机抽取的组合数，<=0或不小于网格大小时使用完整网格
+        seed: 随机抽样的种子
+
+    Returns:
+        List[Dict]: 候选参数列表
+    """
+    names = list(search_space)
+    grid = list(itertools.product(*(search_space[name] for name in names)))
+    if 0 < n_samples < len(grid):
+        chosen = np.random.RandomState(seed).choice(len(grid), n_samples, replace=False)
+        grid = [grid[i] for i in sorted(chosen.tolist())]
+    return [dict(zip(names, values)) for values in grid]
+
+
+# 进程池子进程中的预计算数据与预测引擎
+_tuning_data: Optional[Tuple[Any, TuningData]] = None
+_ENGINE = BatchPredictionEngine(None)
+
+
+def _attach_tuning_data(spec: Dict[str, Any], leagues: List[str]):
+    """进程池初始化：映射共享内存中的预计算数据"""
+    global _tuning_data
+    shm, arrays = SharedArrays.attach(spec)
+    _tuning_data = (shm, TuningData(arrays, leagues))
+
+
+def _evaluate_shared_candidate(task: Tuple[Dict[str, Any], Dict[str, Sequence[float]]]) -> Dict[str, Any]:
+    """进程池任务：在共享的预计算数据上评估一组参数"""
+    params, league_grids = task
+    return evaluate_candidate(_tuning_data[1], params, league_grids)
+
+
+class HyperparameterTuner:
+    """超参数搜索器"""
+
+    def __init__(self, search_space: Optional[Dict[str, Sequence[Any]]] = None,
+                 league_grids: Optional[Dict[str, Sequence[float]]] = None,
+                 period: str = 'day', workers: Optional[int] = None):
+        """
+        初始化搜索器
+
+        Args:
+            search_space: 全局参数的搜索空间，None使用DEFAULT_SEARCH_SPACE
+            league_grids: 联赛系数的搜索网格，None使用DEFAULT_LEAGUE_GRIDS
+            period: 评估使用的回测周期（day/week）
+            workers: 并行进程数，None使用配置默认值，<=0表示使用全部CPU核心
+        """
+        self.search_space = dict(DEFAULT_SEARCH_SPACE if search_space is None else search_space)
+        self.league_grids = dict(DEFAULT_LEAGUE_GRIDS if league_grids is None else league_grids)
+        self.period = period
+        self.workers = DATA_CONFIG["tune_workers"] if workers is None else workers
+
+    def tune(self, matches: Union[List[MatchData], MatchTable], n_samples: int = 0,
+             seed: Optional[int] = None) -> Dict[str, Any]:
+        """
+        搜索最优参数
+
+        Args:
+            matches: 比赛数据列表或MatchTable
+            n_samples: 随机抽取的全局参数组合数，<=0表示完整网格搜索
+            seed: 随机抽样的种子
+
+        Returns:
+            Dict: {'best': 最优候选（见evaluate_candidate）, 'current': 当前配置的评估结果,
+                   'candidates': 评估的候选数, 'leagues': 联赛词表, 'sample_sizes': 各联赛比赛数,
+                   'coefficients': 最优参数下各联赛的完整系数}
+        """
+        start_time = time.perf_counter()
+        table = as_match_table(matches)
+        data = TuningData.build(table, self.period)
+        # 当前配置（联赛系数逐期训练，与回测一致）作为比较基准，搜索空间以外的配置项保持当前值
+        current_params = {name: DATA_CONFIG[name] for name in DEFAULT_SEARCH_SPACE}
+        candidates = [dict(current_params, **params)
+                      for params in search_candidates(self.search_space, n_samples, seed)]
+
+        workers = min(resolve_workers(self.workers), max(len(candidates), 1))
+        print(f"\n开始超参数搜索（{len(candidates)} 组全局参数 × 联赛系数网格，{workers} 个进程）...")
+
+        tasks = [(params, self.league_grids) for params in candidates]
+        if workers <= 1:
+            results = [evaluate_candidate(data, params, grids) for params, grids in tasks]
+        else:
+            with SharedArrays(data.arrays) as shared:
+                with ProcessPoolExecutor(max_workers=workers, initializer=_attach_tuning_data,
+                                         initargs=(shared.spec, data.leagues)) as executor:
+                    chunksize = max(1, len(tasks) // (workers * 4))
+                    results = list(executor.map(_evaluate_shared_candidate, tasks, chunksize=chunksize))
+
+        # 目标相同时取先出现的候选，结果与进程数无关
+        best = min(results, key=lambda result: result['objective'])
+        current = evaluate_candidate(data, current_params, {})
+
+        coefficients = data.arrays['base_coefficients'].copy()
+        for field, values in best['league_values'].items():
+            coefficients[:, COEFFICIENT_FIELDS.index(field)] = values
+
+        print(f"当前配置: 目标 {current['objective']:.4f}")
+        print(f"最优参数: 目标 {best['objective']:.4f} {best['params']}")
+        print(f"超参数搜索用时: {time.perf_counter() - start_time:.2f} 秒")
+
+        return {
+            'best': best,
+            'current': current,
+            'candidates': len(candidates),
+            'leagues': data.leagues,
+            'sample_sizes': league_sample_sizes(table).tolist(),
+            'coefficients': coefficients,
+        }
+
+    def save_results(self, result: Dict[str, Any], file_path: str) -> str:
+        """
+        保存搜索结果
+
+        各联赛系数以训练基线文件的格式保存（可直接作为baselines_file加载，样本不足的联赛不写入），
+        最优全局参数保存在同目录的 {文件名}_data_config.json 中。
+
+        Args:
+            result: tune的返回值
+            file_path: 联赛系数文件路径
+
+        Returns:
+            str: 全局参数文件路径
+        """
+        baselines = {}
+        for code, league in enumerate(result['leagues']):
+            if result['sample_sizes'][code] >= MIN_LEAGUE_SAMPLE_SIZE:
+                baselines[league] = dict(zip(COEFFICIENT_FIELDS, result['coefficients'][code].tolist()))
+                baselines[league]['sample_size'] = result['sample_sizes'][code]
+        BaselineTrainer().save_baselines(baselines, file_path)
+
+        config_path = os.path.splitext(file_path)[0] + '_data_config.json'
+        best = result['best']
+        with open(config_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'data_config': {name: list(value) if isinstance(value, tuple) else value
+                                for name, value in best['params'].items()},
+                'objective': best['objective'],
+                'mae': best['mae'],
+                'current_objective': result['current']['objective'],
+                'current_mae': result['current']['mae'],
+            }, f, indent=2, ensure_ascii=False)
+        print(f"最优全局参数已保存到: {config_path}")
+        return config_path
+
+
+def apply_data_config(config_path: str) -> Dict[str, Any]:
+    """
+    读取save_results保存的全局参数并应用到DATA_CONFIG（需在创建预测器之前调用）
+
+    Args:
+        config_path: 全局参数文件（{文件名}_data_config.json）
+
+    Returns:
+        Dict: 应用的配置项 -> 取值（范围限制转换为元组）
+    """
+    with open(config_path, 'r', encoding='utf-8') as f:
+        data_config = json.load(f)['data_config']
+    unknown = [name for name in data_config if name not in DATA_CONFIG]
+    if unknown:
+        raise ValueError(f"全局参数文件包含未知的配置项: {', '.join(unknown)}")
+    applied = {name: tuple(value) if isinstance(value, list) else value for name, value in data_config.items()}
+    DATA_CONFIG.update(applied)
+    print(f"已应用全局参数: {config_path}")
+    return applied
@@ -125,6 +125,1071 @@ def test_training():
         print(f"✗ 训练功能测试失败: {e}")
         return False
 
+def test_column_parsing():
+    """测试列式批量解析与逐条解析结果一致"""
+    print("\n=== 测试列式批量解析 ===")
+    
+    try:
+        from src.data.data_processor import DataProcessor
+        from src.data.column_parser import (parse_divided_column, parse_percentage_column,
+                                            parse_score_column, parse_kickoff_column)
+        
+        processor = DataProcessor()
+        cases = [
+            (parse_divided_column, processor.parse_divided_values,
+             ["7/5", "", "-", "-/-", "12", "0/0", "7.5/3", "-/4", "3/", "10/9/8", "٣/4", None]),
+            (parse_percentage_column, processor.parse_percentage,
+             ["33%/67%", "", "-", "44.5%/55.5%", "33%", "58/64", "44%%/56%", "4.%/5%", "50%/-", None]),
+            (parse_score_column, processor.parse_score,
+             ["比分:2-0", "", "-", "比分:", "1-1", "3", "比分:10-2", "2.5-1", "比分:1-1 比分:2-2", None]),
+        ]
+        
+        for batch_parser, scalar_parser, values in cases:
+            home, away = batch_parser(values, scalar_parser)
+            batch_result = list(zip(home.tolist(), away.tolist()))
+            scalar_result = [scalar_parser(v) for v in values]
+            if batch_result != scalar_result:
+                print(f"✗ {batch_parser.__name__} 边界情况结果不一致")
+                print(f"  列式: {batch_result}")
+                print(f"  逐条: {scalar_result}")
+                return False
+        print("✓ 边界情况解析一致")
+        
+        # 比赛进行中的快照：没有数据时为-1
+        snapshot_cases = [
+            (parse_score_column, processor.parse_snapshot_score,
+             ["比分:0-0", "", "-", "比分:", "比分:2-1", "未开始", "3", "٣-1", None]),
+            (parse_divided_column, processor.parse_snapshot_divided,
+             ["7/2", "", "-/-", "0/0", "无", "5", None]),
+        ]
+        for batch_parser, scalar_parser, values in snapshot_cases:
+            home, away = batch_parser(values, scalar_parser, missing=-1)
+            if list(zip(home.tolist(), away.tolist())) != [scalar_parser(v) for v in values]:
+                print(f"✗ {batch_parser.__name__} 快照解析结果不一致")
+                return False
+        if processor.parse_snapshot_score("") != (-1, -1) or processor.parse_snapshot_score("比分:0-0") != (0, 0):
+            print("✗ 缺失快照未标记为-1")
+            return False
+        print("✓ 比赛快照解析一致")
+        
+        kickoff_dates = ["2023-5-1 7:35:00 PM", "2023-5-1 12:00:00 AM", "2024-2-29 12:30:00 PM",
+                         "2023-2-29 1:00:00 PM", "2023-5-1 7:35:00 pm", "", None]
+        kickoff_dates1 = ["2023-05-01"] * (len(kickoff_dates) - 1) + [""]
+        batch_kickoff = parse_kickoff_column(kickoff_dates, kickoff_dates1, processor.parse_kickoff).tolist()
+        scalar_kickoff = [processor.parse_kickoff(d, d1) for d, d1 in zip(kickoff_dates, kickoff_dates1)]
+        if batch_kickoff != scalar_kickoff or batch_kickoff[0] != 1682969700:
+            print(f"✗ 开球时间解析结果不一致: {batch_kickoff} != {scalar_kickoff}")
+            return False
+        print("✓ 开球时间解析一致")
+        
+        # 全量原始数据对比
+        raw_dirs = [os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'raw', year)
+                    for year in ('2021', '2023')]
+        records = []
+        for raw_dir in raw_dirs:
+            for json_file in processor.list_json_files(raw_dir):
+                records.extend(processor.load_json_file(str(json_file)))
+        
+        batch_matches = processor.decode_records(records)
+        scalar_matches = [processor.convert_raw_to_structured(processor.process_single_match(r))
+                          for r in records if r]
+        if batch_matches != scalar_matches:
+            print("✗ 原始数据列式解码结果与逐条解析不一致")
+            return False
+        
+        print(f"✓ {len(batch_matches)} 场原始比赛列式解码结果一致")
+        return True
+        
+    except Exception as e:
+        print(f"✗ 列式批量解析测试失败: {e}")
+        return False
+
+def test_parallel_ingest():
+    """测试进程池并行解析与串行解析结果一致"""
+    print("\n=== 测试并行解析 ===")
+    
+    try:
+        import contextlib, io
+        from src.data.data_processor import DataProcessor
+        
+        processor = DataProcessor()
+        raw_dirs = [os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'raw', year)
+                    for year in ('2021', '2023')]
+        json_files = processor.collect_json_files(raw_dirs)
+        with contextlib.redirect_stdout(io.StringIO()):
+            serial = processor.process_files(json_files, workers=1)
+            parallel = processor.process_files(json_files, workers=2)
+        if not serial or serial != parallel:
+            print("✗ 并行解析结果与串行不一致")
+            return False
+        print(f"✓ {len(json_files)} 个文件并行解析结果与串行一致 ({len(serial)} 场比赛)")
+        return True
+        
+    except Exception as e:
+        print(f"✗ 并行解析测试失败: {e}")
+        return False
+
+def test_json_stream():
+    """测试JSON数组增量读取"""
+    print("\n=== 测试JSON增量读取 ===")
+    
+    try:
+        import json
+        import tempfile
+        from src.data.data_processor import iter_json_array
+        
+        records = [{"比赛id": i, "主队": "队" * (i % 7), "数值": [i, i / 3, None, True], "文本": "a,]}\"" * i}
+                   for i in range(50)]
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            def write(name, text):
+                path = os.path.join(tmp_dir, name)
+                with open(path, 'w', encoding='utf-8') as f:
+                    f.write(text)
+                return path
+            
+            # 缓冲区远小于单个对象时，对象跨越多个读取块
+            array_file = write("array.json", "  \n" + json.dumps(records, ensure_ascii=False, indent=1) + "\n")
+            for buffer_size in (1, 7, 64, 65536):
+                if list(iter_json_array(array_file, buffer_size=buffer_size)) != records:
+                    print(f"✗ 缓冲区 {buffer_size} 时增量读取结果不一致")
+                    return False
+            numbers_file = write("numbers.json", "[1234567, 89, 10]")
+            if list(iter_json_array(numbers_file, buffer_size=3)) != [1234567, 89, 10]:
+                print("✗ 跨越读取块的数字解析错误")
+                return False
+            if list(iter_json_array(write("empty_array.json", " [ ] "), buffer_size=2)) != []:
+                print("✗ 空数组应不产出元素")
+                return False
+            if list(iter_json_array(write("object.json", '{"比赛id": 1}'))) != [{"比赛id": 1}]:
+                print("✗ 单个对象应作为唯一元素产出")
+                return False
+            
+            # 空文件、只有空白、未结束的数组报错
+            for name, text in (("empty.json", ""), ("blank.json", " \n\t "), ("truncated.json", '[{"a": 1},')):
+                try:
+                    list(iter_json_array(write(name, text), buffer_size=4))
+                except ValueError:
+                    continue
+                print(f"✗ {name} 应报错")
+                return False
+        
+        print("✓ JSON数组增量读取正确（跨块对象、空数组、空文件与空白输入）")
+        return True
+        
+    except Exception as e:
+        print(f"✗ JSON增量读取测试失败: {e}")
+        return False
+
+def test_stream_consumers():
+    """测试流式读取的比赛按块写入CSV与收集联赛统计"""
+    print("\n=== 测试流式消费 ===")
+    
+    try:
+        import contextlib, io, tempfile
+        import pandas as pd
+        from src.config.league_coefficients import DATA_CONFIG
+        from src.data.data_processor import DataProcessor, iter_matches
+        from src.trainers.baseline_trainer import BaselineTrainer
+        
+        raw_dirs = [os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'raw', year)
+                    for year in ('2021', '2023')]
+        matches = list(iter_matches(raw_dirs))
+        processor = DataProcessor()
+        list_trainer = BaselineTrainer()
+        list_trainer.collect_league_statistics(matches)
+        
+        # 块远小于数据量时，生成器输入与列表输入的结果一致
+        chunk_size = DATA_CONFIG["stream_chunk_size"]
+        DATA_CONFIG["stream_chunk_size"] = 7
+        try:
+            with tempfile.TemporaryDirectory() as tmp_dir, contextlib.redirect_stdout(io.StringIO()):
+                list_csv, stream_csv = os.path.join(tmp_dir, "list.csv"), os.path.join(tmp_dir, "stream.csv")
+                list_rows = processor.save_to_csv(matches, list_csv, chunk_size=len(matches))
+                stream_rows = processor.save_to_csv(iter_matches(raw_dirs), stream_csv)
+                same_csv = pd.read_csv(list_csv).equals(pd.read_csv(stream_csv))
+            stream_trainer = BaselineTrainer()
+            collected = stream_trainer.collect_league_statistics(iter_matches(raw_dirs))
+        finally:
+            DATA_CONFIG["stream_chunk_size"] = chunk_size
+        
+        if stream_rows != len(matches) or list_rows != len(matches) or not same_csv:
+            print(f"✗ 流式写入CSV与列表写入不一致 ({stream_rows}/{len(matches)} 行)")
+            return False
+        if (collected != len(matches)
+                or stream_trainer.calculate_league_baselines() != list_trainer.calculate_league_baselines()):
+            print("✗ 流式收集的联赛基线与列表输入不一致")
+            return False
+        
+        print(f"✓ {len(matches)} 场比赛流式写入CSV与收集联赛统计结果一致")
+        return True
+        
+    except Exception as e:
+        print(f"✗ 流式消费测试失败: {e}")
+        return False
+
+def test_ingest_cache():
+    """测试增量解析缓存的命中与失效"""
+    print("\n=== 测试增量解析缓存 ===")
+    
+    try:
+        import contextlib, io, json, shutil, tempfile
+        from src.data.data_processor import DataProcessor
+        from src.data.ingest_cache import IngestCache
+        
+        processor = DataProcessor()
+        raw_dirs = [os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'raw', year)
+                    for year in ('2021', '2023')]
+        source = str(processor.collect_json_files(raw_dirs)[0])
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            raw_file = os.path.join(tmp_dir, "matches.json")
+            cache_dir = os.path.join(tmp_dir, "cache")
+            shutil.copyfile(source, raw_file)
+            
+            def run():
+                cache = IngestCache(cache_dir)
+                with contextlib.redirect_stdout(io.StringIO()):
+                    matches = processor.process_files([raw_file], workers=1, cache=cache)
+                return cache, matches
+            
+            cache, first = run()
+            if (cache.hits, cache.misses) != (0, 1):
+                print("✗ 首次解析应未命中缓存")
+                return False
+            
+            # 文件未变化：命中，结果与解析一致
+            cache, cached = run()
+            if (cache.hits, cache.misses) != (1, 0) or cached != first:
+                print("✗ 未变化的文件应命中缓存")
+                return False
+            
+            # 只更新修改时间（内容不变）：以内容哈希为准，仍然命中
+            stat = os.stat(raw_file)
+            os.utime(raw_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+            cache, _ = run()
+            if (cache.hits, cache.misses) != (1, 0):
+                print("✗ 只更新修改时间的文件应命中缓存")
+                return False
+            
+            # 内容变化：未命中，重新解析
+            with open(raw_file, 'r', encoding='utf-8') as f:
+                records = json.load(f)
+            with open(raw_file, 'w', encoding='utf-8') as f:
+                json.dump(records[:-1], f, ensure_ascii=False)
+            cache, modified = run()
+            if (cache.hits, cache.misses) != (0, 1) or len(modified) >= len(first):
+                print("✗ 内容变化的文件应重新解析")
+                return False
+        
+        print("✓ 增量解析缓存命中与失效正确")
+        return True
+        
+    except Exception as e:
+        print(f"✗ 增量解析缓存测试失败: {e}")
+        return False
+
+# 原始测试数据（比赛列表与数据表），多个测试共用同一份
+_raw_match_cache = {}
+
+def _load_raw_matches():
+    """解析data/raw下的原始数据，返回 (比赛列表, 数据表)"""
+    if not _raw_match_cache:
+        from src.data.data_processor import DataProcessor
+        from src.models.match_table import MatchTable
+        
+        processor = DataProcessor()
+        raw_dirs = [os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'raw', year)
+                    for year in ('2021', '2023')]
+        matches = processor.process_files(processor.collect_json_files(raw_dirs))
+        _raw_match_cache['matches'] = matches
+        _raw_match_cache['table'] = MatchTable.from_matches(matches)
+    return _raw_match_cache['matches'], _raw_match_cache['table']
+
+def test_match_store():
+    """测试列式二进制存储的保存、加载与过期判断"""
+    print("\n=== 测试列式存储 ===")
+    
+    try:
+        import contextlib, io, tempfile
+        import numpy as np
+        from src.data.match_store import save_match_store, load_match_store, load_table, read_store_meta
+        
+        matches, table = _load_raw_matches()
+        
+        with tempfile.TemporaryDirectory() as store_dir:
+            with contextlib.redirect_stdout(io.StringIO()):
+                save_match_store(matches, store_dir, "npy", source_fingerprint="v1")
+                loaded = load_table(store_dir, expected_fingerprint="v1")
+                stale = load_table(store_dir, expected_fingerprint="v2")
+            if loaded is None or loaded.to_matches() != matches:
+                print("✗ 列式存储往返结果不一致")
+                return False
+            store = load_match_store(store_dir)
+            if (store['categories'] != table.vocabularies
+                    or any(not np.array_equal(store['columns'][name], column)
+                           for name, column in table.columns.items())):
+                print("✗ 列式存储的列或词表不一致")
+                return False
+            if stale is not None:
+                print("✗ 原始数据指纹不一致时应视为过期")
+                return False
+            
+            # 重写中途出错（旧列文件无法删除）后不留下指向缺失列的元数据
+            os.remove(os.path.join(store_dir, "home_goals.npy"))
+            os.mkdir(os.path.join(store_dir, "home_goals.npy"))
+            try:
+                with contextlib.redirect_stdout(io.StringIO()):
+                    save_match_store(matches, store_dir, "npy", source_fingerprint="v3")
+            except OSError:
+                pass
+            if read_store_meta(store_dir) is not None:
+                print("✗ 重写中断后仍保留旧元数据")
+                return False
+        
+        print(f"✓ 列式存储往返与过期判断正确 ({len(matches)} 场比赛)")
+        return True
+        
+    except Exception as e:
+        print(f"✗ 列式存储测试失败: {e}")
+        return False
+
+def test_match_table():
+    """测试数组化比赛数据表与比赛列表结果一致"""
+    print("\n=== 测试数组化数据表 ===")
+    
+    try:
+        from src.predictors.football_predictor import FootballPredictor
+        from src.trainers.baseline_trainer import BaselineTrainer
+        
+        matches, table = _load_raw_matches()
+        
+        if table.to_matches() != matches or table[0].to_match_data() != matches[0]:
+            print("✗ 数据表还原结果不一致")
+            return False
+        print(f"✓ {len(table)} 场比赛转换为数据表，还原结果一致")
+        
+        if table.find(matches[0].match_id).to_match_data() != matches[0] or table.find("不存在") is not None:
+            print("✗ 按比赛ID查找结果错误")
+            return False
+        print("✓ 按比赛ID查找正确")
+        
+        predictor = FootballPredictor()
+        for team in table.present_teams()[:50]:
+            if predictor.calculate_team_stats(table, team) != predictor.calculate_team_stats(matches, team):
+                print(f"✗ 球队 {team} 的统计数据不一致")
+                return False
+        print("✓ 球队统计快速路径结果一致")
+        
+        list_trainer, table_trainer = BaselineTrainer(), BaselineTrainer()
+        list_trainer.collect_league_statistics(matches)
+        table_trainer.collect_league_statistics(table)
+        if list_trainer.calculate_league_baselines() != table_trainer.calculate_league_baselines():
+            print("✗ 联赛基线快速路径结果不一致")
+            return False
+        print("✓ 联赛基线快速路径结果一致")
+        return True
+        
+    except Exception as e:
+        print(f"✗ 数组化数据表测试失败: {e}")
+        return False
+
+def test_kickoff_order():
+    """测试乱序输入按开球时间排序与时间查询"""
+    print("\n=== 测试开球时间排序 ===")
+    
+    try:
+        import random
+        from src.models.match_table import MatchTable
+        
+        matches, _ = _load_raw_matches()
+        shuffled = list(matches)
+        random.Random(11).shuffle(shuffled)
+        table = MatchTable.from_matches(shuffled)
+        
+        # 按开球时间稳定排序：同一时间的比赛保持输入顺序
+        expected = sorted(shuffled, key=lambda match: match.kickoff_ts)
+        if table.to_matches() != expected:
+            print("✗ 乱序输入未按开球时间稳定排序")
+            return False
+        
+        kickoff = sorted({match.kickoff_ts for match in matches})
+        for start_ts, end_ts in ((kickoff[10], kickoff[200]), (None, kickoff[5]), (kickoff[-3], None),
+                                 (kickoff[50], kickoff[50]), (kickoff[0] - 1, kickoff[-1] + 1)):
+            in_range = [match for match in expected
+                        if (start_ts is None or match.kickoff_ts >= start_ts)
+                        and (end_ts is None or match.kickoff_ts < end_ts)]
+            if table.between(start_ts, end_ts).to_matches() != in_range:
+                print(f"✗ 时间区间 [{start_ts}, {end_ts}) 查询错误")
+                return False
+        if table.before(kickoff[100]).to_matches() != [m for m in expected if m.kickoff_ts < kickoff[100]]:
+            print("✗ before查询错误")
+            return False
+        for n in (0, 1, 25, len(expected) + 5):
+            if table.latest(n).to_matches() != expected[::-1][:n]:
+                print(f"✗ 最近 {n} 场查询错误")
+                return False
+        
+        print("✓ 乱序输入排序与时间区间、最近N场查询正确")
+        return True
+        
+    except Exception as e:
+        print(f"✗ 开球时间排序测试失败: {e}")
+        return False
+
+def test_match_dedupe():
+    """测试重复比赛ID按策略去重"""
+    print("\n=== 测试比赛去重 ===")
+    
+    try:
+        from dataclasses import replace
+        from src.data.match_index import MatchIndex
+        
+        matches, _ = _load_raw_matches()
+        incomplete = replace(matches[0], home_shots=0, away_shots=0)
+        for policy, expected in (('latest', incomplete), ('first', matches[0]), ('complete', matches[0])):
+            index = MatchIndex(policy)
+            index.extend([matches[0], matches[1], incomplete])
+            if len(index) != 2 or index.duplicates != 1 or index.get(matches[0].match_id) != expected:
+                print(f"✗ 去重策略 {policy} 结果错误")
+                return False
+        print("✓ 比赛ID查找与去重正确")
+        return True
+        
+    except Exception as e:
+        print(f"✗ 比赛去重测试失败: {e}")
+        return False
+
+def test_team_stats_cache():
+    """测试球队统计缓存按数据版本命中与失效"""
+    print("\n=== 测试球队统计缓存 ===")
+    
+    try:
+        from src.models.match_table import MatchTable
+        from src.predictors.football_predictor import FootballPredictor
+        
+        matches, table = _load_raw_matches()
+        predictor = FootballPredictor()
+        
+        # 重复查询命中缓存，替换数据表（新版本）后缓存失效
+        team = matches[0].home_team
+        predictor.calculate_team_stats(table, team)
+        hits = predictor.team_stats_cache.hits
+        predictor.calculate_team_stats(table, team)
+        replaced = MatchTable.from_matches(matches)
+        predictor.calculate_team_stats(replaced, team)
+        if predictor.team_stats_cache.hits != hits + 1 or predictor.team_stats_cache.dataset_version != replaced.version:
+            print("✗ 球队统计缓存未按数据版本命中或失效")
+            return False
+        print("✓ 球队统计缓存正确")
+        return True
+        
+    except Exception as e:
+        print(f"✗ 球队统计缓存测试失败: {e}")
+        return False
+
+def test_batch_prediction():
+    """测试向量化批量预测"""
+    print("\n=== 测试批量预测 ===")
+    
+    try:
+        from src.predictors.football_predictor import FootballPredictor
+        
+        matches, table = _load_raw_matches()
+        predictor = FootballPredictor()
+        
+        # 向量化批量预测与逐场预测完全一致
+        fixtures = matches[::10]
+        if predictor.batch_predict(fixtures, table) != [predictor.predict_match(match, table) for match in fixtures]:
+            print("✗ 批量预测结果与逐场预测不一致")
+            return False
+        print("✓ 向量化批量预测结果一致")
+        return True
+        
+    except Exception as e:
+        print(f"✗ 批量预测测试失败: {e}")
+        return False
+
+def test_league_matrix():
+    """测试联赛对阵预测矩阵"""
+    print("\n=== 测试联赛对阵矩阵 ===")
+    
+    try:
+        from dataclasses import replace
+        from src.predictors.football_predictor import FootballPredictor
+        
+        matches, table = _load_raw_matches()
+        predictor = FootballPredictor()
+        
+        teams, matrix = predictor.predict_league_matrix(table, matches[0].league)
+        home_team, away_team = teams[0], teams[-1]
+        pair = replace(matches[0], home_team=home_team, away_team=away_team, home_possession=50.0,
+                       away_possession=50.0, home_shots=10, away_shots=10, home_fouls=12, away_fouls=12)
+        expected = FootballPredictor(league=matches[0].league).predict_match(pair, table).to_dict()
+        if matrix.shape != (len(teams), len(teams)) or any(matrix[0, -1][key] != value
+                                                           for key, value in expected.items()):
+            print("✗ 联赛对阵预测矩阵与逐场预测不一致")
+            return False
+        print(f"✓ 联赛对阵预测矩阵正确 ({len(teams)}×{len(teams)})")
+        return True
+        
+    except Exception as e:
+        print(f"✗ 联赛对阵矩阵测试失败: {e}")
+        return False
+
+def test_scoreline_probabilities():
+    """测试比分概率"""
+    print("\n=== 测试比分概率 ===")
+    
+    try:
+        import math
+        from src.predictors.football_predictor import FootballPredictor
+        from src.predictors.probability_engine import scoreline_matrix
+        
+        matches, table = _load_raw_matches()
+        predictor = FootballPredictor()
+        
+        # 各结果概率之和为1，比分矩阵与双变量泊松闭式解一致
+        probabilities = predictor.predict_probabilities(predictor.batch_predict(matches[::10], table))
+        for p in probabilities:
+            if (abs(p.home_win_probability + p.draw_probability + p.away_win_probability - 1) > 1e-9
+                    or abs(p.over_probability + p.under_probability - 1) > 1e-9):
+                print("✗ 比赛结果概率之和不为1")
+                return False
+        lam1, lam2, lam3 = 1.3, 0.9, 0.2
+        matrix = scoreline_matrix([lam1 + lam3], [lam2 + lam3], max_goals=30, covariance=lam3)[0]
+        closed_form = math.exp(-(lam1 + lam2 + lam3)) * sum(
+            lam1 ** (2 - i) * lam2 ** (1 - i) * lam3 ** i
+            / (math.factorial(2 - i) * math.factorial(1 - i) * math.factorial(i)) for i in range(2))
+        if abs(matrix[2, 1] - closed_form) > 1e-12:
+            print("✗ 比分概率矩阵与双变量泊松分布不一致")
+            return False
+        print("✓ 比分概率计算正确")
+        return True
+        
+    except Exception as e:
+        print(f"✗ 比分概率测试失败: {e}")
+        return False
+
+def test_form_tracker():
+    """测试指数加权球队状态"""
+    print("\n=== 测试指数加权球队状态 ===")
+    
+    try:
+        from src.predictors.form_tracker import TeamFormTracker
+        
+        _, table = _load_raw_matches()
+        
+        # 整表批量构建与逐场O(1)更新结果一致
+        bulk, incremental = TeamFormTracker.from_table(table), TeamFormTracker()
+        incremental.extend(table.to_matches())
+        for team in table.present_teams():
+            bulk_stats, incremental_stats = bulk.team_stats(team).to_dict(), incremental.team_stats(team).to_dict()
+            if any(abs(bulk_stats[key] - incremental_stats[key]) > 1e-9 for key in bulk_stats if key != 'team_name'):
+                print(f"✗ 球队 {team} 的指数加权状态不一致")
+                return False
+        print("✓ 指数加权球队状态正确")
+        return True
+        
+    except Exception as e:
+        print(f"✗ 指数加权球队状态测试失败: {e}")
+        return False
+
+def test_prediction_service():
+    """测试多联赛预测服务"""
+    print("\n=== 测试多联赛预测服务 ===")
+    
+    try:
+        from src.predictors.football_predictor import FootballPredictor
+        from src.predictors.prediction_service import PredictionService
+        
+        matches, table = _load_raw_matches()
+        
+        # 每场比赛与该联赛预测器的逐场预测一致
+        slate = matches[::50]
+        league_predictors = {match.league: FootballPredictor(league=match.league) for match in slate}
+        if PredictionService(table).predict_matches(slate) != [league_predictors[match.league].predict_match(match, table)
+                                                              for match in slate]:
+            print("✗ 多联赛预测服务结果与各联赛预测器不一致")
+            return False
+        print(f"✓ 多联赛预测服务正确 ({len(league_predictors)} 个联赛)")
+        return True
+        
+    except Exception as e:
+        print(f"✗ 多联赛预测服务测试失败: {e}")
+        return False
+
+def test_in_play():
+    """测试滚球预测"""
+    print("\n=== 测试滚球预测 ===")
+    
+    try:
+        from src.predictors.football_predictor import FootballPredictor
+        from src.predictors.in_play import InPlayModel, evaluate_in_play
+        
+        matches, table = _load_raw_matches()
+        predictor = FootballPredictor()
+        
+        # 开赛时等于赛前预测，终场时等于当前比分，按历史快照更新后误差小于赛前预测（模型只用验证集之前的比赛拟合）
+        in_play_model = InPlayModel.for_table(table)
+        pre_match = predictor.predict_match(matches[0], table)
+        if (in_play_model.update(pre_match, 0, 0, 0, 0, 0) != pre_match
+                or in_play_model.update(pre_match, 90, 2, 1).total_goals != 3.0):
+            print("✗ 滚球预测更新结果错误")
+            return False
+        for snapshot, result in evaluate_in_play(table, predictor).items():
+            if result['in_play_mae'] >= result['pre_match_mae']:
+                print(f"✗ {snapshot} 滚球预测误差未降低: {result}")
+                return False
+            print(f"✓ {snapshot} 滚球预测误差 {result['pre_match_mae']:.2f} -> {result['in_play_mae']:.2f} "
+                  f"({result['matches']} 场)")
+        return True
+        
+    except Exception as e:
+        print(f"✗ 滚球预测测试失败: {e}")
+        return False
+
+def test_team_index():
+    """测试球队出场索引"""
+    print("\n=== 测试球队出场索引 ===")
+    
+    try:
+        _, table = _load_raw_matches()
+        
+        # 与逐场筛选一致
+        team_index = table.team_index()
+        for team in table.present_teams()[:50]:
+            code = table.team_code(team)
+            positions, is_home = team_index.appearances(code)
+            expected = [i for i, match in enumerate(table) if team in (match.home_team, match.away_team)]
+            home_flags = (table.columns['home_team_code'][positions] == code).tolist()
+            if positions.tolist() != expected or home_flags != is_home.tolist():
+                print(f"✗ 球队 {team} 的出场索引错误")
+                return False
+        print("✓ 球队出场索引正确")
+        return True
+        
+    except Exception as e:
+        print(f"✗ 球队出场索引测试失败: {e}")
+        return False
+
+def test_rolling_stats():
+    """测试时间点滚动统计"""
+    print("\n=== 测试时间点滚动统计 ===")
+    
+    try:
+        from src.predictors.football_predictor import FootballPredictor
+        
+        matches, table = _load_raw_matches()
+        predictor = FootballPredictor()
+        
+        # 整数统计完全一致，控球率/传球成功率允许浮点舍入误差
+        for match in matches[::40]:
+            for team in (match.home_team, match.away_team):
+                rolling = predictor.calculate_team_stats(table, team, as_of=match.kickoff_ts).to_dict()
+                expected = predictor.calculate_team_stats(matches, team, as_of=match.kickoff_ts).to_dict()
+                for key, value in expected.items():
+                    if key in ('avg_possession', 'avg_pass_success_rate'):
+                        consistent = abs(rolling[key] - value) <= 1e-9
+                    else:
+                        consistent = rolling[key] == value
+                    if not consistent:
+                        print(f"✗ 球队 {team} 的时间点统计 {key} 不一致")
+                        return False
+        print("✓ 时间点滚动统计正确")
+        return True
+        
+    except Exception as e:
+        print(f"✗ 时间点滚动统计测试失败: {e}")
+        return False
+
+def test_league_accumulator():
+    """测试可合并的联赛统计累加器"""
+    print("\n=== 测试联赛累加器 ===")
+    
+    try:
+        import statistics
+        from src.trainers.baseline_trainer import BaselineTrainer
+        
+        matches, table = _load_raw_matches()
+        
+        # 分片合并、逐场O(1)更新与一次性训练结果一致，Welford方差与直接计算一致
+        table_trainer = BaselineTrainer()
+        table_trainer.collect_league_statistics(table)
+        shard_trainers = [BaselineTrainer() for _ in range(3)]
+        for shard, trainer in enumerate(shard_trainers):
+            trainer.collect_league_statistics(table.take(slice(shard, None, 3)))
+        merged_trainer = shard_trainers[0].merge(shard_trainers[1]).merge(shard_trainers[2])
+        online_trainer = BaselineTrainer()
+        for match in matches:
+            online_trainer.update_match(match)
+        expected_baselines = table_trainer.calculate_league_baselines()
+        if (merged_trainer.calculate_league_baselines() != expected_baselines
+                or online_trainer.calculate_league_baselines() != expected_baselines):
+            print("✗ 联赛累加器合并或逐场更新结果不一致")
+            return False
+        league = matches[0].league
+        league_goals = [match.home_goals + match.away_goals for match in matches if match.league == league]
+        for trainer in (merged_trainer, online_trainer):
+            if abs(trainer.league_stats[league].variance('total_goals') - statistics.variance(league_goals)) > 1e-9:
+                print("✗ 联赛累加器方差计算错误")
+                return False
+        print("✓ 联赛累加器合并与逐场更新正确")
+        return True
+        
+    except Exception as e:
+        print(f"✗ 联赛累加器测试失败: {e}")
+        return False
+
+def test_bootstrap_intervals():
+    """测试联赛系数的自助法置信区间"""
+    print("\n=== 测试自助法置信区间 ===")
+    
+    try:
+        import contextlib, io
+        import numpy as np
+        from src.trainers.baseline_trainer import BaselineTrainer
+        from src.trainers.bootstrap import bootstrap_coefficients, bootstrap_league_intervals
+        from src.trainers.league_accumulator import LEAGUE_METRICS, league_coefficients
+        
+        matches, table = _load_raw_matches()
+        league = matches[0].league
+        
+        # 一次抽取的索引矩阵与逐次重抽样结果一致（列顺序与LEAGUE_METRICS一致）
+        values = np.array([[m.home_goals + m.away_goals, m.home_corners + m.away_corners,
+                            m.home_yellow_cards + m.away_yellow_cards, m.home_goals, m.away_goals,
+                            m.home_fouls + m.away_fouls] for m in matches if m.league == league], dtype=np.float64)
+        vectorized = bootstrap_coefficients(values, 200, np.random.RandomState(3))
+        loop_rng = np.random.RandomState(3)
+        looped = [league_coefficients(dict(zip(LEAGUE_METRICS, values[loop_rng.randint(0, len(values),
+                                                                                         len(values))].mean(axis=0))))
+                  for _ in range(200)]
+        if any(abs(vectorized[name][i] - sample[name]) > 1e-12
+               for i, sample in enumerate(looped) for name in vectorized):
+            print("✗ 向量化自助法与逐次重抽样结果不一致")
+            return False
+        
+        # 固定种子可复现，覆盖所有联赛，区间包含点估计
+        trainer = BaselineTrainer()
+        trainer.collect_league_statistics(table)
+        intervals = bootstrap_league_intervals(table, 2000, 0.95, seed=0)
+        point = trainer.calculate_league_baselines()
+        if (intervals != bootstrap_league_intervals(table, 2000, 0.95, seed=0)
+                or set(intervals) != set(table.present_leagues())
+                or any(not intervals[name][field][0] <= params[field] <= intervals[name][field][1]
+                       for name, params in point.items() for field in ('goal_baseline', 'home_advantage',
+                                                                       'foul_to_yellow'))):
+            print("✗ 联赛系数置信区间错误")
+            return False
+        
+        # 默认训练时写入 {系数名}_ci，重抽样次数为0时不计算置信区间
+        with contextlib.redirect_stdout(io.StringIO()):
+            default_baselines = BaselineTrainer().train_from_matches(table, seed=0)
+            skipped_baselines = BaselineTrainer().train_from_matches(table, 0)
+        if (any('goal_baseline_ci' not in params for params in default_baselines.values())
+                or any(name.endswith('_ci') for params in skipped_baselines.values() for name in params)):
+            print("✗ 自助法置信区间的开关错误")
+            return False
+        print("✓ 自助法置信区间正确")
+        return True
+        
+    except Exception as e:
+        print(f"✗ 自助法置信区间测试失败: {e}")
+        return False
+
+def test_parallel_cross_validation():
+    """测试并行交叉验证"""
+    print("\n=== 测试并行交叉验证 ===")
+    
+    try:
+        import contextlib, io
+        from src.trainers.baseline_trainer import BaselineTrainer
+        
+        matches, table = _load_raw_matches()
+        
+        # 相同种子下与串行结果一致，与输入是列表还是数据表无关
+        with contextlib.redirect_stdout(io.StringIO()):
+            serial = BaselineTrainer().cross_validate(table, 5, workers=1, seed=7)
+            parallel = BaselineTrainer().cross_validate(matches, 5, workers=2, seed=7)
+        if serial != parallel:
+            print("✗ 并行交叉验证结果与串行不一致")
+            return False
+        print("✓ 并行交叉验证结果可复现")
+        return True
+        
+    except Exception as e:
+        print(f"✗ 并行交叉验证测试失败: {e}")
+        return False
+
+def _run_week_backtest(table):
+    """按周逐期回测（不输出过程信息）"""
+    import contextlib, io
+    from src.trainers.backtester import WalkForwardBacktester
+    
+    with contextlib.redirect_stdout(io.StringIO()):
+        return WalkForwardBacktester('week').run(table)
+
+def test_backtester():
+    """测试逐期回测"""
+    print("\n=== 测试逐期回测 ===")
+    
+    try:
+        import numpy as np
+        from src.trainers.baseline_trainer import BaselineTrainer
+        from src.predictors.rolling_stats import TeamWindowTracker, TeamRollingStats
+        
+        matches, table = _load_raw_matches()
+        
+        # 增量球队状态与时间点统计一致
+        kickoff = table.columns['kickoff_ts']
+        as_of = int(kickoff[len(table) // 2])
+        window_tracker = TeamWindowTracker()
+        window_tracker.extend(table[:int(np.searchsorted(kickoff, as_of))])
+        rolling_stats = TeamRollingStats.for_table(table)
+        for team in table.present_teams():
+            tracked = window_tracker.team_stats(team).to_dict()
+            expected = rolling_stats.team_stats(team, as_of=as_of).to_dict()
+            if any(abs(tracked[key] - value) > 1e-9 if isinstance(value, float) else tracked[key] != value
+                   for key, value in expected.items()):
+                print(f"✗ 球队 {team} 的增量窗口统计不一致")
+                return False
+        
+        # 结束时的联赛状态与全量训练的基线一致
+        trainer = BaselineTrainer()
+        trainer.collect_league_statistics(matches)
+        backtest = _run_week_backtest(table)
+        if (sum(period['matches'] for period in backtest['periods']) != len(table)
+                or backtest['league_baselines'] != trainer.calculate_league_baselines()):
+            print("✗ 逐期回测结果错误")
+            return False
+        print(f"✓ 逐期回测正确 ({len(backtest['periods'])} 期)")
+        return True
+        
+    except Exception as e:
+        print(f"✗ 逐期回测测试失败: {e}")
+        return False
+
+def test_streaming_metrics():
+    """测试可合并的流式评估指标"""
+    print("\n=== 测试流式评估指标 ===")
+    
+    try:
+        import numpy as np
+        from src.trainers.metrics import MetricsAccumulator, actual_columns, evaluate_arrays, brier_score, log_loss
+        from src.predictors.probability_engine import predict_probabilities
+        
+        _, table = _load_raw_matches()
+        
+        # 分块累计再合并与一次性计算一致，Brier分数/对数损失与手算结果一致
+        backtest_predictions = _run_week_backtest(table)['predictions']
+        backtest_probabilities = predict_probabilities(backtest_predictions['home_team_goals'],
+                                                       backtest_predictions['away_team_goals'])
+        merged = MetricsAccumulator()
+        for rows in np.array_split(np.arange(len(table)), 5):
+            part = MetricsAccumulator()
+            part.update(backtest_predictions[rows], actual_columns(table.columns, rows), backtest_probabilities[rows])
+            merged.merge(part)
+        merged_metrics = merged.summary()
+        full_metrics = evaluate_arrays(backtest_predictions, actual_columns(table.columns), backtest_probabilities)
+        if (merged_metrics.keys() != full_metrics.keys()
+                or any(abs(merged_metrics[key] - value) > 1e-9 for key, value in full_metrics.items())):
+            print("✗ 分块合并的评估指标与一次性计算不一致")
+            return False
+        if (abs(brier_score([[0.5, 0.3, 0.2]], [0]) - 0.38) > 1e-12
+                or abs(log_loss([0.8, 0.4], [1, 0]) + (np.log(0.8) + np.log(0.6)) / 2) > 1e-12):
+            print("✗ Brier分数或对数损失计算错误")
+            return False
+        print(f"✓ 流式评估指标正确 (角球MAE {full_metrics['total_corners_MAE']:.3f}, "
+              f"胜平负Brier {full_metrics['brier_1x2']:.3f})")
+        return True
+        
+    except Exception as e:
+        print(f"✗ 流式评估指标测试失败: {e}")
+        return False
+
+def test_hyperparameter_tuner():
+    """测试超参数搜索"""
+    print("\n=== 测试超参数搜索 ===")
+    
+    try:
+        import contextlib, io
+        from src.trainers.backtester import WalkForwardBacktester
+        import tempfile
+        from src.config.league_coefficients import DATA_CONFIG
+        from src.trainers.tuner import HyperparameterTuner, TuningData, apply_data_config
+        from src.predictors.rolling_stats import TeamRollingStats
+        
+        _, table = _load_raw_matches()
+        
+        # 向量化窗口统计与时间点统计一致
+        tuning_data = TuningData.build(table, 'week')
+        home_stats, _ = tuning_data.window_stats(5, 3)
+        rolling_stats = TeamRollingStats.for_table(table)
+        week_backtester = WalkForwardBacktester('week')
+        week_start = week_backtester.period_start(week_backtester.period_ids(table.columns['kickoff_ts']))
+        for row in range(0, len(table), max(len(table) // 50, 1)):
+            expected = rolling_stats.team_stats(table[row].home_team, 5, int(week_start[row])).to_dict()
+            if any(abs(home_stats[name][row] - expected[name]) > 1e-9 for name in home_stats):
+                print(f"✗ 第 {row} 场比赛的窗口统计不一致")
+                return False
+        
+        # 并行与串行选出相同参数，且不差于当前配置
+        search_space = {'recent_matches_window': [5, 10], 'min_matches_required': [1, 3]}
+        with contextlib.redirect_stdout(io.StringIO()):
+            serial = HyperparameterTuner(search_space, period='week', workers=1).tune(table)
+            parallel = HyperparameterTuner(search_space, period='week', workers=2).tune(table)
+        if (serial['best']['params'] != parallel['best']['params']
+                or serial['best']['objective'] != parallel['best']['objective']
+                or serial['best']['objective'] > serial['current']['objective'] + 1e-12):
+            print("✗ 超参数搜索结果错误")
+            return False
+        
+        # 当前配置的目标与逐期回测指标一致（联赛系数逐期训练，样本外）
+        with contextlib.redirect_stdout(io.StringIO()):
+            overall = week_backtester.run(table)['overall']
+        if any(abs(serial['current']['mae'][target] - overall[f'{target}_MAE']) > 1e-9
+               for target in ('total_goals', 'total_corners', 'total_yellow_cards')):
+            print(f"✗ 搜索目标与回测指标不一致: {serial['current']['mae']}")
+            return False
+        
+        # 保存的全局参数可以应用回配置（范围限制恢复为元组）
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            saved = dict(DATA_CONFIG)
+            try:
+                with contextlib.redirect_stdout(io.StringIO()):
+                    config_path = HyperparameterTuner().save_results(serial, os.path.join(tmp_dir, "tuned.json"))
+                    apply_data_config(config_path)
+                if any(DATA_CONFIG[name] != value for name, value in serial['best']['params'].items()):
+                    print("✗ 全局参数文件未正确应用到配置")
+                    return False
+            finally:
+                DATA_CONFIG.clear()
+                DATA_CONFIG.update(saved)
+        print(f"✓ 超参数搜索正确 (目标 {serial['current']['objective']:.3f} -> {serial['best']['objective']:.3f})")
+        return True
+        
+    except Exception as e:
+        print(f"✗ 超参数搜索测试失败: {e}")
+        return False
+
+def test_odds_store():
+    """测试盘口数据解析与展平存储"""
+    print("\n=== 测试盘口数据 ===")
+    
+    try:
+        import numpy as np
+        from src.data.data_processor import DataProcessor
+        
+        processor = DataProcessor()
+        records = [
+            {"比赛id": 1, "初始让分盘口": "让球-0.5/1", "初始让分水位": "赔率:0.91",
+             "开场大小球盘口": "大小球2/2.5", "让分盘水位变化详情": "-0.5/1/0.93\n-0.5/0.89\n"},
+            {"比赛id": 2, "初始让分盘口": "", "大小球水位变化详情": "2.5/0.975\n"},
+            {"比赛id": 3},
+        ]
+        odds = processor.decode_odds(records)
+        
+        if odds.snapshots['handicap_initial_line'][0] != -0.75 or odds.snapshots['total_opening_line'][0] != 2.25:
+            print("✗ 盘口解析结果错误")
+            return False
+        if not np.isnan(odds.snapshots['handicap_initial_line'][1]):
+            print("✗ 缺失盘口应为NaN")
+            return False
+        if odds.tick_counts('handicap').tolist() != [2, 0, 0] or odds.tick_counts('total').tolist() != [0, 1, 0]:
+            print("✗ 水位变化序列偏移量错误")
+            return False
+        lines, prices = odds.ticks('handicap', '1')
+        if lines.tolist() != [-0.75, -0.5] or prices.tolist() != [0.93, 0.89]:
+            print("✗ 水位变化序列内容错误")
+            return False
+        if odds.align(['3', '1', '9']).tolist() != [2, 0, -1]:
+            print("✗ 比赛ID对齐错误")
+            return False
+        
+        print("✓ 盘口与水位变化序列解析正确")
+
+        # 按行选取后水位变化序列随之重排
+        taken = odds.take([1, 0])
+        if taken.match_ids.tolist() != ['2', '1'] or taken.ticks('handicap', '1')[1].tolist() != [0.93, 0.89]:
+            print("✗ 盘口数据按行选取错误")
+            return False
+
+        # 重复比赛ID：盘口与比赛记录按同一去重策略保留同一条记录
+        import json, tempfile
+        from pathlib import Path
+        duplicate = {"比赛id": 1, "初始让分盘口": "让球0.5", "让分盘水位变化详情": "0.5/0.80\n", "角球": "5/3"}
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            files = []
+            for name, file_records in (("a.json", records), ("b.json", [{}, duplicate])):
+                path = Path(tmp_dir) / name
+                path.write_text(json.dumps(file_records, ensure_ascii=False), encoding='utf-8')
+                files.append(path)
+            for policy, line, prices in (('first', -0.75, [0.93, 0.89]), ('latest', 0.5, [0.8]),
+                                         ('complete', 0.5, [0.8])):
+                deduped = DataProcessor(dedupe_policy=policy).process_odds(files)
+                if (deduped.match_ids.tolist() != ['1', '2', '3'] or deduped.snapshots['handicap_initial_line'][deduped.row('1')] != line
+                        or deduped.ticks('handicap', '1')[1].tolist() != prices):
+                    print(f"✗ 去重策略 {policy} 下盘口数据与比赛记录不一致")
+                    return False
+        print("✓ 盘口数据按比赛去重策略保留")
+        return True
+        
+    except Exception as e:
+        print(f"✗ 盘口数据测试失败: {e}")
+        return False
+
+def test_coefficient_table():
+    """测试联赛系数表的训练结果合并与热加载"""
+    print("\n=== 测试联赛系数表 ===")
+    
+    try:
+        import json
+        import tempfile
+        from src.config.league_coefficients import LEAGUE_COEFFICIENTS
+        from src.predictors.coefficient_table import CoefficientTable
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            baselines_file = os.path.join(tmp_dir, "trained_baselines.json")
+            table = CoefficientTable(baselines_file, check_interval=0)
+            if any(table.coefficients(league) != params for league, params in LEAGUE_COEFFICIENTS.items()):
+                print("✗ 无训练结果时应使用配置中的联赛系数")
+                return False
+            
+            with open(baselines_file, 'w', encoding='utf-8') as f:
+                json.dump({"英超": {"goal_baseline": 3.1}, "法甲": {"goal_baseline": 2.4}}, f, ensure_ascii=False)
+            if (table.coefficients("英超")["goal_baseline"] != 3.1
+                    or table.coefficients("英超")["corner_baseline"] != LEAGUE_COEFFICIENTS["英超"]["corner_baseline"]):
+                print("✗ 基线文件变化后未重新加载，或缺失字段未回退到配置")
+                return False
+            codes = table.codes_for(["法甲", "未知联赛"])
+            if table.gather(codes)["goal_baseline"].tolist() != [2.4, LEAGUE_COEFFICIENTS["中超"]["goal_baseline"]]:
+                print("✗ 按联赛编码取系数错误")
+                return False
+
+            # 默认基线文件按项目根目录解析，不受工作目录影响（webapp在子目录中运行）
+            cwd = os.getcwd()
+            try:
+                os.chdir(tmp_dir)
+                default_file = CoefficientTable().baselines_file
+            finally:
+                os.chdir(cwd)
+            if default_file != os.path.join(os.path.dirname(os.path.abspath(__file__)), "trained_baselines.json"):
+                print(f"✗ 默认基线文件未按项目根目录解析: {default_file}")
+                return False
+
+        # 内存中的基线参数（交叉验证各折）不读取基线文件
+        local = CoefficientTable.from_baselines({"中超": {"goal_baseline": 1.9, "sample_size": 50}})
+        if (local.coefficients("中超")["goal_baseline"] != 1.9
+                or local.coefficients("英超") != LEAGUE_COEFFICIENTS["英超"]):
+            print("✗ 由基线参数编译的系数表错误")
+            return False
+
+        print("✓ 联赛系数表合并与热加载正确")
+        return True
+        
+    except Exception as e:
+        print(f"✗ 联赛系数表测试失败: {e}")
+        return False
+
 def main():
     """主测试函数"""
     print("开始测试足球数据分析系统...")
@@ -134,7 +1199,33 @@ def main():
         ("模块导入", test_imports),
         ("数据处理", test_data_processing),
         ("预测功能", test_prediction),
-        ("训练功能", test_training)
+        ("训练功能", test_training),
+        ("列式解析", test_column_parsing),
+        ("并行解析", test_parallel_ingest),
+        ("JSON增量读取", test_json_stream),
+        ("流式消费", test_stream_consumers),
+        ("增量解析缓存", test_ingest_cache),
+        ("列式存储", test_match_store),
+        ("数组化数据表", test_match_table),
+        ("开球时间排序", test_kickoff_order),
+        ("比赛去重", test_match_dedupe),
+        ("球队出场索引", test_team_index),
+        ("时间点滚动统计", test_rolling_stats),
+        ("球队统计缓存", test_team_stats_cache),
+        ("批量预测", test_batch_prediction),
+        ("联赛对阵矩阵", test_league_matrix),
+        ("比分概率", test_scoreline_probabilities),
+        ("指数加权球队状态", test_form_tracker),
+        ("多联赛预测服务", test_prediction_service),
+        ("滚球预测", test_in_play),
+        ("并行交叉验证", test_parallel_cross_validation),
+        ("逐期回测", test_backtester),
+        ("流式评估指标", test_streaming_metrics),
+        ("联赛累加器", test_league_accumulator),
+        ("超参数搜索", test_hyperparameter_tuner),
+        ("自助法置信区间", test_bootstrap_intervals),
+        ("盘口数据", test_odds_store),
+        ("联赛系数表", test_coefficient_table)
     ]
     
     passed = 0
@@ -9,6 +9,7 @@ import sys
 import os
 from datetime import datetime
 import json
+import numpy as np
 from flask import Flask, render_template, jsonify, request
 from flask_cors import CORS
 
@@ -17,24 +18,31 @@ project_root = os.path.join(os.path.dirname(__file__), '..')
 sys.path.insert(0, project_root)
 sys.path.insert(0, os.path.join(project_root, 'src'))
 
-from src.data.data_processor import process_football_data
-from src.predictors.football_predictor import FootballPredictor
+from src.data.data_processor import load_football_data
+from src.predictors.prediction_service import PredictionService
 from src.models.data_models import MatchData
+from src.models.match_table import MatchTable
+from src.main import configure_model_files
 
 app = Flask(__name__)
 CORS(app)
 
-# 全局变量存储数据和预测器
-matches_data = []
-predictor = None
+# 全局变量存储数据和预测服务（比赛数据以数组化的MatchTable保存）
+matches_data = MatchTable.from_matches([])
+prediction_service = None  # 多联赛预测服务，每场比赛按其联赛取系数
 league_stats = {}
+league_matrix_cache = {}  # (联赛, 数据表版本, 系数表版本) -> 联赛对阵预测矩阵
 
 def initialize_system():
     """初始化系统数据"""
-    global matches_data, predictor, league_stats
+    global matches_data, prediction_service, league_stats
     
     print("正在初始化足球数据分析系统...")
     
+    # 联赛系数文件与调参得到的全局参数可由环境变量指定（需在创建预测服务之前应用）
+    if prediction_service is None:
+        configure_model_files(os.environ.get('FOOTBALL_BASELINES_FILE'), os.environ.get('FOOTBALL_DATA_CONFIG'))
+    
     # 加载数据
     try:
         # 使用标准化数据路径
@@ -42,16 +50,23 @@ def initialize_system():
             os.path.join(project_root, 'data', 'raw', '2021'),
             os.path.join(project_root, 'data', 'raw', '2023')
         ]
-        matches_data = process_football_data(data_dirs)
+        # 原始数据未变化时直接加载列式存储，否则增量解析变化的月份文件并重建存储
+        cache_dir = os.path.join(project_root, 'data', 'cache')
+        store_dir = os.path.join(project_root, 'data', 'processed', 'match_store')
+        matches_data = load_football_data(data_dirs, store_dir, cache_dir=cache_dir, as_table=True)
         print(f"成功加载 {len(matches_data)} 场比赛数据")
     except Exception as e:
         print(f"数据加载失败: {e}")
-        matches_data = []
+        matches_data = MatchTable.from_matches([])
     
-    # 初始化预测器
-    predictor = FootballPredictor(league="中超")
+    # 初始化预测服务（替换数据表时清空球队统计缓存）
+    if prediction_service is None:
+        prediction_service = PredictionService(matches_data)
+    else:
+        prediction_service.matches = matches_data
     
     # 计算联赛统计信息
+    league_matrix_cache.clear()
     calculate_league_stats()
     
     print("系统初始化完成!")
@@ -63,26 +78,33 @@ def calculate_league_stats():
     if not matches_data:
         return
     
-    # 按联赛分组统计
-    league_data = {}
-    for match in matches_data:
-        league = match.league
-        if league not in league_data:
-            league_data[league] = []
-        league_data[league].append(match)
+    columns = matches_data.columns
+    league_codes = columns['league_code']
+    n_leagues = len(matches_data.leagues)
+    
+    # 按联赛编码分组累加
+    match_counts = np.bincount(league_codes, minlength=n_leagues)
+    goal_sums = np.bincount(league_codes, weights=columns['home_goals'] + columns['away_goals'],
+                            minlength=n_leagues)
+    corner_sums = np.bincount(league_codes, weights=columns['home_corners'] + columns['away_corners'],
+                              minlength=n_leagues)
+    yellow_sums = np.bincount(league_codes,
+                              weights=columns['home_yellow_cards'] + columns['away_yellow_cards'],
+                              minlength=n_leagues)
     
     # 计算各联赛统计信息
-    for league, matches in league_data.items():
-        total_goals = sum(match.home_goals + match.away_goals for match in matches)
-        total_corners = sum(match.home_corners + match.away_corners for match in matches)
-        total_yellow = sum(match.home_yellow_cards + match.away_yellow_cards for match in matches)
+    for code, league in enumerate(matches_data.leagues):
+        match_count = int(match_counts[code])
+        if match_count == 0:
+            continue
         
         league_stats[league] = {
-            'match_count': len(matches),
-            'avg_goals': round(total_goals / len(matches), 2),
-            'avg_corners': round(total_corners / len(matches), 2),
-            'avg_yellow_cards': round(total_yellow / len(matches), 2),
-            'latest_match_date': max(match.date for match in matches)
+            'match_count': match_count,
+            'avg_goals': round(int(goal_sums[code]) / match_count, 2),
+            'avg_corners': round(int(corner_sums[code]) / match_count, 2),
+            'avg_yellow_cards': round(int(yellow_sums[code]) / match_count, 2),
+            # 数据表按开球时间排序，联赛最后一场即最新比赛
+            'latest_match_date': str(columns['date'][np.flatnonzero(league_codes == code)[-1]])
         }
 
 # 在应用启动时初始化
@@ -103,7 +125,7 @@ def get_matches():
     """获取比赛数据API"""
     try:
         # 返回最新的几场比赛
-        latest_matches = sorted(matches_data, key=lambda x: x.date, reverse=True)[:50]
+        latest_matches = matches_data.latest(50)
         
         matches_list = []
         for match in latest_matches:
@@ -129,6 +151,21 @@ def get_matches():
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)})
 
+@app.route('/api/match/<match_id>')
+def get_match(match_id):
+    """按比赛ID获取单场比赛数据"""
+    try:
+        match = matches_data.find(match_id)
+        if match is None:
+            return jsonify({'success': False, 'error': f'未找到比赛: {match_id}'})
+        
+        return jsonify({
+            'success': True,
+            'data': match.to_dict()
+        })
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)})
+
 @app.route('/api/leagues')
 def get_leagues():
     """获取联赛统计信息"""
@@ -140,18 +177,39 @@ def get_leagues():
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)})
 
+@app.route('/api/league_matrix/<league>')
+def get_league_matrix(league):
+    """获取联赛内所有主客队组合的预测矩阵（按数据版本缓存）"""
+    try:
+        if league not in matches_data.present_leagues():
+            return jsonify({'success': False, 'error': f'未找到联赛: {league}'})
+        
+        cache_key = (league, matches_data.version, prediction_service.predictor.coefficient_table.version)
+        if cache_key not in league_matrix_cache:
+            # 每支球队的统计只计算一次，N×N个对阵一次性向量化预测；同一球队的对阵（对角线）置空
+            teams, matrix = prediction_service.league_matrix(league)
+            diagonal = np.eye(len(teams), dtype=bool)
+            league_matrix_cache[cache_key] = {
+                'league': league,
+                'teams': teams,
+                'matrix': {field: np.where(diagonal, None, matrix[field]).tolist()
+                           for field in matrix.dtype.names}
+            }
+        
+        return jsonify({
+            'success': True,
+            'data': league_matrix_cache[cache_key]
+        })
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)})
+
 @app.route('/api/teams')
 def get_teams():
     """获取所有球队列表"""
     try:
-        teams = set()
-        for match in matches_data:
-            teams.add(match.home_team)
-            teams.add(match.away_team)
-        
         return jsonify({
             'success': True,
-            'data': sorted(list(teams))
+            'data': sorted(matches_data.present_teams())
         })
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)})
@@ -160,55 +218,54 @@ def get_teams():
 def get_team_history(team_name):
     """获取球队最近比赛历史数据"""
     try:
-        # 查找该球队的所有比赛
-        team_matches = []
-        for match in matches_data:
-            if match.home_team == team_name or match.away_team == team_name:
-                # 判断球队在这场比赛中的角色
-                is_home = match.home_team == team_name
-                team_role = '主场' if is_home else '客场'
-                
-                # 计算球队的进球和失球
-                team_goals = match.home_goals if is_home else match.away_goals
-                opponent_goals = match.away_goals if is_home else match.home_goals
-                
-                # 计算球队的其他统计数据
-                team_corners = match.home_corners if is_home else match.away_corners
-                opponent_corners = match.away_corners if is_home else match.home_corners
-                team_yellow = match.home_yellow_cards if is_home else match.away_yellow_cards
-                opponent_yellow = match.away_yellow_cards if is_home else match.home_yellow_cards
-                
-                # 确定对手和比赛结果
-                opponent = match.away_team if is_home else match.home_team
-                result = '胜' if team_goals > opponent_goals else ('负' if team_goals < opponent_goals else '平')
-                
-                team_matches.append({
-                    'date': match.date,
-                    'league': match.league,
-                    'opponent': opponent,
-                    'role': team_role,
-                    'score': f'{team_goals}-{opponent_goals}',
-                    'result': result,
-                    'team_goals': team_goals,
-                    'opponent_goals': opponent_goals,
-                    'team_corners': team_corners,
-                    'opponent_corners': opponent_corners,
-                    'team_yellow_cards': team_yellow,
-                    'opponent_yellow_cards': opponent_yellow,
-                    'possession': match.home_possession if is_home else match.away_possession,
-                    'shots': match.home_shots if is_home else match.away_shots,
-                    'shots_on_target': match.home_shots_on_target if is_home else match.away_shots_on_target
-                })
+        # 通过球队出场索引取最近5场，无需扫描全部比赛
+        team_index = matches_data.team_index()
+        team_code = matches_data.team_code(team_name)
+        recent_positions, _ = team_index.recent(team_code, 5)
         
-        # 按日期排序，取最近5场
-        team_matches.sort(key=lambda x: x['date'], reverse=True)
-        recent_matches = team_matches[:5]
+        recent_matches = []
+        for match in matches_data.take(recent_positions):
+            # 判断球队在这场比赛中的角色
+            is_home = match.home_team == team_name
+            team_role = '主场' if is_home else '客场'
+            
+            # 计算球队的进球和失球
+            team_goals = match.home_goals if is_home else match.away_goals
+            opponent_goals = match.away_goals if is_home else match.home_goals
+            
+            # 计算球队的其他统计数据
+            team_corners = match.home_corners if is_home else match.away_corners
+            opponent_corners = match.away_corners if is_home else match.home_corners
+            team_yellow = match.home_yellow_cards if is_home else match.away_yellow_cards
+            opponent_yellow = match.away_yellow_cards if is_home else match.home_yellow_cards
+            
+            # 确定对手和比赛结果
+            opponent = match.away_team if is_home else match.home_team
+            result = '胜' if team_goals > opponent_goals else ('负' if team_goals < opponent_goals else '平')
+            
+            recent_matches.append({
+                'date': match.date,
+                'league': match.league,
+                'opponent': opponent,
+                'role': team_role,
+                'score': f'{team_goals}-{opponent_goals}',
+                'result': result,
+                'team_goals': team_goals,
+                'opponent_goals': opponent_goals,
+                'team_corners': team_corners,
+                'opponent_corners': opponent_corners,
+                'team_yellow_cards': team_yellow,
+                'opponent_yellow_cards': opponent_yellow,
+                'possession': match.home_possession if is_home else match.away_possession,
+                'shots': match.home_shots if is_home else match.away_shots,
+                'shots_on_target': match.home_shots_on_target if is_home else match.away_shots_on_target
+            })
         
         return jsonify({
             'success': True,
             'team': team_name,
             'matches': recent_matches,
-            'total_matches': len(team_matches)
+            'total_matches': team_index.count(team_code)
         })
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)})
@@ -253,8 +310,8 @@ def predict_match():
             away_red_cards=0
         )
         
-        # 进行预测
-        result = predictor.predict_match(mock_match, matches_data)
+        # 进行预测（使用请求中联赛的系数）
+        result = prediction_service.predict_matches([mock_match])[0]
         
         return jsonify({
             'success': True,
@@ -263,12 +320,44 @@ def predict_match():
                 'away_team': away_team,
                 'league': league,
                 'prediction': result.to_dict(),
+                'probabilities': prediction_service.probabilities([result])[0].to_dict(),
                 'timestamp': datetime.now().isoformat()
             }
         })
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)})
 
+@app.route('/api/predict_batch', methods=['POST'])
+def predict_batch():
+    """批量预测多联赛比赛API（每场比赛使用其联赛的系数）"""
+    try:
+        data = request.get_json()
+        fixtures = data.get('fixtures') or []
+        
+        parsed = []
+        for fixture in fixtures:
+            home_team, away_team = fixture.get('home_team'), fixture.get('away_team')
+            if not home_team or not away_team:
+                return jsonify({'success': False, 'error': '每场比赛都需要提供主队和客队名称'})
+            parsed.append((home_team, away_team, fixture.get('league', '中超')))
+        
+        results = prediction_service.predict(parsed)
+        probabilities = prediction_service.probabilities(results)
+        
+        return jsonify({
+            'success': True,
+            'data': [{
+                'home_team': home_team,
+                'away_team': away_team,
+                'league': league,
+                'prediction': result.to_dict(),
+                'probabilities': probability.to_dict()
+            } for (home_team, away_team, league), result, probability in zip(parsed, results, probabilities)],
+            'timestamp': datetime.now().isoformat()
+        })
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)})
+
 @app.route('/api/stats')
 def get_system_stats():
     """获取系统统计信息"""
@@ -276,14 +365,15 @@ def get_system_stats():
         # 计算各种统计信息
         total_matches = len(matches_data)
         
+        columns = matches_data.columns
+        
         # 联赛分布
-        league_distribution = {}
-        for match in matches_data:
-            league = match.league
-            league_distribution[league] = league_distribution.get(league, 0) + 1
+        league_counts = np.bincount(columns['league_code'], minlength=len(matches_data.leagues))
+        league_distribution = {league: int(count)
+                               for league, count in zip(matches_data.leagues, league_counts) if count > 0}
         
         # 进球统计
-        total_goals = sum(match.home_goals + match.away_goals for match in matches_data)
+        total_goals = int(columns['home_goals'].sum() + columns['away_goals'].sum())
         avg_goals_per_match = round(total_goals / total_matches, 2) if total_matches > 0 else 0
         
         return jsonify({
@@ -294,6 +384,8 @@ def get_system_stats():
                 'total_goals': total_goals,
                 'avg_goals_per_match': avg_goals_per_match,
                 'system_status': 'running',
+                'team_stats_cache': (prediction_service.predictor.team_stats_cache.info()
+                                     if prediction_service else None),
                 'last_update': datetime.now().isoformat()
             }
         })